@@ -46,7 +46,11 @@ def main(argv: Optional[list[str]] = None) -> None:
     args = parse_args(argv)
     token = resolve_token(args.token)
 
-    config = BotConfig(token=token, drop_pending_updates=not args.keep_updates)
+    config = BotConfig(
+        token=token,
+        drop_pending_updates=not args.keep_updates,
+        redis_url=os.getenv("REDIS_URL"),
+    )
     run_bot_sync(config)
 
 
@@ -5,61 +5,103 @@ from __future__ import annotations
 from aiogram import Bot
 
 import asyncio
-import importlib.util
 import logging
 import os
-from dataclasses import dataclass
+import re
+import time
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
 from datetime import datetime, timedelta
-from typing import Callable, Iterable
-from .greeting import greet_user
-from .users import USERS, User, get_direction_label, get_users_by_direction
+from types import MappingProxyType
+from weakref import WeakValueDictionary
+from typing import Any, Awaitable, Callable, Iterable
+from .caching import BoundedCache
+from .greeting import ACCESS_DENIED_MESSAGE, greet_user
+from .users import (
+    USERS,
+    User,
+    get_direction_label,
+    get_users_by_direction,
+    rebuild_direction_index,
+)
 from .task_logic import should_show_take_button
 from .tasks import (
     Task,
     TaskPriority,
     TaskStatus,
-    TASKS,
     add_pending_confirmation,
     clear_all_personal_due_dates,
     clear_pending_confirmations,
+    count_tasks_by_status,
     create_task,
     delete_task as remove_task,
     get_effective_due_date,
     get_involved_tasks,
     get_participant_status,
+    get_task,
     get_personal_due_date,
+    get_tasks_by_status,
+    get_tasks_page_by_status,
+    get_tasks_revision,
     get_personal_status_for_user,
-    get_task_participants,
     is_user_involved,
     record_task_action,
     recalc_task_status,
-    refresh_all_tasks_statuses,
+    refresh_all_tasks_statuses_if_stale,
     refresh_task_status,
+    refresh_tasks_statuses,
     remove_pending_confirmation,
+    reset_status_before_overdue,
     set_all_participants_status,
     set_participant_status,
     set_personal_due_date,
+    set_task_due_date,
 )
 
+from aiogram import Dispatcher, F
+from aiogram.filters import CommandStart, Command
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import BaseStorage
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.fsm.state import State, StatesGroup
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramBadRequest, TelegramRetryAfter
+
 LOGGER = logging.getLogger(__name__)
 
-# Проверяем наличие зависимости
-if importlib.util.find_spec("aiogram") is None:
-    raise RuntimeError(
-        "Для работы телеграм-бота требуется установить пакет aiogram. "
-        "Добавьте его в окружение командой 'pip install aiogram'."
-    )
 
-from aiogram import Dispatcher, F  # noqa: E402
-from aiogram.filters import CommandStart, Command  # noqa: E402
-from aiogram.types import Message, InlineKeyboardMarkup, InlineKeyboardButton, CallbackQuery  # noqa: E402
-from aiogram.fsm.context import FSMContext  # noqa: E402
-from aiogram.fsm.state import State, StatesGroup  # noqa: E402
-from aiogram.client.default import DefaultBotProperties
-from aiogram.exceptions import TelegramBadRequest
+# Данные коллбэков списка задач: разбираются один раз фильтром aiogram
+class TasksPageCallback(CallbackData, prefix="tasks_page"):
+    """Переход на страницу списка задач."""
+
+    view: str
+    filter_type: str
+    page: int
+
+
+class TaskDetailCallback(CallbackData, prefix="task_detail"):
+    """Открытие карточки задачи из списка или уведомления."""
 
-# Списки проектов и направлений
-PROJECTS = {
+    task_id: int
+    view: str
+    filter_type: str
+    page: int
+
+
+class TaskDeleteCallback(CallbackData, prefix="delete_task"):
+    """Удаление задачи автором."""
+
+    task_id: int
+    view: str
+    filter_type: str
+    page: int
+
+
+# Списки проектов и направлений (только для чтения)
+PROJECTS = MappingProxyType({
     "crmk": "ЦРМК Буколпак",
     "kinoclub": "Киноклуб Кадр",
     "anticafe": "Антикафе Ковёр",
@@ -70,27 +112,55 @@ PROJECTS = {
     "vinyl": "Творческий проект Винил",
     "caps": "Проект Колпачки",
     "quizzes": "Квизы",
-}
+})
 
-DIRECTIONS = {
+DIRECTIONS = MappingProxyType({
     "all": "Все направления",
     "stn": "Социально-творческое направление (СТН)",
     "oan": "Организационно-аналитическое направление (ОАН)",
     "nmsd": "Направление маркетинга, смм, дизайна (НМСД)",
     "noim": "Направление обучения и методологии (НОиМ)",
     "nnia": "Направление набора и адаптации (ННиА)",
-}
+})
+
+# Допустимые идентификаторы для проверки данных коллбэков
+_PROJECT_KEYS = frozenset(PROJECTS)
+_DIRECTION_KEYS = frozenset(DIRECTIONS)
 
 
 # Вспомогательная функция для отображения названия направления
-def direction_title(direction_id: str) -> str:
-    """Возвращает название направления без сокращения в скобках."""
+def _strip_direction_abbreviation(label: str) -> str:
+    """Убирает из названия направления сокращение в скобках."""
 
-    label = get_direction_label(direction_id)
     if "(" in label and ")" in label:
         return label.split("(")[0].strip()
     return label
 
+
+# Готовые названия известных направлений, чтобы не разбирать строки при каждом показе
+_DIRECTION_TITLES = {
+    direction_id: _strip_direction_abbreviation(label)
+    for direction_id, label in DIRECTIONS.items()
+}
+
+
+def direction_title(direction_id: str) -> str:
+    """Возвращает название направления без сокращения в скобках."""
+
+    title = _DIRECTION_TITLES.get(direction_id)
+    if title is not None:
+        return title
+    # Неизвестные значения приходят из данных коллбэков, поэтому их не кешируем
+    return _strip_direction_abbreviation(get_direction_label(direction_id))
+
+
+@lru_cache(maxsize=32)
+def direction_users(direction_id: str) -> tuple[User, ...]:
+    """Возвращает пользователей направления; результат кешируется до сброса справочника."""
+
+    return tuple(get_users_by_direction(direction_id))
+
+
 # Состояния для создания задачи
 class TaskCreation(StatesGroup):
     waiting_for_title = State()
@@ -115,40 +185,149 @@ class BotConfig:
 
     token: str
     drop_pending_updates: bool = True
+    # Параметры пула HTTP-соединений с Bot API
+    connection_limit: int = 100
+    keepalive_timeout: float = 75.0
+    request_timeout: float = 60.0
+    # Адрес Redis для FSM-хранилища; без него состояния хранятся в памяти
+    redis_url: str | None = None
+    # Сколько секунд Redis хранит брошенные состояния и черновики
+    fsm_ttl: int = 3600
+
+
+@lru_cache(maxsize=1)
+def _admin_id() -> int | None:
+    """Читает ID администратора из окружения один раз.
+
+    Значение разбирается при первом обращении, а не при импорте: run_bot.py
+    загружает .env уже после импорта модуля.
+    """
+    try:
+        return int(os.getenv("TELEGRAM_ADMIN_ID", 0)) or None
+    except (ValueError, TypeError):
+        return None
 
 
 def is_admin(user_id: int) -> bool:
     """Проверяет, является ли пользователь администратором."""
-    try:
-        admin_id = int(os.getenv("TELEGRAM_ADMIN_ID", 0))
-        return user_id == admin_id
-    except (ValueError, TypeError):
-        return False
+    admin_id = _admin_id()
+    return admin_id is not None and user_id == admin_id
+
+
+def format_date(value: datetime) -> str:
+    """Форматирует дату как ДД.ММ.ГГГГ без обращения к strftime."""
+
+    return f"{value.day:02d}.{value.month:02d}.{value.year}"
+
+
+def format_datetime(value: datetime) -> str:
+    """Форматирует дату и время как ДД.ММ.ГГГГ ЧЧ:ММ без обращения к strftime."""
+
+    return (
+        f"{value.day:02d}.{value.month:02d}.{value.year} "
+        f"{value.hour:02d}:{value.minute:02d}"
+    )
+
+
+# День, месяц и год через точку или дефис
+_DATE_RE = re.compile(r"(\d{1,2})[.\-](\d{1,2})[.\-](\d{4})", re.ASCII)
 
 
 def parse_date(date_str: str) -> datetime | None:
     """Парсит дату из строки в формате ДД.ММ.ГГГГ или ДД-ММ-ГГГГ."""
+    match = _DATE_RE.fullmatch(date_str.strip())
+    if match is None:
+        return None
+    day, month, year = match.groups()
     try:
-        # Заменяем точки и дефисы на точки для единообразия
-        date_str = date_str.replace('-', '.')
-        return datetime.strptime(date_str, '%d.%m.%Y')
+        return datetime(int(year), int(month), int(day))
     except ValueError:
+        # Несуществующая дата, например 31.02
         return None
 
 
+# Контекст действия: префикс:ID задачи:режим:фильтр:страница
+_ACTION_CONTEXT_RE = re.compile(r"([a-z_]+):(\d+):([^:]*):([^:]*):(\d+)")
+# Контекст действия над участником: префикс:ID задачи:ID участника:режим:фильтр:страница
+_PARTICIPANT_CONTEXT_RE = re.compile(r"([a-z_]+):(\d+):(\d+):([^:]*):([^:]*):(\d+)")
+_DEFAULT_ACTION_CONTEXT = (0, "notify", "all", 1)
+_DEFAULT_PARTICIPANT_CONTEXT = (0, 0, "notify", "all", 1)
+
+
+def extract_action_context(callback_data: str, prefix: str) -> tuple[int, str, str, int]:
+    """Извлекает параметры из данных коллбэка."""
+
+    match = _ACTION_CONTEXT_RE.fullmatch(callback_data)
+    if match is not None:
+        if match[1] != prefix:
+            return _DEFAULT_ACTION_CONTEXT
+        return int(match[2]), match[3], match[4], int(match[5])
+
+    # Старый формат кнопок: префикс_ID
+    task_id_str = callback_data.removeprefix(f"{prefix}_")
+    if task_id_str != callback_data and task_id_str.isdecimal():
+        return int(task_id_str), "notify", "all", 1
+
+    return _DEFAULT_ACTION_CONTEXT
+
+
+def _extract_participant_context(callback_data: str, prefix: str) -> tuple[int, int, str, str, int]:
+    """Разбирает контекст действия, адресованного конкретному участнику."""
+
+    match = _PARTICIPANT_CONTEXT_RE.fullmatch(callback_data)
+    if match is None or match[1] != prefix:
+        return _DEFAULT_PARTICIPANT_CONTEXT
+    return int(match[2]), int(match[3]), match[4], match[5], int(match[6])
+
+
+def extract_confirmation_context(callback_data: str) -> tuple[int, int, str, str, int]:
+    """Получает параметры для подтверждения выполнения."""
+
+    return _extract_participant_context(callback_data, "confirm_completion")
+
+
+def extract_reminder_context(callback_data: str) -> tuple[int, int, str, str, int]:
+    """Получает параметры для напоминания конкретному участнику."""
+
+    return _extract_participant_context(callback_data, "remind_one")
+
+
+# Срок выполнения по умолчанию (в днях) для каждого приоритета
+_PRIORITY_DAYS = {
+    TaskPriority.CRITICAL: 1,
+    TaskPriority.HIGH: 3,
+    TaskPriority.MEDIUM: 10,
+    TaskPriority.LOW: 15,
+}
+
+
+# Приоритет по callback_data кнопок из priority_kb
+_PRIORITY_BY_CALLBACK = MappingProxyType(
+    {f"priority_{priority.name.lower()}": priority for priority in TaskPriority}
+)
+
+
 def calculate_due_date(priority: TaskPriority, created_date: datetime) -> datetime:
     """Рассчитывает дату выполнения на основе приоритета."""
-    priority_days = {
-        TaskPriority.CRITICAL: 1,
-        TaskPriority.HIGH: 3,
-        TaskPriority.MEDIUM: 10,
-        TaskPriority.LOW: 15,
-    }
-    days = priority_days.get(priority, 10)
-    return created_date + timedelta(days=days)
+    return created_date + timedelta(days=_PRIORITY_DAYS.get(priority, 10))
+
+
+def _button(text: str, callback_data: str) -> InlineKeyboardButton:
+    """Создаёт кнопку без pydantic-валидации для часто перестраиваемых клавиатур."""
+
+    # Telegram принимает не больше 64 байт данных коллбэка; проверка снимается при -O
+    assert len(callback_data.encode("utf-8")) <= 64, callback_data
+    return InlineKeyboardButton.model_construct(text=text, callback_data=callback_data)
+
+
+def _markup(rows: list[list[InlineKeyboardButton]]) -> InlineKeyboardMarkup:
+    """Собирает клавиатуру из готовых кнопок без повторной валидации."""
+
+    return InlineKeyboardMarkup.model_construct(inline_keyboard=rows)
 
 
 # Главное меню (Inline кнопки)
+@lru_cache(maxsize=None)
 def main_menu_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -167,6 +346,7 @@ def main_menu_kb():
 
 
 # Меню фильтров для списка задач
+@lru_cache(maxsize=16)
 def tasks_filter_kb(back_to: str = "main"):
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -185,6 +365,19 @@ def tasks_filter_kb(back_to: str = "main"):
     )
 
 
+# Фильтры списка задач: статус и подпись в заголовке
+FILTER_STATUSES = {
+    "active": TaskStatus.ACTIVE,
+    "review": TaskStatus.IN_REVIEW,
+    "completed": TaskStatus.COMPLETED,
+}
+
+FILTER_TEXTS = {
+    "active": "активные",
+    "review": "на проверке",
+    "completed": "завершенные",
+}
+
 # Сопоставления для отображения статусов и приоритетов
 STATUS_ICONS = {
     TaskStatus.NEW: "🆕",
@@ -205,7 +398,76 @@ PRIORITY_ICONS = {
 TASKS_PER_PAGE = 5
 
 
+@dataclass(frozen=True, slots=True)
+class TaskListView:
+    """Отфильтрованный список задач с заранее рассчитанными границами страниц."""
+
+    tasks: list[Task]
+    filter_text: str
+    page_slices: tuple[tuple[int, int], ...]
+
+    @classmethod
+    def build(cls, tasks: list[Task], filter_text: str) -> "TaskListView":
+        """Создаёт представление и размечает страницы один раз."""
+
+        total = len(tasks)
+        page_slices = tuple(
+            (start, min(start + TASKS_PER_PAGE, total))
+            for start in range(0, total, TASKS_PER_PAGE)
+        )
+        return cls(tasks, filter_text, page_slices)
+
+    @property
+    def total(self) -> int:
+        return len(self.tasks)
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, len(self.page_slices))
+
+    def clamp_page(self, page: int) -> int:
+        """Ограничивает номер страницы допустимым диапазоном."""
+
+        return max(1, min(page, self.total_pages))
+
+    def page_tasks(self, page: int) -> list[Task]:
+        """Возвращает задачи страницы (номер должен быть уже ограничен)."""
+
+        if not self.page_slices:
+            return []
+        start, end = self.page_slices[page - 1]
+        return self.tasks[start:end]
+
+
+# Кнопка отмены создания задачи
+@lru_cache(maxsize=None)
+def cancel_creation_kb():
+    return InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text="❌ Отмена", callback_data="cancel_task_creation")]]
+    )
+
+
+# Возврат к вводу названия задачи
+@lru_cache(maxsize=None)
+def back_to_title_kb():
+    return InlineKeyboardMarkup(
+        inline_keyboard=[[InlineKeyboardButton(text="⬅️ Назад", callback_data="back_task_title")]]
+    )
+
+
+# Шаг ввода срока: пропуск или возврат к описанию
+@lru_cache(maxsize=None)
+def due_date_kb():
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="⏭️ Пропустить", callback_data="skip_due_date")],
+            [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_task_description")],
+        ]
+    )
+
+
 # Меню приоритетов
+@lru_cache(maxsize=None)
 def priority_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -229,6 +491,7 @@ def priority_kb():
 
 
 # Меню проектов
+@lru_cache(maxsize=None)
 def projects_kb():
     buttons = []
     row = []
@@ -248,6 +511,7 @@ def projects_kb():
 
 
 # Меню направлений
+@lru_cache(maxsize=None)
 def directions_kb():
     buttons = []
     row = []
@@ -267,27 +531,28 @@ def directions_kb():
 
 
 # Меню выбора пользователей
-def users_kb(users: list[User], selected_users: set[int], action: str, back_to: str):
+def users_kb(users: Iterable[User], selected_users: set[int], action: str, back_to: str):
     buttons = []
     
     for user in users:
         selected = "✅ " if user.user_id in selected_users else ""
         buttons.append([
-            InlineKeyboardButton(
+            _button(
                 text=f"{selected}{user.full_name}",
                 callback_data=f"{action}_{user.user_id}"
             )
         ])
     
     buttons.append([
-        InlineKeyboardButton(text="✅ Готово", callback_data=f"done_{action}"),
-        InlineKeyboardButton(text="⬅️ Назад", callback_data=f"back_{back_to}")
+        _button(text="✅ Готово", callback_data=f"done_{action}"),
+        _button(text="⬅️ Назад", callback_data=f"back_{back_to}")
     ])
     
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _markup(buttons)
 
 
 # Меню приватности
+@lru_cache(maxsize=None)
 def privacy_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -303,37 +568,62 @@ def privacy_kb():
 
 
 # Построение клавиатуры списка задач
-def tasks_list_kb(tasks: list[Task], view: str, filter_type: str, page: int):
-    """Создает клавиатуру со списком задач и пагинацией."""
+def tasks_list_kb(
+    tasks: list[Task],
+    view: str,
+    filter_type: str,
+    page: int,
+    *,
+    total: int | None = None,
+):
+    """Создает клавиатуру со списком задач и пагинацией.
+
+    Если передан ``total``, ``tasks`` уже содержит только задачи текущей страницы.
+    """
 
     buttons: list[list[InlineKeyboardButton]] = []
     start_index = (page - 1) * TASKS_PER_PAGE
-    page_tasks = tasks[start_index:start_index + TASKS_PER_PAGE]
+    if total is None:
+        total = len(tasks)
+        page_tasks = tasks[start_index:start_index + TASKS_PER_PAGE]
+    else:
+        page_tasks = tasks
 
     for idx, task in enumerate(page_tasks, start=start_index + 1):
         buttons.append([
-            InlineKeyboardButton(
+            _button(
                 text=f"{idx}. {task.title}",
-                callback_data=f"task_detail:{task.task_id}:{view}:{filter_type}:{page}",
+                callback_data=TaskDetailCallback(
+                    task_id=task.task_id,
+                    view=view,
+                    filter_type=filter_type,
+                    page=page,
+                ).pack(),
             )
         ])
 
     navigation_row: list[InlineKeyboardButton] = []
     if page > 1:
-        navigation_row.append(InlineKeyboardButton(text="◀️", callback_data=f"tasks_page:{view}:{filter_type}:{page - 1}"))
-    if start_index + len(page_tasks) < len(tasks):
-        navigation_row.append(InlineKeyboardButton(text="▶️", callback_data=f"tasks_page:{view}:{filter_type}:{page + 1}"))
+        navigation_row.append(_button(
+            text="◀️",
+            callback_data=TasksPageCallback(view=view, filter_type=filter_type, page=page - 1).pack(),
+        ))
+    if start_index + len(page_tasks) < total:
+        navigation_row.append(_button(
+            text="▶️",
+            callback_data=TasksPageCallback(view=view, filter_type=filter_type, page=page + 1).pack(),
+        ))
     if navigation_row:
         buttons.append(navigation_row)
 
     buttons.append([
-        InlineKeyboardButton(text="📋 Фильтры", callback_data=f"tasks_filters:{view}"),
+        _button(text="📋 Фильтры", callback_data=f"tasks_filters:{view}"),
     ])
     buttons.append([
-        InlineKeyboardButton(text="🏠 Главная", callback_data="back_main"),
+        _button(text="🏠 Главная", callback_data="back_main"),
     ])
 
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _markup(buttons)
 
 
 def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page: int):
@@ -343,7 +633,7 @@ def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page
     context = f"{task.task_id}:{view}:{filter_type}:{page}"
     is_author = viewer_id == task.author_id
     is_responsible = viewer_id == task.responsible_user_id
-    in_workgroup = viewer_id in task.workgroup
+    in_workgroup = viewer_id in task.workgroup_ids
     is_current_executor = task.current_executor_id == viewer_id
     awaiting_confirmation = task.awaiting_author_confirmation
 
@@ -352,30 +642,30 @@ def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page
     if show_controls:
         if is_current_executor:
             buttons.append([
-                InlineKeyboardButton(text="✅ Завершить", callback_data=f"complete_task:{context}"),
-                InlineKeyboardButton(text="⏸️ Пауза", callback_data=f"pause_task:{context}"),
+                _button(text="✅ Завершить", callback_data=f"complete_task:{context}"),
+                _button(text="⏸️ Пауза", callback_data=f"pause_task:{context}"),
             ])
             buttons.append([
-                InlineKeyboardButton(text="🕒 Отложить", callback_data=f"postpone_task:{context}"),
+                _button(text="🕒 Отложить", callback_data=f"postpone_task:{context}"),
             ])
         else:
             if not is_author and not awaiting_confirmation:
                 buttons.append([
-                    InlineKeyboardButton(text="🔄 Взять в работу", callback_data=f"take_task:{context}"),
+                    _button(text="🔄 Взять в работу", callback_data=f"take_task:{context}"),
                 ])
 
             management_row: list[InlineKeyboardButton] = []
 
             if is_author or is_responsible:
                 management_row.append(
-                    InlineKeyboardButton(text="🕒 Отложить", callback_data=f"postpone_task:{context}")
+                    _button(text="🕒 Отложить", callback_data=f"postpone_task:{context}")
                 )
                 management_row.append(
-                    InlineKeyboardButton(text="⏸️ Пауза", callback_data=f"pause_task:{context}")
+                    _button(text="⏸️ Пауза", callback_data=f"pause_task:{context}")
                 )
             elif in_workgroup:
                 management_row.append(
-                    InlineKeyboardButton(text="🕒 Отложить", callback_data=f"postpone_task:{context}")
+                    _button(text="🕒 Отложить", callback_data=f"postpone_task:{context}")
                 )
 
             if management_row:
@@ -383,18 +673,18 @@ def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page
 
             if is_author and not is_current_executor:
                 buttons.append([
-                    InlineKeyboardButton(text="♻️ Сброс состояния", callback_data=f"reset_task_request:{context}"),
+                    _button(text="♻️ Сброс состояния", callback_data=f"reset_task_request:{context}"),
                 ])
 
         reminder_targets = get_allowed_reminder_targets(task, viewer_id)
         if reminder_targets:
             buttons.append([
-                InlineKeyboardButton(text="🔔 Напомнить всем", callback_data=f"remind_all:{context}"),
+                _button(text="🔔 Напомнить всем", callback_data=f"remind_all:{context}"),
             ])
-            for participant_id in sorted(reminder_targets):
+            for participant_id in reminder_targets:
                 participant_name = get_user_full_name(participant_id)
                 buttons.append([
-                    InlineKeyboardButton(
+                    _button(
                         text=f"🔔 Напомнить: {participant_name}",
                         callback_data=(
                             f"remind_one:{task.task_id}:{participant_id}:{view}:{filter_type}:{page}"
@@ -404,14 +694,14 @@ def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page
 
     if is_author and task.status != TaskStatus.COMPLETED:
         buttons.append([
-            InlineKeyboardButton(text="🏁 Завершить задачу", callback_data=f"complete_task_author:{context}"),
+            _button(text="🏁 Завершить задачу", callback_data=f"complete_task_author:{context}"),
         ])
 
     if is_author and task.pending_confirmations:
         for participant_id in sorted(task.pending_confirmations):
             participant_name = get_user_full_name(participant_id)
             buttons.append([
-                InlineKeyboardButton(
+                _button(
                     text=f"✅ Подтвердить: {participant_name}",
                     callback_data=(
                         f"confirm_completion:{task.task_id}:{participant_id}:{view}:{filter_type}:{page}"
@@ -421,36 +711,89 @@ def task_detail_kb(task: Task, viewer_id: int, view: str, filter_type: str, page
 
     if is_author and (task.status == TaskStatus.COMPLETED or task.awaiting_author_confirmation):
         buttons.append([
-            InlineKeyboardButton(text="🔄 Вернуть в работу", callback_data=f"return_task:{context}"),
+            _button(text="🔄 Вернуть в работу", callback_data=f"return_task:{context}"),
         ])
 
     if is_author:
         buttons.append([
-            InlineKeyboardButton(
+            _button(
                 text="🗑️ Удалить/Отменить задачу",
-                callback_data=f"delete_task:{task.task_id}:{view}:{filter_type}:{page}",
+                callback_data=TaskDeleteCallback(
+                    task_id=task.task_id,
+                    view=view,
+                    filter_type=filter_type,
+                    page=page,
+                ).pack(),
             )
         ])
 
     if view in {"all", "my"}:
         buttons.append([
-            InlineKeyboardButton(text="⬅️ Назад", callback_data=f"tasks_page:{view}:{filter_type}:{page}"),
+            _button(
+                text="⬅️ Назад",
+                callback_data=TasksPageCallback(view=view, filter_type=filter_type, page=page).pack(),
+            ),
         ])
 
     buttons.append([
-        InlineKeyboardButton(text="🏠 Главная", callback_data="back_main"),
+        _button(text="🏠 Главная", callback_data="back_main"),
     ])
 
-    return InlineKeyboardMarkup(inline_keyboard=buttons)
+    return _markup(buttons)
 
 
-def get_user_full_name(user_id: int) -> str:
-    """Возвращает полное имя пользователя или понятную заглушку."""
+# Кеш полных имён: USERS не меняется во время работы бота
+_USER_NAME_CACHE: dict[int, str] = {}
 
+
+def clear_user_name_cache() -> None:
+    """Сбрасывает кеши имён и состава направлений, если справочник пользователей был перезагружен."""
+
+    _USER_NAME_CACHE.clear()
+    rebuild_direction_index()
+    direction_users.cache_clear()
+    _LIST_TEXT_CACHE.clear()
+    _DETAIL_TEXT_CACHE.clear()
+
+
+def lookup_user_name(user_id: int | None) -> str | None:
+    """Возвращает имя известного пользователя или ``None`` за одно обращение.
+
+    Заменяет пару «проверить наличие в USERS, затем взять имя».
+    """
+
+    name = _USER_NAME_CACHE.get(user_id)
+    if name is not None:
+        return name
     user = USERS.get(user_id)
     if user is None:
+        return None
+    name = _USER_NAME_CACHE[user_id] = user.full_name
+    return name
+
+
+def get_user_names(user_ids: Iterable[int]) -> list[str]:
+    """Возвращает имена известных пользователей в исходном порядке за один проход."""
+
+    cache_get = _USER_NAME_CACHE.get
+    names: list[str] = []
+    for user_id in user_ids:
+        name = cache_get(user_id)
+        if name is None:
+            name = lookup_user_name(user_id)
+            if name is None:
+                continue
+        names.append(name)
+    return names
+
+
+def get_user_full_name(user_id: int) -> str:
+    """Возвращает полное имя пользователя или понятную заглушку."""
+
+    name = lookup_user_name(user_id)
+    if name is None:
         return "Неизвестный"
-    return user.full_name
+    return name
 
 
 def detect_user_role(task: Task, user_id: int) -> str:
@@ -460,31 +803,33 @@ def detect_user_role(task: Task, user_id: int) -> str:
         return "responsible"
     if user_id == task.author_id:
         return "author"
-    if user_id in task.workgroup:
+    if user_id in task.workgroup_ids:
         return "workgroup"
     return "viewer"
 
 
-def get_allowed_reminder_targets(task: Task, actor_id: int) -> set[int]:
-    """Возвращает список пользователей, которым можно отправить напоминание."""
+def get_allowed_reminder_targets(task: Task, actor_id: int) -> tuple[int, ...]:
+    """Возвращает отсортированный список пользователей, которым можно отправить напоминание."""
 
     role = detect_user_role(task, actor_id)
-    if role not in {"author", "responsible"}:
-        return set()
-
-    participants = set(get_task_participants(task))
-    participants.discard(actor_id)
+    if role != "author" and role != "responsible":
+        return ()
 
-    if role == "responsible":
-        participants.discard(task.author_id)
+    # Ответственный не напоминает автору, автор — самому себе
+    excluded = {actor_id, task.author_id} if role == "responsible" else {actor_id}
+    participants = task.participant_ids - excluded
 
-    return participants
+    # Сортируем один раз здесь, чтобы клавиатура карточки шла в готовом порядке
+    return tuple(sorted(participants))
 
 
-def _notification_open_keyboard(task: Task) -> InlineKeyboardMarkup:
+# Клавиатуры уведомлений зависят только от идентификаторов, поэтому одна и та же
+# разметка переиспользуется для всех получателей рассылки по задаче
+@lru_cache(maxsize=256)
+def _open_task_keyboard(task_id: int) -> InlineKeyboardMarkup:
     """Создаёт клавиатуру с кнопкой открытия задачи и возвратом на главную."""
 
-    context = f"{task.task_id}:notify:all:1"
+    context = f"{task_id}:notify:all:1"
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
@@ -498,14 +843,11 @@ def _notification_open_keyboard(task: Task) -> InlineKeyboardMarkup:
     )
 
 
-def _notification_review_keyboard(
-    task: Task,
-    performer_id: int,
-    performer_name: str,
-) -> InlineKeyboardMarkup:
+@lru_cache(maxsize=256)
+def _review_task_keyboard(task_id: int, performer_id: int, performer_name: str) -> InlineKeyboardMarkup:
     """Создаёт клавиатуру уведомления с подтверждением выполнения."""
 
-    context = f"{task.task_id}:notify:all:1"
+    context = f"{task_id}:notify:all:1"
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
@@ -518,7 +860,7 @@ def _notification_review_keyboard(
                 InlineKeyboardButton(
                     text=f"✅ Подтвердить выполнение: {performer_name}",
                     callback_data=(
-                        f"confirm_completion:{task.task_id}:{performer_id}:notify:all:1"
+                        f"confirm_completion:{task_id}:{performer_id}:notify:all:1"
                     ),
                 )
             ],
@@ -527,14 +869,98 @@ def _notification_review_keyboard(
     )
 
 
-async def notify_task_participants(
+def _notification_open_keyboard(task: Task) -> InlineKeyboardMarkup:
+    """Возвращает клавиатуру с кнопкой открытия задачи и возвратом на главную."""
+
+    return _open_task_keyboard(task.task_id)
+
+
+def _notification_review_keyboard(
+    task: Task,
+    performer_id: int,
+    performer_name: str,
+) -> InlineKeyboardMarkup:
+    """Возвращает клавиатуру уведомления с подтверждением выполнения."""
+
+    return _review_task_keyboard(task.task_id, performer_id, performer_name)
+
+
+# Ограничение числа одновременных запросов к Bot API при рассылках
+SEND_CONCURRENCY = 25
+_SEND_SEMAPHORE = asyncio.Semaphore(SEND_CONCURRENCY)
+# Bot API принимает от одного бота около 30 сообщений в секунду
+SEND_RATE_LIMIT = 30
+
+
+class _SendRateLimiter:
+    """Ограничивает частоту отправки сообщений по схеме «ведра токенов».
+
+    После простоя пропускает до ``rate`` сообщений сразу, затем равномерно
+    распределяет отправки так, чтобы за секунду уходило не больше ``rate``.
+    """
+
+    __slots__ = ("_interval", "_burst", "_next_slot")
+
+    def __init__(self, rate: int) -> None:
+        self._interval = 1 / rate
+        # Насколько «в прошлое» может уйти очередной слот после простоя
+        self._burst = 1 - self._interval
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        """Дожидается своего слота на отправку."""
+
+        now = time.monotonic()
+        slot = max(self._next_slot, now - self._burst)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_SEND_RATE_LIMITER = _SendRateLimiter(SEND_RATE_LIMIT)
+
+
+async def _send_message_safely(
     bot: Bot,
+    chat_id: int,
+    text: str,
+    reply_markup: InlineKeyboardMarkup | None,
+    error_message: str,
+) -> bool:
+    """Отправляет сообщение, повторяя попытку один раз после ``RetryAfter``."""
+
+    async with _SEND_SEMAPHORE:
+        for attempt in range(2):
+            await _SEND_RATE_LIMITER.acquire()
+            try:
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    reply_markup=reply_markup,
+                )
+                return True
+            except TelegramRetryAfter as error:
+                if attempt:
+                    LOGGER.error(error_message, chat_id, error)
+                    return False
+                await asyncio.sleep(error.retry_after)
+            except Exception as error:
+                LOGGER.error(error_message, chat_id, error)
+                return False
+    return False
+
+
+def build_task_notifications(
     task: Task,
     actor_id: int,
     action_description: str,
     keyboard_builder: Callable[[int], InlineKeyboardMarkup | None] | None = None,
-) -> None:
-    """Отправляет уведомление всем участникам о действии по задаче."""
+) -> list[tuple[int, str, InlineKeyboardMarkup | None]]:
+    """Готовит уведомления участникам о действии по задаче.
+
+    Возвращает пары получателя с текстом и клавиатурой, собранные по
+    состоянию задачи на момент вызова.
+    """
 
     actor_name = get_user_full_name(actor_id)
     notification_text = (
@@ -543,18 +969,20 @@ async def notify_task_participants(
         f"👤 {actor_name} {action_description}"
     )
 
-    recipients = set(get_task_participants(task))
-    recipients.discard(actor_id)
+    recipients = task.participant_ids - {actor_id}
 
-    workgroup_participants = set(task.workgroup)
+    workgroup_participants = task.workgroup_ids
     actor_in_workgroup = actor_id in workgroup_participants
+    # Автор и ответственный получают уведомления всегда
+    key_recipients = (task.author_id, task.responsible_user_id)
 
+    notifications = []
     for recipient_id in recipients:
         if (
             actor_in_workgroup
             and recipient_id != actor_id
             and recipient_id in workgroup_participants
-            and recipient_id not in {task.author_id, task.responsible_user_id}
+            and recipient_id not in key_recipients
         ):
             # Если действие выполняет участник рабочей группы, не уведомляем остальных
             # членов этой группы, кроме автора и ответственного.
@@ -565,18 +993,43 @@ async def notify_task_participants(
         reply_markup = None
         if keyboard_builder is not None:
             reply_markup = keyboard_builder(recipient_id)
-        try:
-            await bot.send_message(
-                chat_id=recipient_id,
-                text=notification_text,
-                reply_markup=reply_markup,
-            )
-        except Exception as error:
-            LOGGER.error(
-                "Не удалось отправить уведомление пользователю %s: %s",
+        notifications.append((recipient_id, notification_text, reply_markup))
+
+    return notifications
+
+
+async def send_task_notifications(
+    bot: Bot,
+    notifications: list[tuple[int, str, InlineKeyboardMarkup | None]],
+) -> None:
+    """Рассылает подготовленные уведомления по задаче."""
+
+    await asyncio.gather(
+        *(
+            _send_message_safely(
+                bot,
                 recipient_id,
-                error,
+                text,
+                reply_markup,
+                "Не удалось отправить уведомление пользователю %s: %s",
             )
+            for recipient_id, text, reply_markup in notifications
+        ),
+        return_exceptions=True,
+    )
+
+
+async def notify_task_participants(
+    bot: Bot,
+    task: Task,
+    actor_id: int,
+    action_description: str,
+    keyboard_builder: Callable[[int], InlineKeyboardMarkup | None] | None = None,
+) -> None:
+    """Отправляет уведомление всем участникам о действии по задаче."""
+
+    notifications = build_task_notifications(task, actor_id, action_description, keyboard_builder)
+    await send_task_notifications(bot, notifications)
 
 
 def _build_take_notification_keyboard(
@@ -588,7 +1041,7 @@ def _build_take_notification_keyboard(
 
     if recipient_id == actor_id:
         return None
-    if recipient_id not in {task.author_id, task.responsible_user_id}:
+    if recipient_id != task.author_id and recipient_id != task.responsible_user_id:
         return None
     return _notification_open_keyboard(task)
 
@@ -602,7 +1055,7 @@ def _build_review_notification_keyboard(
 
     if recipient_id == performer_id:
         return None
-    if recipient_id not in {task.author_id, task.responsible_user_id}:
+    if recipient_id != task.author_id and recipient_id != task.responsible_user_id:
         return None
     if recipient_id == task.responsible_user_id:
         performer_name = get_user_full_name(performer_id)
@@ -664,14 +1117,12 @@ async def send_task_reminder(
 
     refresh_task_status(task)
     actor_name = get_user_full_name(actor_id)
-    for recipient_id in recipients:
-        user = USERS.get(recipient_id)
-        if user is None:
-            continue
+
+    async def remind(recipient_id: int) -> None:
         try:
             recipient_due_date = get_effective_due_date(task, recipient_id)
             due_date_text = (
-                recipient_due_date.strftime('%d.%m.%Y')
+                format_date(recipient_due_date)
                 if recipient_due_date
                 else "Не указан"
             )
@@ -687,17 +1138,64 @@ async def send_task_reminder(
                 "Пожалуйста, уделите внимание выполнению задачи."
             )
             reminder_keyboard = build_reminder_keyboard(task, recipient_id)
-            await bot.send_message(
-                chat_id=recipient_id,
-                text=reminder_text,
-                reply_markup=reminder_keyboard,
-            )
         except Exception as error:
             LOGGER.error(
                 "Не удалось отправить напоминание пользователю %s: %s",
                 recipient_id,
                 error,
             )
+            return
+        await _send_message_safely(
+            bot,
+            recipient_id,
+            reminder_text,
+            reminder_keyboard,
+            "Не удалось отправить напоминание пользователю %s: %s",
+        )
+
+    await asyncio.gather(
+        *(remind(recipient_id) for recipient_id in recipients if recipient_id in USERS),
+        return_exceptions=True,
+    )
+
+
+# Кеши готовых текстов списков и карточек задач; ключ включает версии задач
+_LIST_TEXT_CACHE: BoundedCache[tuple, str] = BoundedCache(256)
+_DETAIL_TEXT_CACHE: BoundedCache[tuple, str] = BoundedCache(4096)
+
+# Шаблоны строки задачи в списке: номер, иконки, название, ответственный, срок
+_TASK_ROW_TEMPLATE = "%d. %s %s %s<b>%s</b>\n   👤 %s\n   📅 %s"
+_TASK_ROW_EXECUTOR_TEMPLATE = "\n   👷 Исполнитель: %s"
+
+
+def _task_list_entry(idx: int, task: Task, viewer_id: int | None) -> str:
+    """Формирует блок одной задачи для списка."""
+
+    personal_status = get_personal_status_for_user(task, viewer_id)
+    status_icon = STATUS_ICONS.get(personal_status, "❓")
+    priority_icon = PRIORITY_ICONS.get(task.priority, "⚪")
+    overdue_icon = "⏰ " if task.status == TaskStatus.OVERDUE else ""
+    responsible_name = get_user_full_name(task.responsible_user_id)
+    viewer_due_date = get_effective_due_date(task, viewer_id)
+    due_date = (
+        format_date(viewer_due_date)
+        if viewer_due_date
+        else "Без срока"
+    )
+
+    entry = _TASK_ROW_TEMPLATE % (
+        idx,
+        status_icon,
+        priority_icon,
+        overdue_icon,
+        task.title,
+        responsible_name,
+        due_date,
+    )
+    executor_name = lookup_user_name(task.current_executor_id)
+    if executor_name is not None:
+        entry += _TASK_ROW_EXECUTOR_TEMPLATE % executor_name
+    return entry
 
 
 def build_tasks_list_text(
@@ -705,77 +1203,125 @@ def build_tasks_list_text(
     filter_text: str,
     page: int,
     viewer_id: int | None = None,
+    *,
+    total: int | None = None,
 ) -> str:
-    """Формирует текстовое представление списка задач с учётом зрителя."""
+    """Формирует текстовое представление списка задач с учётом зрителя.
 
-    total_pages = max(1, (len(tasks) + TASKS_PER_PAGE - 1) // TASKS_PER_PAGE)
-    start_index = (page - 1) * TASKS_PER_PAGE
-    page_tasks = tasks[start_index:start_index + TASKS_PER_PAGE]
+    Если передан ``total``, ``tasks`` уже содержит только задачи текущей страницы.
+    """
 
-    lines: list[str] = [f"📋 <b>{filter_text.capitalize()} задачи</b>"]
-    lines.append("")
+    start_index = (page - 1) * TASKS_PER_PAGE
+    if total is None:
+        total = len(tasks)
+        page_tasks = tasks[start_index:start_index + TASKS_PER_PAGE]
+    else:
+        page_tasks = tasks
+    total_pages = max(1, (total + TASKS_PER_PAGE - 1) // TASKS_PER_PAGE)
+
+    refresh_tasks_statuses(page_tasks)
+    cache_key = (
+        filter_text,
+        page,
+        total_pages,
+        viewer_id,
+        tuple((task.task_id, task.version) for task in page_tasks),
+    )
+    cached = _LIST_TEXT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
-    for idx, task in enumerate(page_tasks, start=start_index + 1):
-        refresh_task_status(task)
-        personal_status = get_personal_status_for_user(task, viewer_id)
-        status_icon = STATUS_ICONS.get(personal_status, "❓")
-        priority_icon = PRIORITY_ICONS.get(task.priority, "⚪")
-        overdue_icon = "⏰ " if task.status == TaskStatus.OVERDUE else ""
-        responsible_name = get_user_full_name(task.responsible_user_id)
-        viewer_due_date = get_effective_due_date(task, viewer_id)
-        due_date = (
-            viewer_due_date.strftime('%d.%m.%Y')
-            if viewer_due_date
-            else "Без срока"
-        )
-
-        lines.extend([
-            f"{idx}. {status_icon} {priority_icon} {overdue_icon}<b>{task.title}</b>",
-            f"   👤 {responsible_name}",
-            f"   📅 {due_date}",
-        ])
+    blocks = [
+        _task_list_entry(idx, task, viewer_id)
+        for idx, task in enumerate(page_tasks, start=start_index + 1)
+    ]
+    # Заголовок, карточки задач и номер страницы разделяются пустой строкой
+    return _LIST_TEXT_CACHE.put(cache_key, "\n\n".join([
+        f"📋 <b>{filter_text.capitalize()} задачи</b>",
+        *blocks,
+        f"Страница {page} из {total_pages}",
+    ]))
+
+
+def _participant_status_line(task: Task, participant_id: int) -> str:
+    """Формирует строку со статусом участника для карточки задачи."""
+
+    participant_name = get_user_full_name(participant_id)
+    if participant_id == task.author_id:
+        role_label = "Автор"
+    elif participant_id == task.responsible_user_id:
+        role_label = "Ответственный"
+    else:
+        role_label = "Рабочая группа"
+    if (
+        participant_id == task.author_id
+        and participant_id == task.responsible_user_id
+    ):
+        participant_status = "Ответственный"
+    else:
+        participant_status = get_participant_status(task, participant_id).value
+    marker = ""
+    if participant_id in task.pending_confirmations:
+        marker = " (ожидает подтверждения)"
+    postpone_note = ""
+    if participant_id != task.author_id and participant_id != task.responsible_user_id:
+        personal_due = get_personal_due_date(task, participant_id)
+        if personal_due:
+            postpone_note = (
+                " — Отложил до "
+                f"{format_date(personal_due)}"
+            )
+    return f"   • {participant_name} ({role_label}) — {participant_status}{marker}{postpone_note}"
 
-        if task.current_executor_id and task.current_executor_id in USERS:
-            executor_name = get_user_full_name(task.current_executor_id)
-            lines.append(f"   👷 Исполнитель: {executor_name}")
 
-        lines.append("")
+def build_task_detail_text(task: Task, viewer_id: int | None = None) -> str:
+    """Формирует подробное описание задачи.
 
-    lines.append(f"Страница {page} из {total_pages}")
-    return "\n".join(lines)
+    Текст кешируется по версии задачи: любое изменение задачи меняет ключ.
+    От зрителя карточка зависит только через его статус, срок и то, видит ли
+    он статусы участников, поэтому зрители с одинаковыми значениями получают
+    один и тот же текст.
+    """
 
+    refresh_task_status(task)
+    show_participants = viewer_id is not None and (
+        viewer_id == task.author_id or viewer_id == task.responsible_user_id
+    )
+    personal_status = get_personal_status_for_user(task, viewer_id)
+    viewer_due_date = get_effective_due_date(task, viewer_id)
+    cache_key = (task.task_id, task.version, show_participants, personal_status, viewer_due_date)
+    cached = _DETAIL_TEXT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    return _DETAIL_TEXT_CACHE.put(
+        cache_key,
+        _render_task_detail_text(task, show_participants, personal_status, viewer_due_date),
+    )
 
-def build_task_detail_text(task: Task, viewer_id: int | None = None) -> str:
-    """Формирует подробное описание задачи."""
 
-    refresh_task_status(task)
-    viewer_role = "viewer"
-    if viewer_id is not None:
-        viewer_role = detect_user_role(task, viewer_id)
+def _render_task_detail_text(
+    task: Task,
+    show_participants: bool,
+    personal_status: TaskStatus,
+    viewer_due_date: datetime | None,
+) -> str:
+    """Собирает текст карточки задачи без обращения к кешу."""
 
     responsible_name = get_user_full_name(task.responsible_user_id)
     author_name = get_user_full_name(task.author_id)
-    viewer_due_date = get_effective_due_date(task, viewer_id)
     due_date = (
-        viewer_due_date.strftime('%d.%m.%Y') if viewer_due_date else "Не указан"
+        format_date(viewer_due_date) if viewer_due_date else "Не указан"
     )
-    created = task.created_date.strftime('%d.%m.%Y')
-    workgroup_names = [
-        get_user_full_name(user_id)
-        for user_id in task.workgroup
-        if user_id in USERS
-    ]
+    created = format_date(task.created_date)
+    workgroup_names = get_user_names(task.workgroup)
     workgroup_text = ", ".join(workgroup_names) if workgroup_names else "Не указана"
     description = task.description or "Не указано"
     project_name = PROJECTS.get(task.project, "Не указан")
     direction_name = get_direction_label(task.direction) if task.direction else "Не указано"
-    personal_status = get_personal_status_for_user(task, viewer_id)
     status_icon = STATUS_ICONS.get(personal_status, "❓")
     overdue_icon = "⏰ " if task.status == TaskStatus.OVERDUE else ""
     priority_icon = PRIORITY_ICONS.get(task.priority, "⚪")
-    executor_name = None
-    if task.current_executor_id and task.current_executor_id in USERS:
-        executor_name = get_user_full_name(task.current_executor_id)
+    executor_name = lookup_user_name(task.current_executor_id)
 
     lines = [
         f"📝 <b>{task.title}</b>",
@@ -795,45 +1341,15 @@ def build_task_detail_text(task: Task, viewer_id: int | None = None) -> str:
     if executor_name:
         lines.append(f"👷 Исполнитель: {executor_name}")
 
-    if viewer_role in {"author", "responsible"}:
-        participant_lines: list[str] = []
-        for participant_id in sorted(get_task_participants(task)):
-            if (
+    if show_participants:
+        participant_lines = [
+            _participant_status_line(task, participant_id)
+            for participant_id in sorted(task.participant_ids)
+            if not (
                 participant_id == task.author_id
                 and participant_id != task.responsible_user_id
-            ):
-                continue
-
-            participant_name = get_user_full_name(participant_id)
-            if participant_id == task.author_id:
-                role_label = "Автор"
-            elif participant_id == task.responsible_user_id:
-                role_label = "Ответственный"
-            else:
-                role_label = "Рабочая группа"
-            participant_status_enum = get_participant_status(task, participant_id)
-            if (
-                participant_id == task.author_id
-                and participant_id == task.responsible_user_id
-            ):
-                participant_status = "Ответственный"
-            else:
-                participant_status = participant_status_enum.value
-            marker = ""
-            if participant_id in task.pending_confirmations:
-                marker = " (ожидает подтверждения)"
-            postpone_note = ""
-            if participant_id not in {task.author_id, task.responsible_user_id}:
-                personal_due = get_personal_due_date(task, participant_id)
-                if personal_due:
-                    postpone_note = (
-                        " — Отложил до "
-                        f"{personal_due.strftime('%d.%m.%Y')}"
-                    )
-            participant_lines.append(
-                f"   • {participant_name} ({role_label}) — {participant_status}{marker}{postpone_note}"
             )
-
+        ]
         if participant_lines:
             lines.append("👥 Статусы участников:")
             lines.extend(participant_lines)
@@ -848,13 +1364,13 @@ def build_task_detail_text(task: Task, viewer_id: int | None = None) -> str:
     if task.last_action and task.last_actor_id:
         actor_name = get_user_full_name(task.last_actor_id)
         if task.last_action_time:
-            action_time = task.last_action_time.strftime('%d.%m.%Y %H:%M')
+            action_time = format_datetime(task.last_action_time)
             lines.append(f"📌 Последнее действие: {task.last_action} — {actor_name} ({action_time})")
         else:
             lines.append(f"📌 Последнее действие: {task.last_action} — {actor_name}")
 
     if task.completed_date:
-        lines.append(f"🏁 Завершена: {task.completed_date.strftime('%d.%m.%Y')}")
+        lines.append(f"🏁 Завершена: {format_date(task.completed_date)}")
 
     return "\n".join(lines)
 
@@ -890,6 +1406,7 @@ def task_actions_kb(task: Task, viewer_id: int | None = None) -> InlineKeyboardM
 
 
 # Меню помощи
+@lru_cache(maxsize=None)
 def help_menu_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -905,6 +1422,7 @@ def help_menu_kb():
 
 
 # Меню помощи по задачам
+@lru_cache(maxsize=None)
 def help_tasks_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -920,6 +1438,7 @@ def help_tasks_kb():
 
 
 # Меню помощи по статусам
+@lru_cache(maxsize=None)
 def help_statuses_kb():
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -934,7 +1453,35 @@ def help_statuses_kb():
     )
 
 
+# Клавиатура пустого списка задач: зависит только от режима просмотра
+@lru_cache(maxsize=8)
+def empty_tasks_kb(view: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [InlineKeyboardButton(text="📋 Фильтры", callback_data=f"tasks_filters:{view}")],
+            [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
+        ]
+    )
+
+
+# Возврат из запроса нового срока к карточке задачи
+@lru_cache(maxsize=256)
+def task_detail_back_kb(task_id: int, view: str, filter_type: str, page: int) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="⬅️ Назад",
+                    callback_data=f"back_task_detail:{task_id}:{view}:{filter_type}:{page}",
+                )
+            ],
+            [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
+        ]
+    )
+
+
 # Кнопка назад для вложенных меню
+@lru_cache(maxsize=16)
 def back_button_kb(back_to: str):
     return InlineKeyboardMarkup(
         inline_keyboard=[
@@ -945,138 +1492,319 @@ def back_button_kb(back_to: str):
     )
 
 
+_help_fallback_kb = partial(back_button_kb, "help")
+
+# Действия, которые меняют задачу; по одной задаче выполняются строго по одному
+TASK_MUTATING_ACTIONS = frozenset({
+    "take_task",
+    "pause_task",
+    "complete_task",
+    "reset_task_confirm",
+    "complete_task_author",
+    "confirm_completion",
+    "return_task",
+})
+
+# Обработчик кнопки «Назад»: перерисовывает сообщение для цели возврата
+BackHandler = Callable[[CallbackQuery, FSMContext, int], Awaitable[None]]
+
+# Клавиатуры разделов помощи: раздел -> фабрика клавиатуры
+HELP_SECTION_KEYBOARDS: dict[str, Callable[[], InlineKeyboardMarkup]] = {
+    "help_tasks": help_tasks_kb,
+    "help_statuses": help_statuses_kb,
+    "help_add_tasks": partial(back_button_kb, "help_tasks"),
+    "help_filter": partial(back_button_kb, "help_tasks"),
+    "help_by_status": partial(back_button_kb, "help_statuses"),
+    "help_by_priority": partial(back_button_kb, "help_statuses"),
+}
+
+
 def get_main_message(user_id: int) -> str:
     """Формирует главное сообщение со статистикой."""
     greeting = greet_user(user_id)
 
-    if "Доступ ограничен" in greeting:
+    if greeting is ACCESS_DENIED_MESSAGE:
         return greeting
 
-    refresh_all_tasks_statuses()
+    # get_involved_tasks сам обновляет статусы не чаще раза в STATUS_REFRESH_TTL
     user_tasks = get_involved_tasks(user_id)
-    active_tasks = [task for task in user_tasks if task.status == TaskStatus.ACTIVE]
-    overdue_tasks = [task for task in user_tasks if task.status == TaskStatus.OVERDUE]
-    completed_tasks = [task for task in user_tasks if task.status == TaskStatus.COMPLETED]
-    pending_tasks = [task for task in user_tasks if task.status != TaskStatus.COMPLETED]
-    new_tasks = [
-        task
-        for task in user_tasks
-        if task.status in {TaskStatus.NEW, TaskStatus.PAUSED}
-    ]
+
+    # Считаем задачи по статусам за один проход
+    counts = dict.fromkeys(TaskStatus, 0)
+    for task in user_tasks:
+        counts[task.status] += 1
+    pending_count = len(user_tasks) - counts[TaskStatus.COMPLETED]
 
     stats_text = (
         f"{greeting}\n\n"
         "📊 <b>Краткая статистика:</b>\n"
-        f"📋 Задачи на сегодня: {len(pending_tasks)}\n"
-        f"📈 Всего задач: {len(TASKS)}\n"
-        f"⏰ Просрочено: {len(overdue_tasks)}\n"
-        f"🔄 В работе: {len(active_tasks)}\n"
-        f"✅ Завершено: {len(completed_tasks)}\n"
-        f"🆕 Новых задач: {len(new_tasks)}"
+        f"📋 Задачи на сегодня: {pending_count}\n"
+        f"📈 Всего задач: {count_tasks_by_status()}\n"
+        f"⏰ Просрочено: {counts[TaskStatus.OVERDUE]}\n"
+        f"🔄 В работе: {counts[TaskStatus.ACTIVE]}\n"
+        f"✅ Завершено: {counts[TaskStatus.COMPLETED]}\n"
+        f"🆕 Новых задач: {counts[TaskStatus.NEW] + counts[TaskStatus.PAUSED]}"
     )
     return stats_text
 
 
+def get_user_role(user_id: int) -> str:
+    """Возвращает роль пользователя, от которой зависят тексты помощи."""
+
+    return "admin" if is_admin(user_id) else "user"
+
+
+# Помощь для администратора
+_ADMIN_HELP = (
+    "🤖 <b>Помощь для администратора</b>\n\n"
+    "📋 <b>Основные функции:</b>\n"
+    "• Просмотр всех задач системы\n"
+    "• Управление задачами пользователей\n"
+    "• Добавление и редактирование задач\n\n"
+
+    "⚙️ <b>Админские команды:</b>\n"
+    "• /stats - Статистика системы\n"
+    "• /users - Список пользователей\n" 
+    "• /broadcast - Рассылка сообщений\n"
+    "• /logs - Просмотр логов\n"
+    "• /restart - Перезапуск бота\n"
+    "• /backup - Резервное копирование\n\n"
+
+    "👥 <b>Управление доступом:</b>\n"
+    "• Доступ ко всем задачам системы\n"
+    "• Возможность назначать задачи\n"
+    "• Просмотр статистики всех пользователей"
+)
+
+# Помощь для обычного пользователя
+_USER_HELP = (
+    "🤖 <b>Помощь по боту задач</b>\n\n"
+    "Выберите раздел помощи в меню ниже:"
+)
+
+HELP_TEXTS_BY_ROLE = MappingProxyType({"admin": _ADMIN_HELP, "user": _USER_HELP})
+
+
 def get_help_text(user_id: int) -> str:
     """Формирует текст помощи в зависимости от роли пользователя."""
-    
-    if is_admin(user_id):
-        # Помощь для администратора
-        return (
-            "🤖 <b>Помощь для администратора</b>\n\n"
-            "📋 <b>Основные функции:</b>\n"
-            "• Просмотр всех задач системы\n"
-            "• Управление задачами пользователей\n"
-            "• Добавление и редактирование задач\n\n"
-            
-            "⚙️ <b>Админские команды:</b>\n"
-            "• /stats - Статистика системы\n"
-            "• /users - Список пользователей\n" 
-            "• /broadcast - Рассылка сообщений\n"
-            "• /logs - Просмотр логов\n"
-            "• /restart - Перезапуск бота\n"
-            "• /backup - Резервное копирование\n\n"
-            
-            "👥 <b>Управление доступом:</b>\n"
-            "• Доступ ко всем задачам системы\n"
-            "• Возможность назначать задачи\n"
-            "• Просмотр статистики всех пользователей"
-        )
-    else:
-        # Помощь для обычного пользователя
-        return (
-            "🤖 <b>Помощь по боту задач</b>\n\n"
-            "Выберите раздел помощи в меню ниже:"
-        )
+
+    return HELP_TEXTS_BY_ROLE[get_user_role(user_id)]
+
+
+# Тексты разделов помощи не зависят от пользователя и собираются один раз
+HELP_SECTION_TEXTS = MappingProxyType({
+    "help_tasks": (
+        "📋 <b>Помощь по задачам</b>\n\n"
+        "Выберите подраздел:"
+    ),
+    "help_add_tasks": (
+        "➕ <b>Добавление задач - как правильно добавлять задачи</b>\n\n"
+        "• Используйте кнопку '➕ Добавить задачу' в главном меню\n"
+        "• Укажите название задачи (обязательно)\n"
+        "• Добавьте описание (опционально)\n"
+        "• Установите срок выполнения\n"
+        "• Выберите приоритет и ответственного\n"
+        "• Подтвердите создание задачи"
+    ),
+    "help_filter": (
+        "🔍 <b>Фильтрация задач</b>\n\n"
+        "• <b>Активные</b> - задачи в работе\n"
+        "• <b>Завершенные</b> - выполненные задачи\n"
+        "• <b>Все задачи</b> - полный список\n"
+        "• Используйте фильтры для быстрого поиска"
+    ),
+    "help_statuses": (
+        "🟢 <b>Статусы задач</b>\n\n"
+        "Выберите тип фильтрации:"
+    ),
+    "help_by_status": (
+        "📊 <b>Фильтрация по статусу</b>\n\n"
+        "• <b>Новые</b> - ожидают назначения\n"
+        "• <b>В работе</b> - выполняются\n"
+        "• <b>На паузе</b> - временно приостановлены\n"
+        "• <b>На проверке</b> - ожидают подтверждения автора\n"
+        "• <b>Завершено</b> - выполнены\n"
+        "• <b>Просрочено</b> - не выполнены в срок"
+    ),
+    "help_by_priority": (
+        "⚡ <b>Фильтрация по приоритету</b>\n\n"
+        "• <b>Критический</b> - максимальный приоритет\n"
+        "• <b>Высокий</b> - срочные важные задачи\n"
+        "• <b>Средний</b> - стандартные задачи\n"
+        "• <b>Низкий</b> - задачи без срочности"
+    ),
+})
 
 
 def get_help_section_text(section: str, user_id: int) -> str:
     """Возвращает текст для конкретного раздела помощи."""
-    
-    texts = {
-        "help_tasks": (
-            "📋 <b>Помощь по задачам</b>\n\n"
-            "Выберите подраздел:"
-        ),
-        "help_add_tasks": (
-            "➕ <b>Добавление задач - как правильно добавлять задачи</b>\n\n"
-            "• Используйте кнопку '➕ Добавить задачу' в главном меню\n"
-            "• Укажите название задачи (обязательно)\n"
-            "• Добавьте описание (опционально)\n"
-            "• Установите срок выполнения\n"
-            "• Выберите приоритет и ответственного\n"
-            "• Подтвердите создание задачи"
-        ),
-        "help_filter": (
-            "🔍 <b>Фильтрация задач</b>\n\n"
-            "• <b>Активные</b> - задачи в работе\n"
-            "• <b>Завершенные</b> - выполненные задачи\n"
-            "• <b>Все задачи</b> - полный список\n"
-            "• Используйте фильтры для быстрого поиска"
-        ),
-        "help_statuses": (
-            "🟢 <b>Статусы задач</b>\n\n"
-            "Выберите тип фильтрации:"
-        ),
-        "help_by_status": (
-            "📊 <b>Фильтрация по статусу</b>\n\n"
-            "• <b>Новые</b> - ожидают назначения\n"
-            "• <b>В работе</b> - выполняются\n"
-            "• <b>На паузе</b> - временно приостановлены\n"
-            "• <b>На проверке</b> - ожидают подтверждения автора\n"
-            "• <b>Завершено</b> - выполнены\n"
-            "• <b>Просрочено</b> - не выполнены в срок"
-        ),
-        "help_by_priority": (
-            "⚡ <b>Фильтрация по приоритету</b>\n\n"
-            "• <b>Критический</b> - максимальный приоритет\n"
-            "• <b>Высокий</b> - срочные важные задачи\n"
-            "• <b>Средний</b> - стандартные задачи\n"
-            "• <b>Низкий</b> - задачи без срочности"
-        )
-    }
-    
-    return texts.get(section, "Раздел помощи не найден")
 
+    return HELP_SECTION_TEXTS.get(section, "Раздел помощи не найден")
+
+
+# Ключи черновиков в данных FSM
+TASK_DRAFT_KEY = "task_draft"
+TASK_UPDATE_KEY = "task_update"
+
+_DRAFT_DATETIME_FIELDS = ("created_date", "due_date", "new_due_date")
+_DRAFT_USER_SET_FIELDS = ("responsible_users", "workgroup_users")
 
-def create_dispatcher() -> Dispatcher:
+
+def encode_fsm_draft(draft: dict) -> dict:
+    """Приводит черновик к JSON-совместимому виду для FSM-хранилища.
+
+    Даты сохраняются в ISO-формате, приоритет — именем члена перечисления,
+    множества пользователей — отсортированными списками.
+    """
+
+    encoded = dict(draft)
+    for key in _DRAFT_DATETIME_FIELDS:
+        value = encoded.get(key)
+        if isinstance(value, datetime):
+            encoded[key] = value.isoformat()
+    priority = encoded.get("priority")
+    if isinstance(priority, TaskPriority):
+        encoded["priority"] = priority.name
+    for key in _DRAFT_USER_SET_FIELDS:
+        if key in encoded:
+            encoded[key] = sorted(encoded[key])
+    return encoded
+
+
+def decode_fsm_draft(data: dict) -> dict:
+    """Восстанавливает черновик из данных FSM-хранилища."""
+
+    draft = dict(data)
+    for key in _DRAFT_DATETIME_FIELDS:
+        value = draft.get(key)
+        if isinstance(value, str):
+            draft[key] = datetime.fromisoformat(value)
+    priority = draft.get("priority")
+    if isinstance(priority, str):
+        draft["priority"] = TaskPriority[priority]
+    for key in _DRAFT_USER_SET_FIELDS:
+        if key in draft:
+            draft[key] = set(draft[key])
+    return draft
+
+
+# Признак ещё не пройденного шага мастера (в отличие от осознанно пустого значения)
+_UNSET: Any = object()
+
+
+@dataclass(slots=True)
+class TaskDraft:
+    """Черновик задачи, который собирает мастер создания."""
+
+    author_id: int
+    created_date: datetime = field(default_factory=datetime.now)
+    message_id: int | None = None
+    title: str | None = None
+    # None — описание ещё не вводили, пустая строка — описание пропущено
+    description: str | None = None
+    # _UNSET — шаг срока не пройден, None — срок рассчитается по приоритету
+    due_date: datetime | None = _UNSET
+    priority: TaskPriority | None = None
+    project: str | None = None
+    direction: str | None = None
+    responsible_users: set[int] = field(default_factory=set)
+    workgroup_users: set[int] = field(default_factory=set)
+    is_private: bool | None = None
+
+    def to_fsm(self) -> dict:
+        """Возвращает JSON-совместимое представление для FSM-хранилища."""
+
+        data = {item.name: getattr(self, item.name) for item in fields(self)}
+        if self.due_date is _UNSET:
+            del data["due_date"]
+        return encode_fsm_draft(data)
+
+    @classmethod
+    def from_fsm(cls, data: dict) -> TaskDraft:
+        """Восстанавливает черновик из данных FSM-хранилища.
+
+        Черновик живёт в хранилище до истечения TTL, поэтому ключи, которых
+        нет в текущей версии класса, отбрасываются.
+        """
+
+        known = {item.name for item in fields(cls)}
+        draft = decode_fsm_draft(data)
+        return cls(**{key: value for key, value in draft.items() if key in known})
+
+
+def build_storage(redis_url: str | None = None, ttl: int | None = None) -> BaseStorage:
+    """Создаёт FSM-хранилище: Redis при наличии адреса, иначе в памяти.
+
+    ``ttl`` ограничивает время жизни записей в Redis, чтобы брошенные
+    мастера создания и переноса задач не копились бесконечно.
+    """
+
+    if not redis_url:
+        return MemoryStorage()
+    # Модуль тянет за собой пакет redis, поэтому импортируем его только по запросу
+    from aiogram.fsm.storage.redis import RedisStorage
+
+    return RedisStorage.from_url(redis_url, state_ttl=ttl, data_ttl=ttl)
+
+
+# Сколько сообщений помнить для пропуска повторной отрисовки
+RENDERED_MESSAGES_LIMIT = 10_000
+
+
+def create_dispatcher(storage: BaseStorage | None = None) -> Dispatcher:
     """Создаёт диспетчер aiogram и регистрирует хендлеры."""
 
-    dispatcher = Dispatcher()
+    dispatcher = Dispatcher(storage=storage or MemoryStorage())
+
+    # Черновики создания и изменения задач хранятся в FSM, чтобы их можно было
+    # вынести во внешнее хранилище и они очищались вместе с состоянием
+    async def load_task_draft(state: FSMContext) -> TaskDraft | None:
+        """Возвращает черновик создаваемой задачи или None."""
+
+        draft = (await state.get_data()).get(TASK_DRAFT_KEY)
+        if draft is None:
+            return None
+        try:
+            return TaskDraft.from_fsm(draft)
+        except (KeyError, TypeError, ValueError):
+            # Нечитаемый черновик считаем устаревшим, как и отсутствующий
+            return None
+
+    async def save_task_draft(state: FSMContext, draft: TaskDraft) -> None:
+        """Сохраняет черновик создаваемой задачи."""
+
+        await state.update_data({TASK_DRAFT_KEY: draft.to_fsm()})
 
-    # Хранилище данных для создания задачи
-    task_data = {}
-    task_updates: dict[int, dict] = {}
+    async def load_task_update(state: FSMContext) -> dict | None:
+        """Возвращает данные об изменяемой задаче или None."""
+
+        update = (await state.get_data()).get(TASK_UPDATE_KEY)
+        return decode_fsm_draft(update) if update is not None else None
+
+    async def save_task_update(state: FSMContext, update: dict) -> None:
+        """Сохраняет данные об изменяемой задаче."""
+
+        await state.update_data({TASK_UPDATE_KEY: encode_fsm_draft(update)})
+
+    # Отпечатки последнего отправленного содержимого сообщений: повторная
+    # отрисовка того же текста и клавиатуры не уходит в Bot API
+    rendered_messages: BoundedCache[tuple[int, int], int] = BoundedCache(RENDERED_MESSAGES_LIMIT)
+    # Окончание ограничения частоты (RetryAfter) по чатам
+    chat_flood_until: dict[int, float] = {}
+    # Сообщения, правка которых уже выполняется, и последнее содержимое,
+    # запрошенное для них за это время: промежуточные отрисовки не отправляются
+    pending_edits: dict[tuple[int, int], tuple[str, InlineKeyboardMarkup | None] | None] = {}
 
     async def safe_edit_message(message: Message, text: str, reply_markup: InlineKeyboardMarkup | None = None) -> None:
         """Безопасно редактирует сообщение, игнорируя отсутствие изменений."""
 
-        try:
-            await message.edit_text(text=text, reply_markup=reply_markup)
-        except TelegramBadRequest as error:
-            if "message is not modified" in error.message:
-                return
-            raise
+        await safe_edit_message_by_id(
+            message.bot,
+            chat_id=message.chat.id,
+            message_id=message.message_id,
+            text=text,
+            reply_markup=reply_markup,
+        )
 
     async def safe_edit_message_by_id(
         bot: Bot,
@@ -1085,76 +1813,190 @@ def create_dispatcher() -> Dispatcher:
         text: str,
         reply_markup: InlineKeyboardMarkup | None = None,
     ) -> None:
-        """Редактирует сообщение по идентификатору с защитой от повторного текста."""
+        """Редактирует сообщение по идентификатору с защитой от повторного текста.
 
+        Если правка этого сообщения уже выполняется, новое содержимое
+        запоминается и отправляется после неё, заменяя промежуточные.
+        """
+
+        key = (chat_id, message_id)
+        if key in pending_edits:
+            pending_edits[key] = (text, reply_markup)
+            return
+
+        pending_edits[key] = None
         try:
-            await bot.edit_message_text(
-                chat_id=chat_id,
-                message_id=message_id,
-                text=text,
-                reply_markup=reply_markup,
-            )
-        except TelegramBadRequest as error:
-            if "message is not modified" in error.message:
+            while True:
+                await edit_message_once(bot, key, text, reply_markup)
+                queued = pending_edits[key]
+                if queued is None:
+                    return
+                pending_edits[key] = None
+                text, reply_markup = queued
+        finally:
+            del pending_edits[key]
+
+    async def edit_message_once(
+        bot: Bot,
+        key: tuple[int, int],
+        text: str,
+        reply_markup: InlineKeyboardMarkup | None,
+    ) -> None:
+        """Отправляет одну правку сообщения с учётом ограничения частоты."""
+
+        fingerprint = hash((text, repr(reply_markup)))
+        if rendered_messages.get(key) == fingerprint:
+            return
+
+        chat_id, message_id = key
+        for attempt in range(2):
+            await wait_for_chat_flood(chat_id)
+            if pending_edits.get(key) is not None:
+                # Пока чат был ограничен, пришла более новая отрисовка этого сообщения
                 return
-            raise
+            try:
+                await bot.edit_message_text(
+                    chat_id=chat_id,
+                    message_id=message_id,
+                    text=text,
+                    reply_markup=reply_markup,
+                )
+            except TelegramRetryAfter as error:
+                chat_flood_until[chat_id] = time.monotonic() + error.retry_after
+                if attempt:
+                    LOGGER.warning("Чат %s ограничен по частоте запросов: %s", chat_id, error.message)
+                    return
+                continue
+            except TelegramBadRequest as error:
+                if "message is not modified" not in error.message:
+                    raise
+            rendered_messages.put(key, fingerprint)
+            return
 
-    def build_creation_header(data: dict) -> str:
+    async def wait_for_chat_flood(chat_id: int) -> None:
+        """Дожидается окончания ограничения частоты для чата."""
+
+        delay = chat_flood_until.get(chat_id, 0.0) - time.monotonic()
+        if delay <= 0:
+            chat_flood_until.pop(chat_id, None)
+            return
+        await asyncio.sleep(delay)
+
+    async def delete_user_input(message: Message) -> None:
+        """Удаляет введённое пользователем сообщение, не прерывая шаг при ошибке."""
+
+        try:
+            await message.delete()
+        except TelegramBadRequest as error:
+            LOGGER.warning("Не удалось удалить сообщение %s: %s", message.message_id, error.message)
+
+    # Уведомления участникам отправляются фоновой задачей в порядке постановки,
+    # чтобы ответ на нажатие не ждал рассылки
+    notification_queue: asyncio.Queue[tuple[Any, ...]] = asyncio.Queue()
+    notification_worker: asyncio.Task[None] | None = None
+
+    async def drain_notifications() -> None:
+        """Отправляет уведомления из очереди по одному событию за раз."""
+
+        while True:
+            bot, notifications = await notification_queue.get()
+            try:
+                await send_task_notifications(bot, notifications)
+            except Exception:
+                LOGGER.exception("Не удалось разослать уведомление по задаче")
+            finally:
+                notification_queue.task_done()
+
+    def notify_in_background(
+        bot: Bot,
+        task: Task,
+        actor_id: int,
+        action_description: str,
+        keyboard_builder: Callable[[int], InlineKeyboardMarkup | None] | None = None,
+    ) -> None:
+        """Ставит уведомление участникам в очередь фоновой рассылки."""
+
+        # Текст и клавиатуры собираем сразу: к моменту отправки задача
+        # может измениться следующим действием
+        notifications = build_task_notifications(task, actor_id, action_description, keyboard_builder)
+        enqueue_notifications(bot, notifications)
+
+    def enqueue_notifications(
+        bot: Bot,
+        notifications: list[tuple[int, str, InlineKeyboardMarkup | None]],
+    ) -> None:
+        """Ставит подготовленные уведомления в очередь фоновой рассылки."""
+
+        nonlocal notification_worker
+        if notification_worker is None or notification_worker.done():
+            notification_worker = asyncio.create_task(drain_notifications())
+        notification_queue.put_nowait((bot, notifications))
+
+    @dispatcher.shutdown()
+    async def flush_notifications() -> None:
+        """Досылает накопленные уведомления и останавливает фоновую задачу."""
+
+        if notification_worker is None:
+            return
+        if not notification_worker.done():
+            await notification_queue.join()
+        notification_worker.cancel()
+
+    async def respond(
+        callback: CallbackQuery,
+        text: str,
+        reply_markup: InlineKeyboardMarkup | None = None,
+        answer_text: str | None = None,
+    ) -> None:
+        """Обновляет сообщение коллбэка и отвечает на коллбэк параллельно."""
+
+        # Объект метода от callback.answer() можно ожидать, но gather требует
+        # хешируемых аргументов, а модели методов aiogram не хешируются
+        await asyncio.gather(
+            safe_edit_message(callback.message, text=text, reply_markup=reply_markup),
+            callback.bot.answer_callback_query(callback.id, text=answer_text),
+        )
+
+    def build_creation_header(draft: TaskDraft) -> str:
         """Формирует заголовок с текущими параметрами создаваемой задачи."""
 
         lines: list[str] = ["📝 <b>Создание новой задачи</b>"]
 
-        title = data.get("title")
-        if title:
-            lines.append(f"📌 Название: {title}")
+        if draft.title:
+            lines.append(f"📌 Название: {draft.title}")
 
-        if "description" in data:
-            description = data.get("description") or "Не указано"
+        if draft.description is not None:
+            description = draft.description or "Не указано"
             lines.append(f"📄 Описание: {description}")
 
-        if "due_date" in data:
-            due_date = data.get("due_date")
-            if isinstance(due_date, datetime):
-                lines.append(f"📅 Срок: {due_date.strftime('%d.%m.%Y')}")
+        if draft.due_date is not _UNSET:
+            if isinstance(draft.due_date, datetime):
+                lines.append(f"📅 Срок: {format_date(draft.due_date)}")
             else:
                 lines.append("📅 Срок: Не указан")
 
-        priority = data.get("priority")
-        if priority:
-            lines.append(f"⚡ Приоритет: {priority.value}")
+        if draft.priority:
+            lines.append(f"⚡ Приоритет: {draft.priority.value}")
 
-        project = data.get("project")
-        if project:
-            project_name = PROJECTS.get(project, project)
+        if draft.project:
+            project_name = PROJECTS.get(draft.project, draft.project)
             lines.append(f"🏢 Проект: {project_name}")
 
-        direction = data.get("direction")
-        if direction:
-            lines.append(f"🎯 Направление: {get_direction_label(direction)}")
+        if draft.direction:
+            lines.append(f"🎯 Направление: {get_direction_label(draft.direction)}")
 
-        responsible_users = data.get("responsible_users")
-        if responsible_users:
-            names = [
-                get_user_full_name(user_id)
-                for user_id in responsible_users
-                if user_id in USERS
-            ]
+        if draft.responsible_users:
+            names = get_user_names(draft.responsible_users)
             if names:
                 lines.append(f"👤 Ответственный: {', '.join(names)}")
 
-        workgroup_users = data.get("workgroup_users")
-        if workgroup_users:
-            names = [
-                get_user_full_name(user_id)
-                for user_id in workgroup_users
-                if user_id in USERS
-            ]
+        if draft.workgroup_users:
+            names = get_user_names(draft.workgroup_users)
             if names:
                 lines.append(f"👥 Рабочая группа: {', '.join(names)}")
 
-        if "is_private" in data:
-            is_private = data.get("is_private")
-            privacy_text = "Личная" if is_private else "Общая"
+        if draft.is_private is not None:
+            privacy_text = "Личная" if draft.is_private else "Общая"
             lines.append(f"🔒 Приватность: {privacy_text}")
 
         return "\n".join(lines)
@@ -1166,7 +2008,7 @@ def create_dispatcher() -> Dispatcher:
         user_id = message.from_user.id if message.from_user else 0
         text = get_main_message(user_id)
         
-        if "Доступ ограничен" in text:
+        if text is ACCESS_DENIED_MESSAGE:
             await message.answer(text)
             return
         
@@ -1179,174 +2021,158 @@ def create_dispatcher() -> Dispatcher:
         """Обрабатывает кнопки списка задач."""
         await state.clear()
         user_id = callback.from_user.id
-        text = get_main_message(user_id)
-        
-        if "Доступ ограничен" in text:
+
+        if greet_user(user_id) is ACCESS_DENIED_MESSAGE:
             await callback.answer("Доступ ограничен")
             return
         
         list_type = "всех" if callback.data == "all_tasks" else "ваших"
         new_text = f"📊 Просмотр {list_type} задач. Выберите фильтр:"
         
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=new_text,
             reply_markup=tasks_filter_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data == "add_task")
     async def handle_add_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает кнопку добавления задачи."""
         user_id = callback.from_user.id
-        text = get_main_message(user_id)
 
-        if "Доступ ограничен" in text:
+        if greet_user(user_id) is ACCESS_DENIED_MESSAGE:
             await callback.answer("Доступ ограничен")
             return
         
         # Начинаем процесс создания задачи
         await state.set_state(TaskCreation.waiting_for_title)
-        task_data[user_id] = {
-            'author_id': user_id,
-            'created_date': datetime.now(),
-            'responsible_users': set(),
-            'workgroup_users': set(),
-            'message_id': callback.message.message_id,
-        }
-
-        header = build_creation_header(task_data[user_id])
+        draft = TaskDraft(author_id=user_id, message_id=callback.message.message_id)
+        await save_task_draft(state, draft)
+
+        header = build_creation_header(draft)
         prompt = "Введите название задачи:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[[InlineKeyboardButton(text="❌ Отмена", callback_data="cancel_task_creation")]]
-            ),
+            reply_markup=cancel_creation_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data == "cancel_task_creation")
     async def handle_cancel_task_creation(callback: CallbackQuery, state: FSMContext) -> None:
         """Отменяет создание задачи."""
         await state.clear()
         user_id = callback.from_user.id
-        if user_id in task_data:
-            del task_data[user_id]
-        
+
         text = get_main_message(user_id)
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=text,
             reply_markup=main_menu_kb(),
+            answer_text="Создание задачи отменено",
         )
-        await callback.answer("Создание задачи отменено")
 
     @dispatcher.message(TaskCreation.waiting_for_title)
     async def process_task_title(message: Message, state: FSMContext) -> None:
         """Обрабатывает название задачи."""
-        user_id = message.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await message.answer("Сессия создания задачи устарела. Начните заново.", reply_markup=main_menu_kb())
             await message.delete()
             return
 
-        task_data[user_id]['title'] = message.text.strip()
+        draft.title = message.text.strip()
+        await save_task_draft(state, draft)
         await state.set_state(TaskCreation.waiting_for_description)
 
-        message_id = task_data[user_id].get('message_id')
+        message_id = draft.message_id
         if message_id:
-            header = build_creation_header(task_data[user_id])
+            header = build_creation_header(draft)
             prompt = "📄 Теперь введите описание задачи (или отправьте '-' чтобы пропустить):"
-            await safe_edit_message_by_id(
-                message.bot,
-                chat_id=message.chat.id,
-                message_id=message_id,
-                text=f"{header}\n\n{prompt}",
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[[InlineKeyboardButton(text="⬅️ Назад", callback_data="back_task_title")]]
+            await asyncio.gather(
+                safe_edit_message_by_id(
+                    message.bot,
+                    chat_id=message.chat.id,
+                    message_id=message_id,
+                    text=f"{header}\n\n{prompt}",
+                    reply_markup=back_to_title_kb(),
                 ),
+                delete_user_input(message),
             )
-        await message.delete()
+        else:
+            await message.delete()
 
     @dispatcher.callback_query(F.data == "back_task_title")
     async def handle_back_title(callback: CallbackQuery, state: FSMContext) -> None:
         """Возврат к вводу названия."""
-        user_id = callback.from_user.id
         await state.set_state(TaskCreation.waiting_for_title)
-        
-        task_info = task_data.get(user_id, {})
-        task_info.pop('title', None)
-        header = build_creation_header(task_info)
+
+        draft = await load_task_draft(state) or TaskDraft(author_id=callback.from_user.id)
+        if draft.title is not None:
+            draft.title = None
+            await save_task_draft(state, draft)
+        header = build_creation_header(draft)
         prompt = "Введите название задачи:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[[InlineKeyboardButton(text="❌ Отмена", callback_data="cancel_task_creation")]]
-            ),
+            reply_markup=cancel_creation_kb(),
         )
-        await callback.answer()
 
     @dispatcher.message(TaskCreation.waiting_for_description)
     async def process_task_description(message: Message, state: FSMContext) -> None:
         """Обрабатывает описание задачи."""
-        user_id = message.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await message.answer("Сессия создания задачи устарела. Начните заново.", reply_markup=main_menu_kb())
             await message.delete()
             return
 
         description = message.text.strip() if message.text != '-' else ''
-        task_data[user_id]['description'] = description
+        draft.description = description
+        await save_task_draft(state, draft)
         await state.set_state(TaskCreation.waiting_for_due_date)
 
-        message_id = task_data[user_id].get('message_id')
+        message_id = draft.message_id
         if message_id:
-            header = build_creation_header(task_data[user_id])
+            header = build_creation_header(draft)
             prompt = "📅 Введите дату выполнения в формате ДД.ММ.ГГГГ (или отправьте '-' для автоматического расчета):"
-            await safe_edit_message_by_id(
-                message.bot,
-                chat_id=message.chat.id,
-                message_id=message_id,
-                text=f"{header}\n\n{prompt}",
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[
-                        [InlineKeyboardButton(text="⏭️ Пропустить", callback_data="skip_due_date")],
-                        [InlineKeyboardButton(text="⬅️ Назад", callback_data="back_task_description")],
-                    ]
+            await asyncio.gather(
+                safe_edit_message_by_id(
+                    message.bot,
+                    chat_id=message.chat.id,
+                    message_id=message_id,
+                    text=f"{header}\n\n{prompt}",
+                    reply_markup=due_date_kb(),
                 ),
+                delete_user_input(message),
             )
-        await message.delete()
+        else:
+            await message.delete()
 
     @dispatcher.callback_query(F.data == "back_task_description")
     async def handle_back_description(callback: CallbackQuery, state: FSMContext) -> None:
         """Возврат к вводу описания."""
-        user_id = callback.from_user.id
         await state.set_state(TaskCreation.waiting_for_description)
-        
-        task_info = task_data.get(user_id, {})
-        header = build_creation_header(task_info)
+
+        draft = await load_task_draft(state) or TaskDraft(author_id=callback.from_user.id)
+        header = build_creation_header(draft)
         prompt = "📄 Введите описание задачи (или отправьте '-' чтобы пропустить):"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[[InlineKeyboardButton(text="⬅️ Назад", callback_data="back_task_title")]]
-            ),
+            reply_markup=back_to_title_kb(),
         )
-        await callback.answer()
 
     @dispatcher.message(TaskCreation.waiting_for_due_date)
     async def process_task_due_date(message: Message, state: FSMContext) -> None:
         """Обрабатывает дату выполнения."""
-        user_id = message.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await message.answer("Сессия создания задачи устарела. Начните заново.", reply_markup=main_menu_kb())
             await message.delete()
@@ -1358,56 +2184,61 @@ def create_dispatcher() -> Dispatcher:
                 await message.answer("❌ Неверный формат даты. Используйте ДД.ММ.ГГГГ или ДД-ММ-ГГГГ")
                 await message.delete()
                 return
-            task_data[user_id]['due_date'] = due_date
+            draft.due_date = due_date
         else:
-            task_data[user_id]['due_date'] = None  # Будет рассчитано после выбора приоритета
-        
+            draft.due_date = None  # Будет рассчитано после выбора приоритета
+        await save_task_draft(state, draft)
+
         await state.set_state(TaskCreation.waiting_for_priority)
-        message_id = task_data[user_id].get('message_id')
+        message_id = draft.message_id
         if message_id:
-            header = build_creation_header(task_data[user_id])
+            header = build_creation_header(draft)
             prompt = "⚡ Выберите приоритет задачи:"
-            await safe_edit_message_by_id(
-                message.bot,
-                chat_id=message.chat.id,
-                message_id=message_id,
-                text=f"{header}\n\n{prompt}",
-                reply_markup=priority_kb(),
+            await asyncio.gather(
+                safe_edit_message_by_id(
+                    message.bot,
+                    chat_id=message.chat.id,
+                    message_id=message_id,
+                    text=f"{header}\n\n{prompt}",
+                    reply_markup=priority_kb(),
+                ),
+                delete_user_input(message),
             )
-        await message.delete()
+        else:
+            await message.delete()
 
     @dispatcher.callback_query(F.data == "skip_due_date")
     async def handle_skip_due_date(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает пропуск ввода даты выполнения."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
-            await safe_edit_message(
-                callback.message,
+            await respond(
+                callback,
                 text="Сессия создания задачи устарела. Начните заново.",
                 reply_markup=main_menu_kb(),
             )
-            await callback.answer()
             return
 
-        task_data[user_id]['due_date'] = None
+        draft.due_date = None
+        await save_task_draft(state, draft)
         await state.set_state(TaskCreation.waiting_for_priority)
 
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = "⚡ Выберите приоритет задачи:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=priority_kb(),
+            answer_text="Срок будет рассчитан автоматически",
         )
-        await callback.answer("Срок будет рассчитан автоматически")
 
     @dispatcher.callback_query(F.data.startswith("priority_"))
     async def handle_priority_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор приоритета."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1416,36 +2247,34 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        priority_key = callback.data.replace("priority_", "")
-        try:
-            priority = TaskPriority[priority_key.upper()]
-        except KeyError:
+        priority = _PRIORITY_BY_CALLBACK.get(callback.data)
+        if priority is None:
             await callback.answer("❌ Неизвестный приоритет", show_alert=True)
             return
 
-        task_data[user_id]['priority'] = priority
+        draft.priority = priority
 
         # Если дата не была указана, рассчитываем автоматически
-        if not task_data[user_id].get('due_date'):
-            due_date = calculate_due_date(priority, task_data[user_id]['created_date'])
-            task_data[user_id]['due_date'] = due_date
-        
+        if not isinstance(draft.due_date, datetime):
+            due_date = calculate_due_date(priority, draft.created_date)
+            draft.due_date = due_date
+        await save_task_draft(state, draft)
+
         await state.set_state(TaskCreation.waiting_for_project)
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = "🏢 Выберите проект:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=projects_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("project_"))
     async def handle_project_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор проекта."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1454,25 +2283,28 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        project_id = callback.data.replace("project_", "")
-        task_data[user_id]['project'] = project_id
-        
+        project_id = callback.data.removeprefix("project_")
+        if project_id not in _PROJECT_KEYS:
+            await callback.answer("Неизвестный проект", show_alert=True)
+            return
+        draft.project = project_id
+        await save_task_draft(state, draft)
+
         await state.set_state(TaskCreation.waiting_for_direction)
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = "🎯 Выберите направление:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=directions_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("direction_"))
     async def handle_direction_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор направления."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1481,29 +2313,32 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        direction_id = callback.data.replace("direction_", "")
-        task_data[user_id]['direction'] = direction_id
-        
+        direction_id = callback.data.removeprefix("direction_")
+        if direction_id not in _DIRECTION_KEYS:
+            await callback.answer("Неизвестное направление", show_alert=True)
+            return
+        draft.direction = direction_id
+        await save_task_draft(state, draft)
+
         # Получаем пользователей направления для выбора ответственного
         direction_name = direction_title(direction_id)
-        users = get_users_by_direction(direction_id)
+        users = direction_users(direction_id)
         
         await state.set_state(TaskCreation.waiting_for_responsible)
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = f"👤 Выберите ответственного за задачу (направление: {direction_name}):"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=users_kb(users, set(), "responsible", "direction"),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("responsible_"))
     async def handle_responsible_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор ответственного."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1512,37 +2347,37 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        selected_user_id = int(callback.data.replace("responsible_", ""))
-        selected_responsible = task_data[user_id]['responsible_users']
+        selected_user_id = int(callback.data.removeprefix("responsible_"))
+        selected_responsible = draft.responsible_users
         
         if selected_user_id in selected_responsible:
             selected_responsible.remove(selected_user_id)
         else:
             selected_responsible.clear()
             selected_responsible.add(selected_user_id)
-        
-        direction_id = task_data[user_id]['direction']
+        await save_task_draft(state, draft)
+
+        direction_id = draft.direction
         direction_name = direction_title(direction_id)
-        users = get_users_by_direction(direction_id)
+        users = direction_users(direction_id)
         
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = (
             f"👤 Выберите ответственного за задачу (направление: {direction_name}):\n"
             f"✅ Выбрано: {len(selected_responsible)}"
         )
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=users_kb(users, selected_responsible, "responsible", "direction"),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data == "done_responsible")
     async def handle_done_responsible(callback: CallbackQuery, state: FSMContext) -> None:
         """Завершает выбор ответственного."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1551,30 +2386,29 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        if not task_data[user_id]['responsible_users']:
+        if not draft.responsible_users:
             await callback.answer("❌ Нужно выбрать хотя бы одного ответственного!")
             return
         
-        direction_id = task_data[user_id]['direction']
+        direction_id = draft.direction
         direction_name = direction_title(direction_id)
-        users = get_users_by_direction(direction_id)
+        users = direction_users(direction_id)
         
         await state.set_state(TaskCreation.waiting_for_workgroup)
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = "👥 Выберите рабочую группу (можно выбрать несколько):"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
-            reply_markup=users_kb(users, task_data[user_id]['workgroup_users'], "workgroup", "responsible"),
+            reply_markup=users_kb(users, draft.workgroup_users, "workgroup", "responsible"),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("workgroup_"))
     async def handle_workgroup_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор рабочей группы."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1583,35 +2417,35 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        selected_user_id = int(callback.data.replace("workgroup_", ""))
+        selected_user_id = int(callback.data.removeprefix("workgroup_"))
         
-        if selected_user_id in task_data[user_id]['workgroup_users']:
-            task_data[user_id]['workgroup_users'].remove(selected_user_id)
+        if selected_user_id in draft.workgroup_users:
+            draft.workgroup_users.remove(selected_user_id)
         else:
-            task_data[user_id]['workgroup_users'].add(selected_user_id)
-        
-        direction_id = task_data[user_id]['direction']
+            draft.workgroup_users.add(selected_user_id)
+        await save_task_draft(state, draft)
+
+        direction_id = draft.direction
         direction_name = direction_title(direction_id)
-        users = get_users_by_direction(direction_id)
+        users = direction_users(direction_id)
         
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = (
             "👥 Выберите рабочую группу (можно выбрать несколько):\n"
-            f"✅ Выбрано: {len(task_data[user_id]['workgroup_users'])}"
+            f"✅ Выбрано: {len(draft.workgroup_users)}"
         )
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
-            reply_markup=users_kb(users, task_data[user_id]['workgroup_users'], "workgroup", "responsible"),
+            reply_markup=users_kb(users, draft.workgroup_users, "workgroup", "responsible"),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data == "done_workgroup")
     async def handle_done_workgroup(callback: CallbackQuery, state: FSMContext) -> None:
         """Завершает выбор рабочей группы."""
-        user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1621,21 +2455,21 @@ def create_dispatcher() -> Dispatcher:
             return
         
         await state.set_state(TaskCreation.waiting_for_privacy)
-        header = build_creation_header(task_data[user_id])
+        header = build_creation_header(draft)
         prompt = "🔒 Выберите уровень доступа к задаче:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=f"{header}\n\n{prompt}",
             reply_markup=privacy_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("privacy_"))
     async def handle_privacy_selection(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает выбор уровня приватности."""
         user_id = callback.from_user.id
-        if user_id not in task_data:
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
             await safe_edit_message(
                 callback.message,
@@ -1644,25 +2478,24 @@ def create_dispatcher() -> Dispatcher:
             )
             return
         
-        privacy = callback.data.replace("privacy_", "")
-        task_data[user_id]['is_private'] = (privacy == 'private')
+        privacy = callback.data.removeprefix("privacy_")
+        draft.is_private = (privacy == 'private')
         
         # Создаем задачу
-        task_info = task_data[user_id]
         try:
-            responsible_user_id = next(iter(task_info['responsible_users']))
-            workgroup_users = list(task_info['workgroup_users'])
+            responsible_user_id = next(iter(draft.responsible_users))
+            workgroup_users = list(draft.workgroup_users)
             task = create_task(
-                title=task_info['title'],
-                description=task_info['description'],
+                title=draft.title,
+                description=draft.description,
                 author_id=user_id,
-                priority=task_info['priority'],
-                due_date=task_info['due_date'],
-                project=task_info['project'],
-                direction=task_info['direction'],
+                priority=draft.priority,
+                due_date=draft.due_date,
+                project=draft.project,
+                direction=draft.direction,
                 responsible_user_id=responsible_user_id,
                 workgroup=workgroup_users,
-                is_private=task_info['is_private']
+                is_private=draft.is_private
             )
             record_task_action(task, user_id, "Создал задачу")
 
@@ -1673,31 +2506,29 @@ def create_dispatcher() -> Dispatcher:
 
             responsible_name = get_user_full_name(responsible_user_id)
 
-            for notified_user_id in all_notified_users:
-                user = USERS.get(notified_user_id)
-                if user is None:
-                    continue
-                try:
-                    await bot.send_message(
-                        chat_id=notified_user_id,
-                        text=(
-                            "🔔 <b>Новая задача назначена!</b>\n\n"
-                            f"📝 <b>{task.title}</b>\n"
-                            f"👤 Ответственный: {responsible_name}\n"
-                            f"📅 Срок: {task.due_date.strftime('%d.%m.%Y') if task.due_date else 'Не указан'}\n"
-                            f"⚡ Приоритет: {task.priority.value}"
-                        ),
-                        reply_markup=task_actions_kb(task, notified_user_id)
-                    )
-                except Exception as e:
-                    LOGGER.error(f"Ошибка отправки уведомления пользователю {notified_user_id}: {e}")
+            notification_text = (
+                "🔔 <b>Новая задача назначена!</b>\n\n"
+                f"📝 <b>{task.title}</b>\n"
+                f"👤 Ответственный: {responsible_name}\n"
+                f"📅 Срок: {format_date(task.due_date) if task.due_date else 'Не указан'}\n"
+                f"⚡ Приоритет: {task.priority.value}"
+            )
+            # Рассылка идёт через общую очередь, чтобы автор не ждал отправок
+            enqueue_notifications(
+                bot,
+                [
+                    (notified_user_id, notification_text, task_actions_kb(task, notified_user_id))
+                    for notified_user_id in all_notified_users
+                    if notified_user_id in USERS
+                ],
+            )
 
             # Сообщение автору
             success_text = (
                 "✅ <b>Задача успешно создана!</b>\n\n"
                 f"📝 <b>{task.title}</b>\n"
                 f"📄 Описание: {task.description or 'Не указано'}\n"
-                f"📅 Срок: {task.due_date.strftime('%d.%m.%Y') if task.due_date else 'Не указан'}\n"
+                f"📅 Срок: {format_date(task.due_date) if task.due_date else 'Не указан'}\n"
                 f"⚡ Приоритет: {task.priority.value}\n"
                 f"🏢 Проект: {PROJECTS[task.project]}\n"
                 f"🎯 Направление: {get_direction_label(task.direction)}\n"
@@ -1711,9 +2542,8 @@ def create_dispatcher() -> Dispatcher:
 
 
             # Очищаем данные
-            del task_data[user_id]
             await state.clear()
-            
+
         except Exception as e:
             LOGGER.error(f"Ошибка создания задачи: {e}")
             error_text = (
@@ -1726,374 +2556,333 @@ def create_dispatcher() -> Dispatcher:
                 text=error_text,
                 reply_markup=main_menu_kb(),
             )
-            if user_id in task_data:
-                del task_data[user_id]
             await state.clear()
         
         await callback.answer()
 
-    # Обработчики кнопок "Назад"
-    @dispatcher.callback_query(F.data.startswith("back_"))
-    async def handle_back_buttons(callback: CallbackQuery, state: FSMContext) -> None:
-        """Обрабатывает все кнопки возврата."""
-        back_to = callback.data.replace("back_", "")
-        user_id = callback.from_user.id
-        
-        if back_to == "main":
+    # Обработчики кнопок "Назад": цель возврата -> функция перерисовки
+    async def back_to_main(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        await state.clear()
+        await respond(
+            callback,
+            text=get_main_message(user_id),
+            reply_markup=main_menu_kb(),
+        )
+
+    async def back_to_help(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        await respond(
+            callback,
+            text=get_help_text(user_id),
+            reply_markup=help_menu_kb(),
+        )
+
+    def back_to_help_section(section: str) -> BackHandler:
+        """Создаёт обработчик возврата в раздел помощи."""
+
+        async def handler(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+            await respond(
+                callback,
+                text=get_help_section_text(section, user_id),
+                reply_markup=HELP_SECTION_KEYBOARDS[section](),
+            )
+
+        return handler
+
+    async def back_to_task_creation(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        # Возврат к началу создания задачи
+        draft = TaskDraft(author_id=user_id, message_id=callback.message.message_id)
+        await save_task_draft(state, draft)
+        await state.set_state(TaskCreation.waiting_for_title)
+        header = build_creation_header(draft)
+        prompt = "Введите название задачи:"
+        await respond(
+            callback,
+            text=f"{header}\n\n{prompt}",
+            reply_markup=cancel_creation_kb(),
+        )
+
+    async def load_draft_for_back(callback: CallbackQuery, state: FSMContext) -> TaskDraft | None:
+        """Возвращает черновик для шагов мастера или сообщает об устаревшей сессии."""
+
+        draft = await load_task_draft(state)
+        if draft is None:
             await state.clear()
-            task_updates.pop(user_id, None)
-            text = get_main_message(user_id)
             await safe_edit_message(
                 callback.message,
-                text=text,
+                text="Сессия создания задачи устарела. Начните заново.",
                 reply_markup=main_menu_kb(),
             )
+            await callback.answer("Сессия создания задачи устарела", show_alert=True)
+        return draft
 
-        elif back_to == "help":
-            await safe_edit_message(
-                callback.message,
-                text=get_help_text(user_id),
-                reply_markup=help_menu_kb(),
-            )
+    async def back_to_direction(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        draft = await load_draft_for_back(callback, state)
+        if draft is None:
+            return
 
-        elif back_to == "help_tasks":
-            await safe_edit_message(
-                callback.message,
-                text=get_help_section_text("help_tasks", user_id),
-                reply_markup=help_tasks_kb(),
-            )
+        draft.direction = None
+        draft.responsible_users.clear()
+        draft.workgroup_users.clear()
+        await save_task_draft(state, draft)
 
-        elif back_to == "help_statuses":
-            await safe_edit_message(
-                callback.message,
-                text=get_help_section_text("help_statuses", user_id),
-                reply_markup=help_statuses_kb(),
-            )
+        await state.set_state(TaskCreation.waiting_for_direction)
+        header = build_creation_header(draft)
+        prompt = "🎯 Выберите направление:"
+        await respond(
+            callback,
+            text=f"{header}\n\n{prompt}",
+            reply_markup=directions_kb(),
+        )
 
-        elif back_to == "task_creation":
-            # Возврат к началу создания задачи
-            task_data[user_id] = {
-                'author_id': user_id,
-                'created_date': datetime.now(),
-                'responsible_users': set(),
-                'workgroup_users': set(),
-                'message_id': callback.message.message_id,
-            }
-            await state.set_state(TaskCreation.waiting_for_title)
-            header = build_creation_header(task_data[user_id])
-            prompt = "Введите название задачи:"
-            await safe_edit_message(
-                callback.message,
-                text=f"{header}\n\n{prompt}",
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[[InlineKeyboardButton(text="❌ Отмена", callback_data="cancel_task_creation")]]
-                ),
-            )
+    async def back_to_responsible(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        draft = await load_draft_for_back(callback, state)
+        if draft is None:
+            return
 
-        elif back_to in {"direction", "responsible", "workgroup"}:
-            task_info = task_data.get(user_id)
-            if not task_info:
-                await state.clear()
-                await safe_edit_message(
-                    callback.message,
-                    text="Сессия создания задачи устарела. Начните заново.",
-                    reply_markup=main_menu_kb(),
-                )
-                await callback.answer("Сессия создания задачи устарела", show_alert=True)
-                return
+        direction_id = draft.direction
+        if not direction_id:
+            await callback.answer("Сначала выберите направление", show_alert=True)
+            return
 
-            if back_to == "direction":
-                task_info.pop('direction', None)
-                responsible = task_info.get('responsible_users')
-                if isinstance(responsible, set):
-                    responsible.clear()
-                else:
-                    task_info['responsible_users'] = set()
-                workgroup = task_info.get('workgroup_users')
-                if isinstance(workgroup, set):
-                    workgroup.clear()
-                else:
-                    task_info['workgroup_users'] = set()
-
-                await state.set_state(TaskCreation.waiting_for_direction)
-                header = build_creation_header(task_info)
-                prompt = "🎯 Выберите направление:"
-                await safe_edit_message(
-                    callback.message,
-                    text=f"{header}\n\n{prompt}",
-                    reply_markup=directions_kb(),
-                )
+        draft.workgroup_users.clear()
+        await save_task_draft(state, draft)
 
-            elif back_to == "responsible":
-                direction_id = task_info.get('direction')
-                if not direction_id:
-                    await callback.answer("Сначала выберите направление", show_alert=True)
-                    return
+        await state.set_state(TaskCreation.waiting_for_responsible)
+        header = build_creation_header(draft)
+        direction_name = direction_title(direction_id)
+        prompt = f"👤 Выберите ответственного за задачу (направление: {direction_name}):"
+        await respond(
+            callback,
+            text=f"{header}\n\n{prompt}",
+            reply_markup=users_kb(
+                direction_users(direction_id),
+                draft.responsible_users,
+                "responsible",
+                "direction",
+            ),
+        )
 
-                workgroup = task_info.get('workgroup_users')
-                if isinstance(workgroup, set):
-                    workgroup.clear()
-                else:
-                    task_info['workgroup_users'] = set()
-
-                await state.set_state(TaskCreation.waiting_for_responsible)
-                header = build_creation_header(task_info)
-                direction_name = direction_title(direction_id)
-                prompt = f"👤 Выберите ответственного за задачу (направление: {direction_name}):"
-                users = get_users_by_direction(direction_id)
-                selected_responsible = task_info.get('responsible_users')
-                if not isinstance(selected_responsible, set):
-                    selected_responsible = set()
-                    task_info['responsible_users'] = selected_responsible
-
-                await safe_edit_message(
-                    callback.message,
-                    text=f"{header}\n\n{prompt}",
-                    reply_markup=users_kb(users, selected_responsible, "responsible", "direction"),
-                )
+    async def back_to_workgroup(callback: CallbackQuery, state: FSMContext, user_id: int) -> None:
+        draft = await load_draft_for_back(callback, state)
+        if draft is None:
+            return
 
-            else:  # back_to == "workgroup"
-                direction_id = task_info.get('direction')
-                responsible = task_info.get('responsible_users')
-                if not direction_id or not responsible:
-                    await callback.answer("Сначала выберите ответственного", show_alert=True)
-                    return
+        direction_id = draft.direction
+        if not direction_id or not draft.responsible_users:
+            await callback.answer("Сначала выберите ответственного", show_alert=True)
+            return
 
-                await state.set_state(TaskCreation.waiting_for_workgroup)
-                header = build_creation_header(task_info)
-                prompt = "👥 Выберите рабочую группу (можно выбрать несколько):"
-                users = get_users_by_direction(direction_id)
-                workgroup = task_info.get('workgroup_users')
-                if not isinstance(workgroup, set):
-                    workgroup = set()
-                    task_info['workgroup_users'] = workgroup
-
-                await safe_edit_message(
-                    callback.message,
-                    text=f"{header}\n\n{prompt}",
-                    reply_markup=users_kb(users, workgroup, "workgroup", "responsible"),
-                )
+        await state.set_state(TaskCreation.waiting_for_workgroup)
+        header = build_creation_header(draft)
+        prompt = "👥 Выберите рабочую группу (можно выбрать несколько):"
+        await respond(
+            callback,
+            text=f"{header}\n\n{prompt}",
+            reply_markup=users_kb(
+                direction_users(direction_id),
+                draft.workgroup_users,
+                "workgroup",
+                "responsible",
+            ),
+        )
 
-        await callback.answer()
+    back_handlers: dict[str, BackHandler] = {
+        "main": back_to_main,
+        "help": back_to_help,
+        "help_tasks": back_to_help_section("help_tasks"),
+        "help_statuses": back_to_help_section("help_statuses"),
+        "task_creation": back_to_task_creation,
+        "direction": back_to_direction,
+        "responsible": back_to_responsible,
+        "workgroup": back_to_workgroup,
+    }
+
+    # Фильтр по известным целям не перехватывает back_task_detail:* и другие
+    # кнопки с тем же префиксом, у которых есть собственные обработчики
+    @dispatcher.callback_query(F.data.in_({f"back_{target}" for target in back_handlers}))
+    async def handle_back_buttons(callback: CallbackQuery, state: FSMContext) -> None:
+        """Обрабатывает все кнопки возврата."""
+        handler = back_handlers[callback.data.removeprefix("back_")]
+        await handler(callback, state, callback.from_user.id)
 
     # Обработчики помощи
     @dispatcher.callback_query(F.data == "help")
     async def handle_help(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает кнопку помощи."""
         user_id = callback.from_user.id
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=get_help_text(user_id),
             reply_markup=help_menu_kb(),
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("help_"))
     async def handle_help_sections(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает разделы помощи."""
         section = callback.data
-        user_id = callback.from_user.id
-        
-        if section in ["help_tasks", "help_statuses"]:
-            text = get_help_section_text(section, user_id)
-            if section == "help_tasks":
-                await safe_edit_message(
-                    callback.message,
-                    text=text,
-                    reply_markup=help_tasks_kb(),
-                )
-            else:
-                await safe_edit_message(
-                    callback.message,
-                    text=text,
-                    reply_markup=help_statuses_kb(),
-                )
-        else:
-            text = get_help_section_text(section, user_id)
-            if section == "help_add_tasks":
-                await safe_edit_message(
-                    callback.message,
-                    text=text,
-                    reply_markup=back_button_kb("help_tasks"),
-                )
-            elif section in ["help_filter", "help_by_status", "help_by_priority"]:
-                await safe_edit_message(
-                    callback.message,
-                    text=text,
-                    reply_markup=back_button_kb("help_tasks" if section == "help_filter" else "help_statuses"),
-                )
-            else:
-                await safe_edit_message(
-                    callback.message,
-                    text=text,
-                    reply_markup=back_button_kb("help"),
-                )
-        
-        await callback.answer()
+        keyboard_factory = HELP_SECTION_KEYBOARDS.get(section, _help_fallback_kb)
 
-    def get_tasks_for_view(view: str, user_id: int) -> list[Task]:
-        """Возвращает задачи в зависимости от выбранного режима просмотра."""
+        await respond(
+            callback,
+            text=get_help_section_text(section, callback.from_user.id),
+            reply_markup=keyboard_factory(),
+        )
 
-        refresh_all_tasks_statuses()
+    def get_tasks_for_view(view: str, user_id: int, status: TaskStatus | None = None) -> list[Task]:
+        """Возвращает задачи режима просмотра, при необходимости только с указанным статусом."""
 
         if view == "my":
-            return get_involved_tasks(user_id)
-        return list(TASKS.values())
-
-    def filter_tasks(tasks: list[Task], filter_type: str) -> tuple[list[Task], str]:
-        """Применяет фильтр к списку задач и возвращает текст фильтра."""
-
-        if filter_type == "active":
-            return [task for task in tasks if task.status == TaskStatus.ACTIVE], "активные"
-        if filter_type == "review":
-            return [task for task in tasks if task.status == TaskStatus.IN_REVIEW], "на проверке"
-        if filter_type == "completed":
-            return [task for task in tasks if task.status == TaskStatus.COMPLETED], "завершенные"
-        return tasks, "все"
-
-    async def render_task_detail(
-        message: Message,
+            # Задачи пользователя уже выбраны по индексу, фильтруем только их
+            tasks = get_involved_tasks(user_id)
+            if status is None:
+                return tasks
+            return [task for task in tasks if task.status is status]
+        return get_tasks_by_status(status)
+
+    # Отфильтрованные списки задач, действительные до следующего изменения хранилища
+    filtered_cache: dict[tuple[str, str, int], TaskListView] = {}
+    filtered_cache_revision = -1
+
+    def get_filtered_tasks(view: str, filter_type: str, user_id: int) -> TaskListView:
+        """Возвращает отфильтрованный список задач, переиспользуя кеш.
+
+        Список внутри представления общий для повторных запросов, изменять его нельзя.
+        """
+        nonlocal filtered_cache_revision
+
+        # Обновление статусов само увеличивает ревизию, если что-то просрочилось
+        refresh_all_tasks_statuses_if_stale()
+        revision = get_tasks_revision()
+        if revision != filtered_cache_revision:
+            filtered_cache.clear()
+            filtered_cache_revision = revision
+
+        view_key = "my" if view == "my" else "all"
+        filter_key = filter_type if filter_type in FILTER_STATUSES else "all"
+        key = (view_key, filter_key, user_id if view_key == "my" else 0)
+        cached = filtered_cache.get(key)
+        if cached is None:
+            tasks = get_tasks_for_view(view_key, user_id, FILTER_STATUSES.get(filter_key))
+            filter_text = FILTER_TEXTS.get(filter_key, "все")
+            cached = filtered_cache[key] = TaskListView.build(tasks, filter_text)
+        return cached
+
+    async def respond_with_task_detail(
+        callback: CallbackQuery,
         task: Task,
         viewer_id: int,
         view: str,
         filter_type: str,
         page: int,
+        answer_text: str | None = None,
     ) -> None:
-        """Обновляет сообщение с карточкой задачи."""
-
-        text = build_task_detail_text(task, viewer_id)
-        keyboard = task_detail_kb(task, viewer_id, view, filter_type, page)
+        """Обновляет карточку задачи и параллельно отвечает на коллбэк."""
 
-        await safe_edit_message(
-            message,
-            text=text,
-            reply_markup=keyboard,
+        await respond(
+            callback,
+            text=build_task_detail_text(task, viewer_id),
+            reply_markup=task_detail_kb(task, viewer_id, view, filter_type, page),
+            answer_text=answer_text,
         )
 
-    def extract_action_context(callback_data: str, prefix: str) -> tuple[int, str, str, int]:
-        """Извлекает параметры из данных коллбэка."""
-
-        default_context = (0, "notify", "all", 1)
-
-        if callback_data.startswith(f"{prefix}:"):
-            parts = callback_data.split(":", 4)
-            if len(parts) == 5:
-                _, task_id_str, view, filter_type, page_str = parts
-                try:
-                    task_id = int(task_id_str)
-                    page = int(page_str)
-                except ValueError:
-                    return default_context
-                return task_id, view, filter_type, page
-            return default_context
-
-        if callback_data.startswith(f"{prefix}_"):
-            try:
-                task_id = int(callback_data.replace(f"{prefix}_", ""))
-            except ValueError:
-                return default_context
-            return task_id, "notify", "all", 1
-
-        return default_context
-
     @dispatcher.callback_query(F.data.startswith("filter_"))
     async def handle_task_filters(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает фильтры списка задач."""
-        filter_type = callback.data.replace("filter_", "")
+        filter_type = callback.data.removeprefix("filter_")
         user_id = callback.from_user.id
         view = "my" if callback.message.text.startswith("📊 Просмотр ваших задач") else "all"
 
-        tasks = get_tasks_for_view(view, user_id)
-        tasks, filter_text = filter_tasks(tasks, filter_type)
+        task_list = get_filtered_tasks(view, filter_type, user_id)
+        filter_text = task_list.filter_text
 
-        if not tasks:
+        if not task_list.total:
             empty_text = (
                 f"📋 <b>{filter_text.capitalize()} задачи</b>\n\n"
                 "Задачи не найдены."
             )
-            await safe_edit_message(
-                callback.message,
+            await respond(
+                callback,
                 text=empty_text,
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[
-                        [InlineKeyboardButton(text="📋 Фильтры", callback_data=f"tasks_filters:{view}")],
-                        [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
-                    ]
-                ),
+                reply_markup=empty_tasks_kb(view),
             )
-            await callback.answer()
             return
 
         page = 1
-        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id)
-        keyboard = tasks_list_kb(tasks, view, filter_type, page)
+        tasks = task_list.page_tasks(page)
+        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id, total=task_list.total)
+        keyboard = tasks_list_kb(tasks, view, filter_type, page, total=task_list.total)
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=tasks_text,
             reply_markup=keyboard,
         )
-        await callback.answer()
 
-    @dispatcher.callback_query(F.data.startswith("tasks_page:"))
-    async def handle_tasks_page(callback: CallbackQuery, state: FSMContext) -> None:
+    @dispatcher.callback_query(TasksPageCallback.filter())
+    async def handle_tasks_page(
+        callback: CallbackQuery,
+        callback_data: TasksPageCallback,
+        state: FSMContext,
+    ) -> None:
         """Переключает страницы списка задач."""
-        _, view, filter_type, page_str = callback.data.split(":", 3)
+        view = callback_data.view
+        filter_type = callback_data.filter_type
         user_id = callback.from_user.id
-        tasks = get_tasks_for_view(view, user_id)
-        tasks, filter_text = filter_tasks(tasks, filter_type)
 
-        if not tasks:
+        if view == "my":
+            task_list = get_filtered_tasks(view, filter_type, user_id)
+            filter_text = task_list.filter_text
+            total = task_list.total
+        else:
+            # Для общего списка количество берём из счётчиков статусов,
+            # а задачи собираем только для текущей страницы
+            refresh_all_tasks_statuses_if_stale()
+            status = FILTER_STATUSES.get(filter_type)
+            filter_text = FILTER_TEXTS.get(filter_type, "все")
+            total = count_tasks_by_status(status)
+
+        if not total:
             await callback.answer("Задачи не найдены", show_alert=True)
             return
 
-        total_pages = max(1, (len(tasks) + TASKS_PER_PAGE - 1) // TASKS_PER_PAGE)
-        try:
-            page = int(page_str)
-        except ValueError:
-            page = 1
-        page = max(1, min(page, total_pages))
+        total_pages = max(1, (total + TASKS_PER_PAGE - 1) // TASKS_PER_PAGE)
+        page = max(1, min(callback_data.page, total_pages))
+        start_index = (page - 1) * TASKS_PER_PAGE
+
+        if view == "my":
+            tasks = task_list.page_tasks(page)
+        else:
+            tasks = get_tasks_page_by_status(status, start_index, TASKS_PER_PAGE)
 
-        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id)
-        keyboard = tasks_list_kb(tasks, view, filter_type, page)
+        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id, total=total)
+        keyboard = tasks_list_kb(tasks, view, filter_type, page, total=total)
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=tasks_text,
             reply_markup=keyboard,
         )
-        await callback.answer()
 
-    @dispatcher.callback_query(F.data.startswith("task_detail:"))
-    async def handle_task_detail(callback: CallbackQuery, state: FSMContext) -> None:
+    @dispatcher.callback_query(TaskDetailCallback.filter())
+    async def handle_task_detail(
+        callback: CallbackQuery,
+        callback_data: TaskDetailCallback,
+        state: FSMContext,
+    ) -> None:
         """Показывает подробную информацию о задаче."""
-        parts = callback.data.split(":")
-        if len(parts) != 5:
-            await callback.answer("Некорректные данные", show_alert=True)
-            return
-
-        _, task_id_str, view, filter_type, page_str = parts
-        try:
-            task_id = int(task_id_str)
-            page = int(page_str)
-        except ValueError:
-            await callback.answer("Некорректные данные", show_alert=True)
-            return
-
-        task = TASKS.get(task_id)
+        task = get_task(callback_data.task_id)
         if not task:
             await callback.answer("Задача не найдена", show_alert=True)
             return
 
-        await render_task_detail(
-            callback.message,
+        await respond_with_task_detail(
+            callback,
             task,
             callback.from_user.id,
-            view,
-            filter_type,
-            page,
+            callback_data.view,
+            callback_data.filter_type,
+            callback_data.page,
         )
-        await callback.answer()
 
     @dispatcher.callback_query(F.data.startswith("tasks_filters:"))
     async def handle_tasks_filters_menu(callback: CallbackQuery, state: FSMContext) -> None:
@@ -2102,31 +2891,26 @@ def create_dispatcher() -> Dispatcher:
         list_type = "всех" if view == "all" else "ваших"
         text = f"📊 Просмотр {list_type} задач. Выберите фильтр:"
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=text,
             reply_markup=tasks_filter_kb(),
         )
-        await callback.answer()
 
-    @dispatcher.callback_query(F.data.startswith("delete_task:"))
-    async def handle_delete_task(callback: CallbackQuery, state: FSMContext) -> None:
+    @dispatcher.callback_query(TaskDeleteCallback.filter())
+    async def handle_delete_task(
+        callback: CallbackQuery,
+        callback_data: TaskDeleteCallback,
+        state: FSMContext,
+    ) -> None:
         """Удаляет задачу, если это делает автор."""
-        parts = callback.data.split(":")
-        if len(parts) != 5:
-            await callback.answer("Некорректные данные", show_alert=True)
-            return
-
-        _, task_id_str, view, filter_type, page_str = parts
-        try:
-            task_id = int(task_id_str)
-            page = int(page_str)
-        except ValueError:
-            await callback.answer("Некорректные данные", show_alert=True)
-            return
+        task_id = callback_data.task_id
+        view = callback_data.view
+        filter_type = callback_data.filter_type
+        page = callback_data.page
 
         user_id = callback.from_user.id
-        task = TASKS.get(task_id)
+        task = get_task(task_id)
 
         if not task:
             await callback.answer("Задача не найдена", show_alert=True)
@@ -2138,58 +2922,65 @@ def create_dispatcher() -> Dispatcher:
 
         remove_task(task_id)
 
-        tasks = get_tasks_for_view(view, user_id)
-        tasks, filter_text = filter_tasks(tasks, filter_type)
+        task_list = get_filtered_tasks(view, filter_type, user_id)
+        filter_text = task_list.filter_text
 
-        if not tasks:
+        if not task_list.total:
             empty_text = (
                 f"📋 <b>{filter_text.capitalize()} задачи</b>\n\n"
                 "Задачи не найдены."
             )
-            await safe_edit_message(
-                callback.message,
+            await respond(
+                callback,
                 text=empty_text,
-                reply_markup=InlineKeyboardMarkup(
-                    inline_keyboard=[
-                        [InlineKeyboardButton(text="📋 Фильтры", callback_data=f"tasks_filters:{view}")],
-                        [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
-                    ]
-                ),
+                reply_markup=empty_tasks_kb(view),
+                answer_text="Задача удалена",
             )
-            await callback.answer("Задача удалена")
             return
 
-        total_pages = max(1, (len(tasks) + TASKS_PER_PAGE - 1) // TASKS_PER_PAGE)
-        page = max(1, min(page, total_pages))
-        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id)
-        keyboard = tasks_list_kb(tasks, view, filter_type, page)
+        page = task_list.clamp_page(page)
+        tasks = task_list.page_tasks(page)
+        tasks_text = build_tasks_list_text(tasks, filter_text, page, user_id, total=task_list.total)
+        keyboard = tasks_list_kb(tasks, view, filter_type, page, total=task_list.total)
 
-        await safe_edit_message(
-            callback.message,
+        await respond(
+            callback,
             text=tasks_text,
             reply_markup=keyboard,
+            answer_text="Задача удалена",
         )
-        await callback.answer("Задача удалена")
 
+    @dispatcher.callback_query(
+        F.data.startswith("tasks_page:")
+        | F.data.startswith("task_detail:")
+        | F.data.startswith("delete_task:")
+    )
+    async def handle_malformed_list_callback(callback: CallbackQuery, state: FSMContext) -> None:
+        """Отвечает на коллбэки списка, которые не удалось разобрать."""
+        parts = callback.data.split(":", 3)
+        if parts[0] == "tasks_page" and len(parts) == 4:
+            # Нечитаемый номер страницы, как и раньше, ведёт на первую страницу
+            _, view, filter_type, _ = parts
+            fallback = TasksPageCallback(view=view, filter_type=filter_type, page=1)
+            await handle_tasks_page(callback, fallback, state)
+            return
+        await callback.answer("Некорректные данные", show_alert=True)
 
-    # Обработчики действий с задачами
-    @dispatcher.callback_query(F.data.startswith("back_task_detail:"))
+    # Обработчики действий с задачами; регистрируются через task_action_handlers ниже
     async def handle_back_task_detail(callback: CallbackQuery, state: FSMContext) -> None:
         """Возвращает пользователя к карточке задачи."""
 
         user_id = callback.from_user.id
         await state.clear()
-        task_updates.pop(user_id, None)
 
         task_id, view, filter_type, page = extract_action_context(callback.data, "back_task_detail")
-        task = TASKS.get(task_id)
+        task = get_task(task_id)
 
         if not task:
             await callback.answer("Задача не найдена", show_alert=True)
             return
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer()
+        await respond_with_task_detail(callback, task, user_id, view, filter_type, page)
 
     async def ensure_task_for_action(
         callback: CallbackQuery,
@@ -2199,7 +2990,7 @@ def create_dispatcher() -> Dispatcher:
         """Возвращает задачу и параметры отображения для действия."""
 
         task_id, view, filter_type, page = extract_action_context(callback.data, prefix)
-        task = TASKS.get(task_id)
+        task = get_task(task_id)
 
         if not task:
             await callback.answer(not_found_message, show_alert=True)
@@ -2207,44 +2998,6 @@ def create_dispatcher() -> Dispatcher:
 
         return task, view, filter_type, page
 
-    def extract_confirmation_context(callback_data: str) -> tuple[int, int, str, str, int]:
-        """Получает параметры для подтверждения выполнения."""
-
-        default_context = (0, 0, "notify", "all", 1)
-
-        if callback_data.startswith("confirm_completion:"):
-            parts = callback_data.split(":", 5)
-            if len(parts) == 6:
-                _, task_id_str, participant_id_str, view, filter_type, page_str = parts
-                try:
-                    task_id = int(task_id_str)
-                    participant_id = int(participant_id_str)
-                    page = int(page_str)
-                except ValueError:
-                    return default_context
-                return task_id, participant_id, view, filter_type, page
-
-        return default_context
-
-    def extract_reminder_context(callback_data: str) -> tuple[int, int, str, str, int]:
-        """Получает параметры для напоминания конкретному участнику."""
-
-        default_context = (0, 0, "notify", "all", 1)
-
-        if callback_data.startswith("remind_one:"):
-            parts = callback_data.split(":", 5)
-            if len(parts) == 6:
-                _, task_id_str, participant_id_str, view, filter_type, page_str = parts
-                try:
-                    task_id = int(task_id_str)
-                    participant_id = int(participant_id_str)
-                    page = int(page_str)
-                except ValueError:
-                    return default_context
-                return task_id, participant_id, view, filter_type, page
-
-        return default_context
-
     def can_manage_task(task: Task, user_id: int) -> bool:
         """Проверяет, может ли пользователь управлять задачей."""
 
@@ -2254,7 +3007,6 @@ def create_dispatcher() -> Dispatcher:
             or task.author_id == user_id
         )
 
-    @dispatcher.callback_query(F.data.startswith("take_task"))
     async def handle_take_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает взятие задачи в работу."""
 
@@ -2286,10 +3038,10 @@ def create_dispatcher() -> Dispatcher:
         set_participant_status(task, user_id, TaskStatus.ACTIVE)
         remove_pending_confirmation(task, user_id)
         task.completed_date = None
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
         recalc_task_status(task)
         record_task_action(task, user_id, "Взял задачу в работу")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
@@ -2301,10 +3053,11 @@ def create_dispatcher() -> Dispatcher:
             ),
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Задача взята в работу")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Задача взята в работу",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("pause_task"))
     async def handle_pause_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает постановку задачи на паузу."""
 
@@ -2323,23 +3076,21 @@ def create_dispatcher() -> Dispatcher:
         if task.current_executor_id == user_id:
             task.current_executor_id = None
 
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
         recalc_task_status(task)
         record_task_action(task, user_id, "Поставил задачу на паузу")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
             "поставил(а) задачу на паузу.",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Задача на паузе")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Задача на паузе",
+        )
 
-    @dispatcher.callback_query(
-        F.data.startswith("complete_task")
-        & ~F.data.startswith("complete_task_author")
-    )
     async def handle_complete_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Обрабатывает завершение задачи."""
 
@@ -2361,7 +3112,7 @@ def create_dispatcher() -> Dispatcher:
         if task.current_executor_id == user_id:
             task.current_executor_id = None
         task.completed_date = None
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
 
         add_pending_confirmation(task, user_id)
 
@@ -2373,7 +3124,7 @@ def create_dispatcher() -> Dispatcher:
             answer_text = "Результат отправлен на проверку ответственному"
 
         record_task_action(task, user_id, "Завершил задачу для проверки")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
@@ -2389,10 +3140,11 @@ def create_dispatcher() -> Dispatcher:
             ),
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer(answer_text)
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text=answer_text,
+        )
 
-    @dispatcher.callback_query(F.data.startswith("reset_task_request"))
     async def handle_reset_task_request(callback: CallbackQuery, state: FSMContext) -> None:
         """Запрашивает подтверждение сброса состояния задачи."""
 
@@ -2427,7 +3179,6 @@ def create_dispatcher() -> Dispatcher:
         await safe_edit_message(callback.message, text=warning_text, reply_markup=confirmation_keyboard)
         await callback.answer()
 
-    @dispatcher.callback_query(F.data.startswith("reset_task_cancel"))
     async def handle_reset_task_cancel(callback: CallbackQuery, state: FSMContext) -> None:
         """Отменяет процедуру сброса состояния."""
 
@@ -2440,10 +3191,11 @@ def create_dispatcher() -> Dispatcher:
             await callback.answer("Сброс состояния доступен только автору", show_alert=True)
             return
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Сброс отменён")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Сброс отменён",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("reset_task_confirm"))
     async def handle_reset_task_confirm(callback: CallbackQuery, state: FSMContext) -> None:
         """Сбрасывает состояние задачи после подтверждения."""
 
@@ -2459,21 +3211,22 @@ def create_dispatcher() -> Dispatcher:
         set_all_participants_status(task, TaskStatus.NEW)
         task.current_executor_id = None
         task.completed_date = None
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
         clear_pending_confirmations(task)
 
         record_task_action(task, user_id, "Сбросил состояние задачи")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
             "сбросил(а) состояние задачи.",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Состояние сброшено")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Состояние сброшено",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("remind_all"))
     async def handle_remind_all(callback: CallbackQuery, state: FSMContext) -> None:
         """Отправляет напоминание всем доступным участникам."""
 
@@ -2490,15 +3243,16 @@ def create_dispatcher() -> Dispatcher:
         await send_task_reminder(callback.bot, task, user_id, recipients)
         record_task_action(task, user_id, "Отправил напоминание всем участникам")
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Напоминание отправлено")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Напоминание отправлено",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("remind_one:"))
     async def handle_remind_one(callback: CallbackQuery, state: FSMContext) -> None:
         """Отправляет напоминание конкретному участнику."""
 
         task_id, participant_id, view, filter_type, page = extract_reminder_context(callback.data)
-        task = TASKS.get(task_id)
+        task = get_task(task_id)
 
         if not task:
             await callback.answer("Задача не найдена", show_alert=True)
@@ -2518,10 +3272,11 @@ def create_dispatcher() -> Dispatcher:
             f"Отправил напоминание участнику {participant_name}",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Напоминание отправлено")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Напоминание отправлено",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("complete_task_author"))
     async def handle_author_completion(callback: CallbackQuery, state: FSMContext) -> None:
         """Позволяет автору завершить задачу в любой момент."""
 
@@ -2537,21 +3292,22 @@ def create_dispatcher() -> Dispatcher:
         set_all_participants_status(task, TaskStatus.COMPLETED)
         task.completed_date = datetime.now()
         task.current_executor_id = None
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
         clear_pending_confirmations(task)
 
         record_task_action(task, user_id, "Завершил задачу")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
             "завершил(а) задачу.",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Задача завершена")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Задача завершена",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("postpone_task"))
     async def handle_postpone_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Запрашивает новую дату сдачи задачи."""
 
@@ -2560,18 +3316,21 @@ def create_dispatcher() -> Dispatcher:
             return
 
         user_id = callback.from_user.id
-        if not (can_manage_task(task, user_id) or user_id in task.workgroup):
+        if not (can_manage_task(task, user_id) or user_id in task.workgroup_ids):
             await callback.answer("Нет прав для изменения срока", show_alert=True)
             return
 
         await state.set_state(TaskUpdate.waiting_for_postpone_date)
-        task_updates[user_id] = {
-            "task_id": task.task_id,
-            "view": view,
-            "filter": filter_type,
-            "page": page,
-            "message_id": callback.message.message_id,
-        }
+        await save_task_update(
+            state,
+            {
+                "task_id": task.task_id,
+                "view": view,
+                "filter": filter_type,
+                "page": page,
+                "message_id": callback.message.message_id,
+            },
+        )
 
         prompt = (
             "🕒 Введите новую дату завершения задачи в формате ДД.ММ.ГГГГ\n"
@@ -2581,17 +3340,7 @@ def create_dispatcher() -> Dispatcher:
         await safe_edit_message(
             callback.message,
             text=prompt,
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[
-                    [
-                        InlineKeyboardButton(
-                            text="⬅️ Назад",
-                            callback_data=f"back_task_detail:{task.task_id}:{view}:{filter_type}:{page}",
-                        )
-                    ],
-                    [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
-                ]
-            ),
+            reply_markup=task_detail_back_kb(task.task_id, view, filter_type, page),
         )
 
         await callback.answer()
@@ -2600,8 +3349,7 @@ def create_dispatcher() -> Dispatcher:
     async def process_postpone_date(message: Message, state: FSMContext) -> None:
         """Обрабатывает перенос срока задачи."""
 
-        user_id = message.from_user.id
-        update_info = task_updates.get(user_id)
+        update_info = await load_task_update(state)
 
         if not update_info:
             await state.clear()
@@ -2616,47 +3364,40 @@ def create_dispatcher() -> Dispatcher:
             return
 
         update_info["new_due_date"] = new_due_date
+        await save_task_update(state, update_info)
         await state.set_state(TaskUpdate.waiting_for_postpone_reason)
 
         prompt = (
             "🕒 Новый срок: "
-            f"{new_due_date.strftime('%d.%m.%Y')}\n"
+            f"{format_date(new_due_date)}\n"
             "💬 Укажите причину переноса задачи:"
         )
 
-        await safe_edit_message_by_id(
-            message.bot,
-            chat_id=message.chat.id,
-            message_id=update_info["message_id"],
-            text=prompt,
-            reply_markup=InlineKeyboardMarkup(
-                inline_keyboard=[
-                    [
-                        InlineKeyboardButton(
-                            text="⬅️ Назад",
-                            callback_data=(
-                                f"back_task_detail:{update_info['task_id']}:{update_info['view']}"
-                                f":{update_info['filter']}:{update_info['page']}"
-                            ),
-                        )
-                    ],
-                    [InlineKeyboardButton(text="🏠 Главная", callback_data="back_main")],
-                ]
+        await asyncio.gather(
+            safe_edit_message_by_id(
+                message.bot,
+                chat_id=message.chat.id,
+                message_id=update_info["message_id"],
+                text=prompt,
+                reply_markup=task_detail_back_kb(
+                    update_info["task_id"],
+                    update_info["view"],
+                    update_info["filter"],
+                    update_info["page"],
+                ),
             ),
+            delete_user_input(message),
         )
 
-        await message.delete()
-
     @dispatcher.message(TaskUpdate.waiting_for_postpone_reason)
     async def process_postpone_reason(message: Message, state: FSMContext) -> None:
         """Обрабатывает причину переноса срока задачи."""
 
         user_id = message.from_user.id
-        update_info = task_updates.get(user_id)
+        update_info = await load_task_update(state)
 
         if not update_info or "new_due_date" not in update_info:
             await state.clear()
-            task_updates.pop(user_id, None)
             await message.answer("Данные об обновлении задачи не найдены", reply_markup=main_menu_kb())
             await message.delete()
             return
@@ -2667,10 +3408,9 @@ def create_dispatcher() -> Dispatcher:
             await message.delete()
             return
 
-        task = TASKS.get(update_info["task_id"])
+        task = get_task(update_info["task_id"])
         if task is None:
             await state.clear()
-            task_updates.pop(user_id, None)
             await message.answer("Задача не найдена", reply_markup=main_menu_kb())
             await message.delete()
             return
@@ -2679,8 +3419,8 @@ def create_dispatcher() -> Dispatcher:
         new_due_date = update_info["new_due_date"]
 
         if role in {"author", "responsible"}:
-            task.due_date = new_due_date
-            task.status_before_overdue = None
+            set_task_due_date(task, new_due_date)
+            reset_status_before_overdue(task)
             clear_all_personal_due_dates(task)
             recalc_task_status(task)
         else:
@@ -2695,51 +3435,50 @@ def create_dispatcher() -> Dispatcher:
             user_id,
             (
                 "Отложил задачу до "
-                f"{new_due_date.strftime('%d.%m.%Y')} (причина: {reason})"
+                f"{format_date(new_due_date)} (причина: {reason})"
             ),
         )
-        await notify_task_participants(
+        notify_in_background(
             message.bot,
             task,
             user_id,
             (
                 "отложил(а) задачу до "
-                f"{new_due_date.strftime('%d.%m.%Y')} (причина: {reason})."
+                f"{format_date(new_due_date)} (причина: {reason})."
             ),
         )
 
         await state.clear()
-        task_updates.pop(user_id, None)
 
-        await safe_edit_message_by_id(
-            message.bot,
-            chat_id=message.chat.id,
-            message_id=update_info["message_id"],
-            text=build_task_detail_text(task, user_id),
-            reply_markup=task_detail_kb(
-                task,
-                user_id,
-                update_info["view"],
-                update_info["filter"],
-                update_info["page"],
+        await asyncio.gather(
+            safe_edit_message_by_id(
+                message.bot,
+                chat_id=message.chat.id,
+                message_id=update_info["message_id"],
+                text=build_task_detail_text(task, user_id),
+                reply_markup=task_detail_kb(
+                    task,
+                    user_id,
+                    update_info["view"],
+                    update_info["filter"],
+                    update_info["page"],
+                ),
             ),
+            delete_user_input(message),
         )
 
-        await message.delete()
-
-    @dispatcher.callback_query(F.data.startswith("confirm_completion:"))
     async def handle_confirm_completion(callback: CallbackQuery, state: FSMContext) -> None:
         """Подтверждает выполнение задачи автором."""
 
         task_id, participant_id, view, filter_type, page = extract_confirmation_context(callback.data)
-        task = TASKS.get(task_id)
+        task = get_task(task_id)
 
         if not task:
             await callback.answer("Задача не найдена", show_alert=True)
             return
 
         user_id = callback.from_user.id
-        if user_id not in {task.author_id, task.responsible_user_id}:
+        if user_id != task.author_id and user_id != task.responsible_user_id:
             await callback.answer(
                 "Подтверждать выполнение могут только автор и ответственный",
                 show_alert=True,
@@ -2754,19 +3493,16 @@ def create_dispatcher() -> Dispatcher:
 
         remove_pending_confirmation(task, participant_id)
 
-        participants = [
-            member_id
-            for member_id in get_task_participants(task)
-            if member_id != task.author_id
-        ]
+        participants = task.participant_ids - {task.author_id}
+        # all() останавливается на первом участнике, который ещё не завершил работу
         all_completed = all(
-            get_participant_status(task, member_id) == TaskStatus.COMPLETED
+            task.participant_statuses.get(member_id) is TaskStatus.COMPLETED
             for member_id in participants
         )
 
         if all_completed and participants:
             task.completed_date = datetime.now()
-            task.status_before_overdue = None
+            reset_status_before_overdue(task)
         elif not all_completed:
             task.completed_date = None
 
@@ -2776,17 +3512,18 @@ def create_dispatcher() -> Dispatcher:
             f"Подтвердил выполнение участника {participant_name}",
         )
 
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
             f"подтвердил(а) выполнение участника {participant_name}.",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer(f"Подтверждено: {participant_name}")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text=f"Подтверждено: {participant_name}",
+        )
 
-    @dispatcher.callback_query(F.data.startswith("return_task"))
     async def handle_return_task(callback: CallbackQuery, state: FSMContext) -> None:
         """Возвращает задачу в работу по решению автора."""
 
@@ -2802,40 +3539,123 @@ def create_dispatcher() -> Dispatcher:
         set_all_participants_status(task, TaskStatus.NEW)
         task.current_executor_id = None
         task.completed_date = None
-        task.status_before_overdue = None
+        reset_status_before_overdue(task)
         clear_pending_confirmations(task)
 
         record_task_action(task, user_id, "Вернул задачу в работу")
-        await notify_task_participants(
+        notify_in_background(
             callback.bot,
             task,
             user_id,
             "вернул(а) задачу в работу.",
         )
 
-        await render_task_detail(callback.message, task, user_id, view, filter_type, page)
-        await callback.answer("Задача возвращена в работу")
+        await respond_with_task_detail(
+            callback, task, user_id, view, filter_type, page,
+            answer_text="Задача возвращена в работу",
+        )
+
+    # Действия с задачей: префикс callback_data до первого ":" -> обработчик.
+    # Один фильтр со словарём вместо цепочки проверок startswith для каждого действия
+    task_action_handlers: dict[str, Callable[[CallbackQuery, FSMContext], Awaitable[None]]] = {
+        "back_task_detail": handle_back_task_detail,
+        "take_task": handle_take_task,
+        "pause_task": handle_pause_task,
+        "complete_task": handle_complete_task,
+        "reset_task_request": handle_reset_task_request,
+        "reset_task_cancel": handle_reset_task_cancel,
+        "reset_task_confirm": handle_reset_task_confirm,
+        "remind_all": handle_remind_all,
+        "remind_one": handle_remind_one,
+        "complete_task_author": handle_author_completion,
+        "postpone_task": handle_postpone_task,
+        "confirm_completion": handle_confirm_completion,
+        "return_task": handle_return_task,
+    }
+
+    # Блокировки выполняющихся действий по ID задачи; освобождённые исчезают сами
+    task_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+    def split_task_action(data: str) -> tuple[str, str] | None:
+        """Возвращает действие и ID задачи из callback_data или None."""
+
+        action, separator, context = data.partition(":")
+        if separator:
+            return (action, context.partition(":")[0]) if action in task_action_handlers else None
+        # Старый формат кнопок из отправленных ранее сообщений: префикс_ID
+        action, _, task_key = data.rpartition("_")
+        if action in task_action_handlers and task_key.isdecimal():
+            return action, task_key
+        return None
+
+    @dispatcher.callback_query(F.data.func(split_task_action).as_("task_action"))
+    async def handle_task_action(
+        callback: CallbackQuery,
+        state: FSMContext,
+        task_action: tuple[str, str],
+    ) -> None:
+        """Передаёт действие с задачей обработчику по префиксу callback_data."""
+        action, task_key = task_action
+        handler = task_action_handlers[action]
+        if action not in TASK_MUTATING_ACTIONS:
+            await handler(callback, state)
+            return
+
+        # Пока действие по задаче не завершилось, повторные нажатия отклоняются:
+        # иначе двойное нажатие повторит изменение и разошлёт уведомления дважды
+        lock = task_locks.get(task_key)
+        if lock is None:
+            lock = task_locks[task_key] = asyncio.Lock()
+        if lock.locked():
+            await callback.answer("Задача обрабатывается, попробуйте ещё раз")
+            return
+        async with lock:
+            await handler(callback, state)
 
     return dispatcher
 
     return dispatcher
 
 
+def build_session(config: BotConfig) -> AiohttpSession:
+    """Создаёт HTTP-сессию бота с постоянными соединениями."""
+
+    session = AiohttpSession(limit=config.connection_limit, timeout=config.request_timeout)
+    # Держим соединения открытыми между запросами, чтобы рассылки
+    # переиспользовали TCP/TLS вместо повторных рукопожатий. У AiohttpSession
+    # нет публичного параметра для keepalive_timeout, поэтому настройка
+    # пишется в параметры коннектора; версия aiogram закреплена в requirements.txt
+    session._connector_init["keepalive_timeout"] = config.keepalive_timeout
+    return session
+
+
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Возвращает фабрику цикла uvloop, если пакет установлен.
+
+    ``None`` означает стандартный цикл asyncio.
+    """
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def run_bot_sync(config: BotConfig) -> None:
     """Запускает бота синхронно."""
-    
-    # Импортируем DefaultBotProperties
-    from aiogram.client.default import DefaultBotProperties
-    
+
     # Создаем бота с правильными параметрами
     bot = Bot(
-        token=config.token, 
-        default=DefaultBotProperties(parse_mode="HTML")
+        token=config.token,
+        session=build_session(config),
+        default=DefaultBotProperties(parse_mode="HTML"),
     )
-    dispatcher = create_dispatcher()
+    dispatcher = create_dispatcher(build_storage(config.redis_url, config.fsm_ttl))
 
     # Запускаем бота
-    asyncio.run(dispatcher.start_polling(
-        bot, 
-        drop_pending_updates=config.drop_pending_updates
-    ))
\ No newline at end of file
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        runner.run(dispatcher.start_polling(
+            bot,
+            drop_pending_updates=config.drop_pending_updates
+        ))
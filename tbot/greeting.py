@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime, time
+from time import monotonic_ns
 from typing import Iterable, Mapping, Optional
 from zoneinfo import ZoneInfo
 
@@ -13,6 +14,9 @@ from .users import USERS, User
 LOGGER = logging.getLogger(__name__)
 MOSCOW_TZ = ZoneInfo("Europe/Moscow")
 
+# Ответ для пользователей не из белого списка; вызывающий код сравнивает его по `is`
+ACCESS_DENIED_MESSAGE = "Доступ ограничен. Обратитесь к администратору системы задач."
+
 
 @dataclass(frozen=True, slots=True)
 class TimeRange:
@@ -47,6 +51,41 @@ def _build_time_ranges() -> Iterable[TimeRange]:
 TIME_RANGES: tuple[TimeRange, ...] = tuple(_build_time_ranges())
 
 
+def _greeting_for_minute(minute_of_day: int) -> str:
+    """Находит приветствие для минуты суток перебором диапазонов."""
+
+    moment = datetime.combine(datetime.min, time(*divmod(minute_of_day, 60)))
+    for time_range in TIME_RANGES:
+        if time_range.includes(moment):
+            return time_range.greeting
+
+    # Сюда мы не должны попадать, но на всякий случай оставим дефолт
+    LOGGER.debug("Не найден подходящий диапазон времени для минуты %s", minute_of_day)
+    return "Здравствуйте"
+
+
+# Приветствие для каждой минуты суток: диапазоны заданы с точностью до минуты,
+# поэтому таблица заменяет перебор и не теряет секунды внутри последней минуты
+_GREETING_BY_MINUTE: tuple[str, ...] = tuple(_greeting_for_minute(minute) for minute in range(24 * 60))
+
+
+# Текущее московское время, общее для всех приветствий в пределах одной секунды
+_NOW_CACHE: tuple[int, datetime] | None = None
+
+
+def _moscow_now() -> datetime:
+    """Возвращает московское время, обновляя его не чаще раза в секунду.
+
+    Приветствие зависит только от минуты, поэтому задержка в секунду не видна.
+    """
+
+    global _NOW_CACHE
+    second = monotonic_ns() // 1_000_000_000
+    if _NOW_CACHE is None or _NOW_CACHE[0] != second:
+        _NOW_CACHE = (second, datetime.now(tz=MOSCOW_TZ))
+    return _NOW_CACHE[1]
+
+
 def determine_greeting(dt: datetime) -> str:
     """Возвращает приветствие в зависимости от времени суток."""
 
@@ -56,13 +95,7 @@ def determine_greeting(dt: datetime) -> str:
     else:
         dt = dt.astimezone(MOSCOW_TZ)
 
-    for time_range in TIME_RANGES:
-        if time_range.includes(dt):
-            return time_range.greeting
-
-    # Сюда мы не должны попадать, но на всякий случай оставим дефолт
-    LOGGER.debug("Не найден подходящий диапазон времени, используется дефолтное приветствие")
-    return "Здравствуйте"
+    return _GREETING_BY_MINUTE[dt.hour * 60 + dt.minute]
 
 
 def greet_user(
@@ -72,19 +105,13 @@ def greet_user(
 ) -> str:
     """Формирует приветствие для пользователя или сообщает об ограничении доступа."""
 
-    # Получаем текущее время в московской таймзоне
-    now = (current_time or datetime.now(tz=MOSCOW_TZ))
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=MOSCOW_TZ)
-    else:
-        now = now.astimezone(MOSCOW_TZ)
-
     user = users.get(user_id)
     if user is None:
         # Логируем попытку доступа не из белого списка
         LOGGER.warning("Попытка доступа от неизвестного пользователя: %s", user_id)
-        return "Доступ ограничен. Обратитесь к администратору системы задач."
+        return ACCESS_DENIED_MESSAGE
 
-    greeting = determine_greeting(now)
+    # determine_greeting сам приводит время к московской таймзоне
+    greeting = determine_greeting(current_time or _moscow_now())
     first_name = user.first_name
     return f"{greeting}, {first_name}!"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, Iterable, List, Mapping, Sequence, Set
 
@@ -26,14 +26,22 @@ class GlobalStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass(frozen=True)
+# Персональные статусы, при которых участник закончил свою часть работы
+_FINISHED_STATUSES = frozenset({PersonalStatus.CONFIRMED, PersonalStatus.DONE})
+# Персональные статусы, при которых работа участника сдана на проверку или принята
+_SUBMITTED_STATUSES = _FINISHED_STATUSES | {PersonalStatus.ON_REVIEW}
+_ONLY_NEW = frozenset({PersonalStatus.NEW})
+_NO_PARTICIPANTS: frozenset[int] = frozenset()
+
+
+@dataclass(frozen=True, slots=True)
 class ActivityEntry:
     """Запись лога действий по задаче."""
 
     actor_id: int
     description: str
     is_status_change: bool = False
-    related_participants: frozenset[int] = field(default_factory=frozenset)
+    related_participants: frozenset[int] = _NO_PARTICIPANTS
 
     def __post_init__(self) -> None:
         """Нормализует участников, связанных с событием."""
@@ -41,25 +49,30 @@ class ActivityEntry:
         # В источниках данных поле может приходить в разных форматах или вовсе быть пустым.
         # Приводим его к неизменяемому набору, чтобы дальнейшая логика работала стабильно.
         participants = self.related_participants
-        if not participants:
-            object.__setattr__(self, "related_participants", frozenset())
+        # Обычный случай: значение по умолчанию или уже готовый frozenset
+        if type(participants) is frozenset:
             return
+        object.__setattr__(
+            self,
+            "related_participants",
+            frozenset(participants) if participants else _NO_PARTICIPANTS,
+        )
 
-        if not isinstance(participants, frozenset):
-            object.__setattr__(self, "related_participants", frozenset(participants))
+
+# Названия персональных разделов по статусам участника
+_SECTION_TITLES: Dict[PersonalStatus, str] = {
+    PersonalStatus.NEW: "Новые",
+    PersonalStatus.IN_PROGRESS: "В работе",
+    PersonalStatus.ON_REVIEW: "На проверке",
+    PersonalStatus.CONFIRMED: "Выполненные",
+    PersonalStatus.DONE: "Выполненные",
+}
 
 
 def personal_section(status: PersonalStatus) -> str:
     """Возвращает название персонального раздела для статуса."""
 
-    section_titles = {
-        PersonalStatus.NEW: "Новые",
-        PersonalStatus.IN_PROGRESS: "В работе",
-        PersonalStatus.ON_REVIEW: "На проверке",
-        PersonalStatus.CONFIRMED: "Выполненные",
-        PersonalStatus.DONE: "Выполненные",
-    }
-    return section_titles[status]
+    return _SECTION_TITLES[status]
 
 
 def personal_sections_for_participants(
@@ -69,7 +82,7 @@ def personal_sections_for_participants(
 
     # Каждый участник видит задачу в разделе, который соответствует его статусу.
     return {
-        participant_id: personal_section(status)
+        participant_id: _SECTION_TITLES[status]
         for participant_id, status in participant_statuses.items()
     }
 
@@ -102,19 +115,15 @@ def calculate_global_status(
     if manual_completed:
         return GlobalStatus.COMPLETED
 
-    if not participant_statuses:
+    # Один проход по участникам: дальше важен только набор встретившихся статусов
+    present = set(participant_statuses)
+    if not present or present == _ONLY_NEW:
         return GlobalStatus.NEW
 
-    if all(status == PersonalStatus.NEW for status in participant_statuses):
-        return GlobalStatus.NEW
-
-    if all(status in {PersonalStatus.CONFIRMED, PersonalStatus.DONE} for status in participant_statuses):
+    if present <= _FINISHED_STATUSES:
         return GlobalStatus.COMPLETED
 
-    if all(
-        status in {PersonalStatus.ON_REVIEW, PersonalStatus.CONFIRMED, PersonalStatus.DONE}
-        for status in participant_statuses
-    ):
+    if present <= _SUBMITTED_STATUSES:
         return GlobalStatus.ON_REVIEW
 
     return GlobalStatus.IN_PROGRESS
@@ -142,14 +151,9 @@ def recipients_on_confirmation(
 ) -> Set[int]:
     """Возвращает пользователей, которых нужно уведомить при подтверждении выполнения."""
 
-    recipients: Set[int] = {participant_id}
-
-    if author_id != actor_id:
-        recipients.add(author_id)
-
-    if responsible_id and responsible_id != actor_id:
-        recipients.add(responsible_id)
-
+    # Те же получатели, что и при взятии в работу, плюс сам участник
+    recipients = recipients_on_take(author_id, responsible_id, actor_id)
+    recipients.add(participant_id)
     return recipients
 
 
@@ -165,21 +169,24 @@ def filter_activity_feed(
         return list(entries)
 
     visible: List[ActivityEntry] = []
+    append = visible.append
     for entry in entries:
-        if entry.actor_id == viewer_id:
-            visible.append(entry)
+        actor_id = entry.actor_id
+        if actor_id == viewer_id:
+            append(entry)
             continue
 
         if not entry.is_status_change:
             continue
 
-        if viewer_id not in entry.related_participants:
+        participants = entry.related_participants
+        if viewer_id not in participants:
             continue
 
-        if entry.actor_id == author_id and len(entry.related_participants) > 1:
+        if actor_id == author_id and len(participants) > 1:
             continue
 
-        visible.append(entry)
+        append(entry)
 
     return visible
 
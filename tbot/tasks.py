@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
 
 
 class TaskStatus(Enum):
@@ -19,6 +22,11 @@ class TaskStatus(Enum):
     OVERDUE = "Просрочена"
 
 
+# Источник версий задач: общий для всех задач, поэтому пара (ID, версия)
+# не повторяется даже у разных объектов с одинаковым ID
+_task_versions = itertools.count(1)
+
+
 class TaskPriority(Enum):
     """Приоритеты задач."""
     
@@ -28,7 +36,7 @@ class TaskPriority(Enum):
     CRITICAL = "🔴 Критический"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Задача."""
 
@@ -55,11 +63,161 @@ class Task:
     pending_confirmations: Set[int] = field(default_factory=set)
     awaiting_author_confirmation: bool = False
     personal_due_dates: Dict[int, datetime] = field(default_factory=dict)
+    # Меняется при каждом изменении задачи, служит ключом кешей отображения
+    version: int = field(default_factory=lambda: next(_task_versions), compare=False, repr=False)
+    # Версия, для которой последний раз пересчитывался статус: пока она совпадает
+    # с version, повторный пересчёт ничего не изменит
+    recalculated_version: int = field(default=0, init=False, compare=False, repr=False)
+    # Состав задачи не меняется после создания, поэтому множества участников
+    # считаются один раз и дают проверку принадлежности за одно обращение
+    workgroup_ids: FrozenSet[int] = field(init=False, compare=False, repr=False)
+    participant_ids: FrozenSet[int] = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.workgroup_ids = frozenset(self.workgroup)
+        participants = {self.author_id, *self.workgroup}
+        if self.responsible_user_id:
+            participants.add(self.responsible_user_id)
+        self.participant_ids = frozenset(participants)
+
+
+def touch_task(task: Task) -> None:
+    """Отмечает изменение задачи, чтобы сбросить закешированные тексты."""
+
+    task.version = next(_task_versions)
 
 
 # Хранилище задач (временное, в памяти)
 TASKS: dict[int, Task] = {}
-_task_id_counter = 1
+# Источник ID задач: возрастающие номера, начиная с 1
+_task_ids = itertools.count(1)
+
+# Как часто (в секундах) допускается полный пересчёт статусов для просрочек
+STATUS_REFRESH_TTL = 5.0
+_last_full_refresh = float("-inf")
+
+# Очередь проверок срока: пары (срок, ID задачи) в куче по возрастанию срока.
+# Пересчёт статусов берёт из неё только задачи, чей срок уже наступил;
+# записи с устаревшим сроком пропускаются при извлечении
+_DUE_HEAP: List[tuple[datetime, int]] = []
+# Статусы, для которых срок не проверяется: завершённые и уже просроченные задачи
+_DUE_SKIPPED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.OVERDUE})
+
+# Индекс задач по статусам, обновляется при каждой смене статуса;
+# размеры множеств заодно служат счётчиками
+_TASKS_BY_STATUS: Dict[TaskStatus, Set[int]] = {status: set() for status in TaskStatus}
+
+# Индекс задач по участникам: ID пользователя -> ID задач в порядке создания.
+# Используется dict вместо set, чтобы сохранять порядок, как у обхода TASKS
+_USER_TASKS: Dict[int, Dict[int, None]] = {}
+# ID общих (не личных) задач в порядке создания: они видны всем пользователям
+_PUBLIC_TASKS: Dict[int, None] = {}
+
+# Номер ревизии хранилища: растёт при создании, удалении и смене статуса задачи
+_tasks_revision = 0
+
+
+def _bump_tasks_revision() -> None:
+    """Отмечает изменение состава или статусов задач."""
+
+    global _tasks_revision
+    _tasks_revision += 1
+
+
+def get_tasks_revision() -> int:
+    """Возвращает текущую ревизию хранилища задач для инвалидации кешей."""
+
+    return _tasks_revision
+
+
+def _set_task_status(task: Task, status: TaskStatus) -> None:
+    """Меняет статус задачи и поддерживает индекс по статусам."""
+
+    previous = task.status
+    if previous is status:
+        return
+    # Учитываем только задачи из хранилища, временные объекты счётчики не трогают
+    if TASKS.get(task.task_id) is task:
+        _TASKS_BY_STATUS[previous].discard(task.task_id)
+        _TASKS_BY_STATUS[status].add(task.task_id)
+        _bump_tasks_revision()
+        # Задача снова может просрочиться: возвращаем её в очередь проверок срока
+        if previous in _DUE_SKIPPED_STATUSES and status not in _DUE_SKIPPED_STATUSES:
+            _schedule_due_check(task)
+    task.status = status
+    touch_task(task)
+
+
+def _schedule_due_check(task: Task) -> None:
+    """Ставит проверку срока задачи в очередь, если срок задан."""
+
+    if task.due_date is not None:
+        heapq.heappush(_DUE_HEAP, (task.due_date, task.task_id))
+
+
+def _index_task(task: Task) -> None:
+    """Добавляет задачу в индекс всех её участников."""
+
+    if not task.is_private:
+        _PUBLIC_TASKS[task.task_id] = None
+    for user_id in task.participant_ids:
+        _USER_TASKS.setdefault(user_id, {})[task.task_id] = None
+
+
+def _unindex_task(task: Task) -> None:
+    """Убирает задачу из индекса участников."""
+
+    _PUBLIC_TASKS.pop(task.task_id, None)
+    for user_id in task.participant_ids:
+        user_tasks = _USER_TASKS.get(user_id)
+        if user_tasks is None:
+            continue
+        user_tasks.pop(task.task_id, None)
+        if not user_tasks:
+            del _USER_TASKS[user_id]
+
+
+def rebuild_user_tasks_index() -> None:
+    """Перестраивает индекс участников по текущему содержимому TASKS."""
+
+    _USER_TASKS.clear()
+    _PUBLIC_TASKS.clear()
+    for task in TASKS.values():
+        _index_task(task)
+
+
+def count_tasks_by_status(status: Optional[TaskStatus] = None) -> int:
+    """Возвращает количество задач с указанным статусом (или всех задач)."""
+
+    if status is None:
+        return len(TASKS)
+    return len(_TASKS_BY_STATUS[status])
+
+
+def get_tasks_by_status(status: Optional[TaskStatus] = None) -> List[Task]:
+    """Возвращает задачи с указанным статусом (или все) в порядке создания."""
+
+    if status is None:
+        return list(TASKS.values())
+    return [TASKS[task_id] for task_id in sorted(_TASKS_BY_STATUS[status])]
+
+
+def get_tasks_page_by_status(
+    status: Optional[TaskStatus],
+    start: int,
+    count: int,
+) -> List[Task]:
+    """Возвращает срез ``[start:start + count]`` из ``get_tasks_by_status(status)``.
+
+    Полный список не строится: общий список читается из хранилища по порядку,
+    а для статуса отбираются только наименьшие ID.
+    """
+
+    if status is None:
+        # Задачи хранятся в порядке создания, поэтому достаточно пропустить начало
+        return list(itertools.islice(TASKS.values(), start, start + count))
+    task_ids = heapq.nsmallest(start + count, _TASKS_BY_STATUS[status])
+    return [TASKS[task_id] for task_id in task_ids[start:]]
 
 
 def create_task(
@@ -75,7 +233,6 @@ def create_task(
     is_private: bool = False
 ) -> Task:
     """Создает новую задачу."""
-    global _task_id_counter
 
     workgroup_list = list(workgroup) if workgroup is not None else []
 
@@ -87,7 +244,7 @@ def create_task(
     participant_statuses = {participant_id: TaskStatus.NEW for participant_id in participants}
 
     task = Task(
-        task_id=_task_id_counter,
+        task_id=next(_task_ids),
         title=title,
         description=description,
         author_id=author_id,
@@ -102,8 +259,11 @@ def create_task(
         participant_statuses=participant_statuses,
     )
 
-    TASKS[_task_id_counter] = task
-    _task_id_counter += 1
+    TASKS[task.task_id] = task
+    _index_task(task)
+    _TASKS_BY_STATUS[task.status].add(task.task_id)
+    _schedule_due_check(task)
+    _bump_tasks_revision()
 
     refresh_task_status(task)
 
@@ -117,24 +277,21 @@ def get_task(task_id: int) -> Optional[Task]:
 
 def get_user_tasks(user_id: int) -> List[Task]:
     """Возвращает задачи пользователя."""
-    user_tasks = []
 
-    for task in TASKS.values():
-        if (not task.is_private or 
-            user_id == task.author_id or 
-            user_id == task.responsible_user_id or 
-            user_id in task.workgroup):
-            user_tasks.append(task)
-
-    return user_tasks
+    # Общие задачи видны всем, личные — только участникам. ID выдаются по
+    # возрастанию, поэтому слияние двух индексов сохраняет порядок создания
+    private_ids = [
+        task_id for task_id in _USER_TASKS.get(user_id, ()) if task_id not in _PUBLIC_TASKS
+    ]
+    return [TASKS[task_id] for task_id in heapq.merge(_PUBLIC_TASKS, private_ids)]
 
 
 def update_task_status(task_id: int, status: TaskStatus) -> bool:
     """Обновляет статус задачи."""
     task = TASKS.get(task_id)
     if task:
-        task.status = status
-        if status == TaskStatus.COMPLETED:
+        _set_task_status(task, status)
+        if status is TaskStatus.COMPLETED:
             task.completed_date = datetime.now()
         return True
     return False
@@ -142,8 +299,11 @@ def update_task_status(task_id: int, status: TaskStatus) -> bool:
 
 def delete_task(task_id: int) -> bool:
     """Удаляет задачу."""
-    if task_id in TASKS:
-        del TASKS[task_id]
+    task = TASKS.pop(task_id, None)
+    if task is not None:
+        _unindex_task(task)
+        _TASKS_BY_STATUS[task.status].discard(task.task_id)
+        _bump_tasks_revision()
         return True
     return False
 
@@ -151,51 +311,91 @@ def delete_task(task_id: int) -> bool:
 def is_user_involved(task: Task, user_id: int) -> bool:
     """Проверяет, вовлечен ли пользователь в задачу."""
 
-    return (
-        user_id == task.author_id
-        or user_id == task.responsible_user_id
-        or user_id in task.workgroup
-    )
+    return user_id in task.participant_ids
 
 
 def refresh_task_status(task: Task, reference: Optional[datetime] = None) -> None:
     """Обновляет статус задачи в зависимости от срока исполнения."""
 
-    if task.status == TaskStatus.COMPLETED:
+    if task.status is TaskStatus.COMPLETED:
         return
 
     if reference is None:
         reference = datetime.now()
 
     if task.due_date and task.due_date < reference:
-        if task.status != TaskStatus.OVERDUE:
+        if task.status is not TaskStatus.OVERDUE:
             task.status_before_overdue = calculate_overall_status(task)
-        task.status = TaskStatus.OVERDUE
-    elif task.status == TaskStatus.OVERDUE:
+        _set_task_status(task, TaskStatus.OVERDUE)
+    elif task.status is TaskStatus.OVERDUE:
         if task.due_date and task.due_date >= reference:
             previous_status = task.status_before_overdue or calculate_overall_status(task)
-            task.status = previous_status
+            _set_task_status(task, previous_status)
             task.status_before_overdue = None
         elif task.due_date is None:
             previous_status = task.status_before_overdue or calculate_overall_status(task)
-            task.status = previous_status
+            _set_task_status(task, previous_status)
             task.status_before_overdue = None
     else:
         recalc_task_status(task)
 
 
+def refresh_tasks_statuses(
+    tasks: Iterable[Task],
+    reference: Optional[datetime] = None,
+) -> None:
+    """Обновляет статусы переданных задач относительно одного момента времени."""
+
+    if reference is None:
+        reference = datetime.now()
+    for task in tasks:
+        refresh_task_status(task, reference)
+
+
 def refresh_all_tasks_statuses(reference: Optional[datetime] = None) -> None:
-    """Обновляет статусы всех задач."""
+    """Обновляет статусы задач, которые могли измениться со временем.
 
-    for task in TASKS.values():
+    Явные изменения пересчитывают статус сразу, поэтому со временем меняются
+    только задачи с наступившим сроком и уже просроченные задачи, у которых
+    срок перенесли или сняли. Остальные задачи не перебираются.
+    """
+
+    global _last_full_refresh
+    if reference is None:
+        reference = datetime.now()
+
+    while _DUE_HEAP and _DUE_HEAP[0][0] < reference:
+        due_date, task_id = heapq.heappop(_DUE_HEAP)
+        task = TASKS.get(task_id)
+        # Задача удалена или её срок с тех пор менялся
+        if task is None or task.due_date != due_date:
+            continue
         refresh_task_status(task, reference)
 
+    for task_id in list(_TASKS_BY_STATUS[TaskStatus.OVERDUE]):
+        refresh_task_status(TASKS[task_id], reference)
+
+    _last_full_refresh = time.monotonic()
+
+
+def refresh_all_tasks_statuses_if_stale(max_age: float = STATUS_REFRESH_TTL) -> bool:
+    """Обновляет статусы всех задач, если с прошлого обновления прошло ``max_age`` секунд.
+
+    Возвращает ``True``, если обновление было выполнено. Явные изменения задач
+    пересчитывают статус сразу, поэтому пропуск влияет только на переход в просрочку.
+    """
+
+    if time.monotonic() - _last_full_refresh < max_age:
+        return False
+    refresh_all_tasks_statuses()
+    return True
+
 
 def get_involved_tasks(user_id: int) -> List[Task]:
     """Возвращает задачи, в которых участвует пользователь."""
 
-    refresh_all_tasks_statuses()
-    return [task for task in TASKS.values() if is_user_involved(task, user_id)]
+    refresh_all_tasks_statuses_if_stale()
+    return [TASKS[task_id] for task_id in _USER_TASKS.get(user_id, ())]
 
 
 def record_task_action(task: Task, user_id: int, action: str) -> None:
@@ -204,41 +404,53 @@ def record_task_action(task: Task, user_id: int, action: str) -> None:
     task.last_action = action
     task.last_actor_id = user_id
     task.last_action_time = datetime.now()
+    # Обработчики меняют поля задачи напрямую и завершают действие этой записью
+    touch_task(task)
 
 
-def get_task_participants(task: Task) -> Set[int]:
-    """Возвращает множество участников задачи."""
+def get_task_participants(task: Task) -> FrozenSet[int]:
+    """Возвращает множество участников задачи.
 
-    participants: Set[int] = {task.author_id}
-    if task.responsible_user_id:
-        participants.add(task.responsible_user_id)
-    participants.update(task.workgroup)
-    return participants
+    Множество общее с задачей и неизменяемое, поэтому не копируется.
+    """
+
+    return task.participant_ids
 
 
 def ensure_participant_entry(task: Task, user_id: int) -> None:
     """Гарантирует наличие записи о статусе участника."""
 
-    if user_id not in task.participant_statuses:
-        task.participant_statuses[user_id] = TaskStatus.NEW
+    task.participant_statuses.setdefault(user_id, TaskStatus.NEW)
 
 
 def set_personal_due_date(task: Task, user_id: int, due_date: datetime) -> None:
     """Сохраняет персональный срок сдачи для участника."""
 
     task.personal_due_dates[user_id] = due_date
+    touch_task(task)
+
+
+def set_task_due_date(task: Task, due_date: Optional[datetime]) -> None:
+    """Меняет общий срок задачи и ставит новую проверку срока."""
+
+    task.due_date = due_date
+    touch_task(task)
+    if TASKS.get(task.task_id) is task and task.status not in _DUE_SKIPPED_STATUSES:
+        _schedule_due_check(task)
 
 
 def clear_personal_due_date(task: Task, user_id: int) -> None:
     """Удаляет индивидуальный срок сдачи участника."""
 
     task.personal_due_dates.pop(user_id, None)
+    touch_task(task)
 
 
 def clear_all_personal_due_dates(task: Task) -> None:
     """Удаляет все персональные сроки сдачи."""
 
     task.personal_due_dates.clear()
+    touch_task(task)
 
 
 def get_personal_due_date(task: Task, user_id: int) -> Optional[datetime]:
@@ -250,8 +462,13 @@ def get_personal_due_date(task: Task, user_id: int) -> Optional[datetime]:
 def set_participant_status(task: Task, user_id: int, status: TaskStatus) -> None:
     """Устанавливает индивидуальный статус участника."""
 
-    ensure_participant_entry(task, user_id)
+    # Повторная установка того же статуса ничего не меняет. Статусы участников
+    # и подтверждения меняются только функциями этого модуля, а они сразу
+    # пересчитывают статус автора, поэтому он уже согласован
+    if task.participant_statuses.get(user_id) is status:
+        return
     task.participant_statuses[user_id] = status
+    touch_task(task)
     if user_id != task.author_id:
         _sync_author_status(task)
 
@@ -259,16 +476,18 @@ def set_participant_status(task: Task, user_id: int, status: TaskStatus) -> None
 def set_all_participants_status(task: Task, status: TaskStatus) -> None:
     """Устанавливает единый статус для всех участников."""
 
-    for participant_id in get_task_participants(task):
-        set_participant_status(task, participant_id, status)
+    # Статус автора синхронизируется один раз после записи всех статусов
+    statuses = task.participant_statuses
+    for participant_id in task.participant_ids:
+        statuses[participant_id] = status
+    touch_task(task)
     _sync_author_status(task)
 
 
 def get_participant_status(task: Task, user_id: int) -> TaskStatus:
     """Возвращает статус участника задачи."""
 
-    ensure_participant_entry(task, user_id)
-    return task.participant_statuses[user_id]
+    return task.participant_statuses.setdefault(user_id, TaskStatus.NEW)
 
 
 def get_effective_due_date(task: Task, user_id: Optional[int]) -> Optional[datetime]:
@@ -277,7 +496,7 @@ def get_effective_due_date(task: Task, user_id: Optional[int]) -> Optional[datet
     if user_id is None:
         return task.due_date
 
-    if user_id in {task.author_id, task.responsible_user_id}:
+    if user_id == task.author_id or user_id == task.responsible_user_id:
         return task.due_date
 
     return get_personal_due_date(task, user_id) or task.due_date
@@ -289,92 +508,98 @@ def get_personal_status_for_user(task: Task, user_id: Optional[int]) -> TaskStat
     if user_id is None:
         return task.status
 
-    if user_id not in get_task_participants(task):
+    if user_id not in task.participant_ids:
         return task.status
 
-    ensure_participant_entry(task, user_id)
-    return task.participant_statuses[user_id]
+    return task.participant_statuses.setdefault(user_id, TaskStatus.NEW)
+
+
+def _summarize_participants(task: Task) -> Optional[TaskStatus]:
+    """Сводит статусы участников, кроме автора, к одному за один проход.
+
+    Возвращает ``None``, если других участников у задачи нет.
+    """
+
+    statuses = task.participant_statuses
+    author_id = task.author_id
+    seen = has_paused = False
+    all_completed = True
+    for participant_id in task.participant_ids:
+        if participant_id == author_id:
+            continue
+        seen = True
+        status = statuses.get(participant_id, TaskStatus.NEW)
+        # Хотя бы один участник в работе определяет итог сразу
+        if status is TaskStatus.ACTIVE:
+            return TaskStatus.ACTIVE
+        if status is TaskStatus.PAUSED:
+            has_paused = True
+        elif status is not TaskStatus.COMPLETED:
+            all_completed = False
+
+    if not seen:
+        return None
+    if has_paused:
+        return TaskStatus.PAUSED
+    if all_completed:
+        return TaskStatus.COMPLETED
+    return TaskStatus.NEW
 
 
 def _sync_author_status(task: Task) -> None:
     """Синхронизирует статус автора с текущей активностью участников."""
 
-    participants = [
-        participant_id
-        for participant_id in get_task_participants(task)
-        if participant_id != task.author_id
-    ]
+    summary = _summarize_participants(task)
 
     # Если других участников нет, оставляем статус автора без изменений.
-    if not participants:
+    if summary is None:
         return
 
-    ensure_participant_entry(task, task.author_id)
+    task.participant_statuses[task.author_id] = _overall_status(task, summary)
 
-    if task.awaiting_author_confirmation and task.pending_confirmations:
-        task.participant_statuses[task.author_id] = TaskStatus.IN_REVIEW
-        return
 
-    participant_statuses = [
-        get_participant_status(task, participant_id)
-        for participant_id in participants
-    ]
-
-    if any(status == TaskStatus.ACTIVE for status in participant_statuses):
-        task.participant_statuses[task.author_id] = TaskStatus.ACTIVE
-        return
-
-    if any(status == TaskStatus.PAUSED for status in participant_statuses):
-        task.participant_statuses[task.author_id] = TaskStatus.PAUSED
-        return
-
-    if all(status == TaskStatus.COMPLETED for status in participant_statuses):
-        task.participant_statuses[task.author_id] = TaskStatus.COMPLETED
-        return
-
-    task.participant_statuses[task.author_id] = TaskStatus.NEW
-
-
-def calculate_overall_status(task: Task) -> TaskStatus:
-    """Определяет общий статус задачи на основе действий участников."""
-
-    participants = [
-        get_participant_status(task, participant_id)
-        for participant_id in get_task_participants(task)
-        if participant_id != task.author_id
-    ]
+def _overall_status(task: Task, summary: Optional[TaskStatus]) -> TaskStatus:
+    """Определяет общий статус по сводке статусов участников."""
 
     if task.awaiting_author_confirmation and task.pending_confirmations:
         return TaskStatus.IN_REVIEW
 
-    if not participants:
-        return TaskStatus.NEW
-
-    if all(status == TaskStatus.COMPLETED for status in participants):
-        return TaskStatus.COMPLETED
-
-    if any(status == TaskStatus.ACTIVE for status in participants):
-        return TaskStatus.ACTIVE
+    return summary or TaskStatus.NEW
 
-    if any(status == TaskStatus.PAUSED for status in participants):
-        return TaskStatus.PAUSED
 
-    if any(status == TaskStatus.NEW for status in participants):
-        return TaskStatus.NEW
+def calculate_overall_status(task: Task) -> TaskStatus:
+    """Определяет общий статус задачи на основе действий участников."""
 
-    return TaskStatus.NEW
+    return _overall_status(task, _summarize_participants(task))
 
 
 def recalc_task_status(task: Task) -> None:
     """Пересчитывает общий статус задачи."""
 
-    new_status = calculate_overall_status(task)
-    if task.status == TaskStatus.OVERDUE:
+    if task.recalculated_version == task.version:
+        return
+
+    # Одна сводка участников даёт и общий статус, и статус автора:
+    # при наличии других участников они совпадают
+    summary = _summarize_participants(task)
+    new_status = _overall_status(task, summary)
+    if task.status is TaskStatus.OVERDUE:
         task.status_before_overdue = new_status
     else:
-        task.status = new_status
+        _set_task_status(task, new_status)
         task.status_before_overdue = None
-    _sync_author_status(task)
+    if summary is not None and task.participant_statuses.get(task.author_id) is not new_status:
+        task.participant_statuses[task.author_id] = new_status
+        touch_task(task)
+    task.recalculated_version = task.version
+
+
+def reset_status_before_overdue(task: Task) -> None:
+    """Забывает статус до просрочки, чтобы пересчёт определил его заново."""
+
+    if task.status_before_overdue is not None:
+        task.status_before_overdue = None
+        touch_task(task)
 
 
 def add_pending_confirmation(task: Task, user_id: int) -> None:
@@ -382,16 +607,17 @@ def add_pending_confirmation(task: Task, user_id: int) -> None:
 
     task.pending_confirmations.add(user_id)
     task.awaiting_author_confirmation = True
+    touch_task(task)
     recalc_task_status(task)
 
 
 def remove_pending_confirmation(task: Task, user_id: int) -> None:
     """Удаляет участника из списка ожидающих подтверждения."""
 
-    if user_id in task.pending_confirmations:
-        task.pending_confirmations.remove(user_id)
+    task.pending_confirmations.discard(user_id)
     if not task.pending_confirmations:
         task.awaiting_author_confirmation = False
+    touch_task(task)
     recalc_task_status(task)
 
 
@@ -400,4 +626,5 @@ def clear_pending_confirmations(task: Task) -> None:
 
     task.pending_confirmations.clear()
     task.awaiting_author_confirmation = False
+    touch_task(task)
     recalc_task_status(task)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
@@ -14,11 +14,12 @@ class User:
     full_name: str
     role: Optional[str] = None
     username: Optional[str] = None
+    # Имя без фамилии, вычисляется один раз при создании
+    first_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def first_name(self) -> str:
-        """Возвращает имя пользователя без фамилии."""
-        return self.full_name.split()[0]
+    def __post_init__(self) -> None:
+        parts = self.full_name.split(maxsplit=1)
+        object.__setattr__(self, "first_name", parts[0] if parts else "")
 
 
 USERS: Dict[int, User] = {
@@ -90,34 +91,24 @@ USER_DIRECTIONS: Dict[int, tuple[str, ...]] = {
 }
 
 
-def _normalize_direction(direction: str) -> Optional[str]:
-    """Приводит значение направления к стандартному коду."""
-
-    if not direction:
-        return None
-
-    normalized = direction.strip().lower()
+def _build_direction_lookup() -> Dict[str, str]:
+    """Собирает все допустимые написания направлений в один словарь."""
 
-    # Сначала пытаемся найти точное совпадение с кодом
-    if normalized in DIRECTION_LABELS:
-        return normalized
+    # Первым совпадением считается точный код, затем названия в порядке
+    # DIRECTION_LABELS, поэтому более ранние варианты не перезаписываются
+    lookup: Dict[str, str] = {code: code for code in DIRECTION_LABELS}
 
-    # Проверяем совпадение с полным названием направления
     for code, label in DIRECTION_LABELS.items():
         label_lower = label.lower()
-        if normalized == label_lower:
-            return code
+        lookup.setdefault(label_lower, code)
 
         # Учитываем короткое обозначение в скобках
         if "(" in label_lower and ")" in label_lower:
             short_name = label_lower.split("(")[-1].split(")")[0].strip()
-            if normalized == short_name:
-                return code
+            lookup.setdefault(short_name, code)
 
         # Учитываем форму без скобок и лишних символов
-        stripped_label = label_lower.split("(")[0].strip()
-        if normalized == stripped_label:
-            return code
+        lookup.setdefault(label_lower.split("(")[0].strip(), code)
 
     # Дополнительные ручные алиасы для часто встречающихся вариантов
     aliases = {
@@ -126,8 +117,26 @@ def _normalize_direction(direction: str) -> Optional[str]:
         "нниа": "nnia",
         "все": "all",
     }
+    for alias, code in aliases.items():
+        lookup.setdefault(alias, code)
+
+    return lookup
+
+
+_DIRECTION_LOOKUP = _build_direction_lookup()
+
+
+def _normalize_direction(direction: str) -> Optional[str]:
+    """Приводит значение направления к стандартному коду."""
+
+    if not direction:
+        return None
 
-    return aliases.get(normalized)
+    # Обычно передаётся уже готовый код направления
+    code = _DIRECTION_LOOKUP.get(direction)
+    if code is not None:
+        return code
+    return _DIRECTION_LOOKUP.get(direction.strip().lower())
 
 
 def get_direction_label(direction: str) -> str:
@@ -139,25 +148,38 @@ def get_direction_label(direction: str) -> str:
     return DIRECTION_LABELS[code]
 
 
+# Обратный индекс направлений: код -> пользователи в порядке USER_DIRECTIONS,
+# и ID пользователя -> множество его направлений
+_DIRECTION_USERS: Dict[str, tuple[User, ...]] = {}
+_USER_DIRECTION_SETS: Dict[int, frozenset[str]] = {}
+
+
+def rebuild_direction_index() -> None:
+    """Перестраивает обратный индекс направлений по USERS и USER_DIRECTIONS."""
+
+    _USER_DIRECTION_SETS.clear()
+    for user_id, user_directions in USER_DIRECTIONS.items():
+        _USER_DIRECTION_SETS[user_id] = frozenset(user_directions)
+
+    _DIRECTION_USERS.clear()
+    _DIRECTION_USERS["all"] = tuple(USERS.values())
+    for code in DIRECTION_LABELS:
+        if code == "all":
+            continue
+        _DIRECTION_USERS[code] = tuple(
+            USERS[user_id]
+            for user_id, user_directions in _USER_DIRECTION_SETS.items()
+            if (code in user_directions or "all" in user_directions) and user_id in USERS
+        )
+
+
 def get_users_by_direction(direction: str) -> List[User]:
     """Возвращает список пользователей по направлению."""
 
     code = _normalize_direction(direction)
     if code is None:
         return []
-
-    if code == "all":
-        return list(USERS.values())
-
-    result: List[User] = []
-
-    for user_id, user_directions in USER_DIRECTIONS.items():
-        if code in user_directions or "all" in user_directions:
-            user = USERS.get(user_id)
-            if user is not None:
-                result.append(user)
-
-    return result
+    return list(_DIRECTION_USERS[code])
 
 
 def is_user_in_direction(user_id: int, direction: str) -> bool:
@@ -167,5 +189,8 @@ def is_user_in_direction(user_id: int, direction: str) -> bool:
     if code is None:
         return False
 
-    user_directions = USER_DIRECTIONS.get(user_id, ())
+    user_directions = _USER_DIRECTION_SETS.get(user_id, frozenset())
     return code in user_directions or "all" in user_directions
+
+
+rebuild_direction_index()
@@ -0,0 +1,39 @@
+"""Проверки разбора контекста из данных коллбэков действий с задачами."""
+
+import pytest
+
+from tbot.bot import (
+    extract_action_context,
+    extract_confirmation_context,
+    extract_reminder_context,
+)
+
+
+def test_action_context_full_format() -> None:
+    assert extract_action_context("take_task:12:my:review:3", "take_task") == (12, "my", "review", 3)
+
+
+def test_action_context_legacy_format() -> None:
+    assert extract_action_context("take_task_7", "take_task") == (7, "notify", "all", 1)
+
+
+@pytest.mark.parametrize(
+    "callback_data",
+    [
+        "take_task:x:my:all:1",
+        "take_task:1:my:all",
+        "take_task:1:my:all:1:extra",
+        "pause_task:1:my:all:1",
+        "take_task_abc",
+        "take_task_²",
+    ],
+)
+def test_action_context_falls_back_to_default(callback_data: str) -> None:
+    assert extract_action_context(callback_data, "take_task") == (0, "notify", "all", 1)
+
+
+def test_participant_contexts() -> None:
+    assert extract_confirmation_context("confirm_completion:5:42:notify:all:1") == (5, 42, "notify", "all", 1)
+    assert extract_reminder_context("remind_one:5:42:all:active:2") == (5, 42, "all", "active", 2)
+    assert extract_reminder_context("confirm_completion:5:42:notify:all:1") == (0, 0, "notify", "all", 1)
+    assert extract_confirmation_context("confirm_completion:5:x:notify:all:1") == (0, 0, "notify", "all", 1)
@@ -0,0 +1,43 @@
+"""Проверки форматирования дат в сообщениях бота."""
+
+from datetime import datetime
+
+import pytest
+
+from tbot.bot import format_date, format_datetime, parse_date
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 5, 7, 3),
+        datetime(2024, 12, 31, 23, 59),
+        datetime(2025, 10, 1, 0, 0),
+    ],
+)
+def test_formatting_matches_strftime(value: datetime) -> None:
+    """Форматирование должно совпадать с прежним выводом strftime."""
+
+    assert format_date(value) == value.strftime("%d.%m.%Y")
+    assert format_datetime(value) == value.strftime("%d.%m.%Y %H:%M")
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["05.01.2024", "5.1.2024", "05-01-2024", "05-01.2024", "29.02.2024", "31.02.2024", "29.02.2023", "32.01.2024"],
+)
+def test_parsing_matches_strptime(text: str) -> None:
+    """Разбор даты должен совпадать с прежним разбором через strptime."""
+
+    try:
+        expected = datetime.strptime(text.replace("-", "."), "%d.%m.%Y")
+    except ValueError:
+        expected = None
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "05.01.24", "05/01/2024", "завтра", "05.01.20245", "٠٥.٠١.٢٠٢٤"])
+def test_parsing_rejects_malformed_input(text: str) -> None:
+    """Строки не в формате ДД.ММ.ГГГГ должны отклоняться."""
+
+    assert parse_date(text) is None
@@ -0,0 +1,52 @@
+"""Проверки справочника направлений."""
+
+import pytest
+
+from tbot.users import (
+    DIRECTION_LABELS,
+    USER_DIRECTIONS,
+    USERS,
+    get_direction_label,
+    get_users_by_direction,
+    is_user_in_direction,
+)
+
+
+@pytest.mark.parametrize(
+    ("direction", "code"),
+    [
+        ("stn", "stn"),
+        (" NOIM ", "noim"),
+        ("Организационно-аналитическое направление (ОАН)", "oan"),
+        ("НМСД", "nmsd"),
+        ("направление набора и адаптации", "nnia"),
+        ("нниа", "nnia"),
+        ("Все", "all"),
+    ],
+)
+def test_direction_spellings_resolve_to_code(direction: str, code: str) -> None:
+    """Код, полное и короткое название и алиасы должны приводить к одному направлению."""
+
+    assert get_direction_label(direction) == DIRECTION_LABELS[code]
+
+
+def test_unknown_direction_is_returned_as_is() -> None:
+    assert get_direction_label("Неизвестное") == "Неизвестное"
+    assert get_direction_label("") == ""
+
+
+def test_direction_users_include_all_directions_members() -> None:
+    """Пользователи со всеми направлениями попадают в каждое направление."""
+
+    for code in DIRECTION_LABELS:
+        expected = [
+            user
+            for user_id, user in USERS.items()
+            if code == "all"
+            or code in USER_DIRECTIONS.get(user_id, ())
+            or "all" in USER_DIRECTIONS.get(user_id, ())
+        ]
+        assert get_users_by_direction(DIRECTION_LABELS[code]) == expected
+        if code != "all":
+            assert all(is_user_in_direction(user.user_id, code) for user in expected)
+    assert get_users_by_direction("Неизвестное") == []
@@ -0,0 +1,73 @@
+"""Проверки сериализации черновиков задач для FSM-хранилища."""
+
+import json
+from datetime import datetime
+
+from aiogram.fsm.storage.memory import MemoryStorage
+
+from tbot.bot import TaskDraft, build_storage, decode_fsm_draft, encode_fsm_draft
+from tbot.tasks import TaskPriority
+
+
+def test_draft_roundtrip_is_json_compatible() -> None:
+    """Черновик должен переживать JSON-сериализацию без потерь."""
+
+    draft = {
+        "author_id": 1,
+        "created_date": datetime(2024, 5, 1, 12, 30),
+        "due_date": datetime(2024, 5, 11, 12, 30),
+        "priority": TaskPriority.HIGH,
+        "project": "caps",
+        "direction": "stn",
+        "responsible_users": {3},
+        "workgroup_users": {9, 4},
+        "is_private": False,
+        "message_id": 42,
+    }
+
+    encoded = encode_fsm_draft(draft)
+    assert encoded["workgroup_users"] == [4, 9]
+    assert encoded["priority"] == "HIGH"
+
+    restored = decode_fsm_draft(json.loads(json.dumps(encoded)))
+    assert restored == draft
+
+
+def test_draft_without_optional_fields() -> None:
+    """Незаполненные поля черновика не должны появляться при разборе."""
+
+    draft = {"author_id": 1, "due_date": None, "responsible_users": set()}
+
+    restored = decode_fsm_draft(json.loads(json.dumps(encode_fsm_draft(draft))))
+    assert restored == draft
+    assert "priority" not in restored
+
+
+def test_task_draft_roundtrip_keeps_unset_due_date() -> None:
+    """Непройденный шаг срока должен отличаться от пропущенного после сохранения."""
+
+    draft = TaskDraft(author_id=1, message_id=7, title="Черновик", workgroup_users={5, 2})
+    restored = TaskDraft.from_fsm(json.loads(json.dumps(draft.to_fsm())))
+    assert restored == draft
+    assert "due_date" not in draft.to_fsm()
+
+    draft.due_date = None
+    restored = TaskDraft.from_fsm(json.loads(json.dumps(draft.to_fsm())))
+    assert restored.due_date is None
+
+
+def test_task_draft_ignores_unknown_keys() -> None:
+    """Черновик от прежней версии бота с лишними ключами должен восстанавливаться."""
+
+    data = TaskDraft(author_id=1, title="Черновик").to_fsm()
+    data["obsolete_field"] = 42
+    restored = TaskDraft.from_fsm(json.loads(json.dumps(data)))
+    assert restored.title == "Черновик"
+    assert not hasattr(restored, "obsolete_field")
+
+
+def test_memory_storage_without_redis_url() -> None:
+    """Без адреса Redis должно использоваться хранилище в памяти."""
+
+    assert isinstance(build_storage(None), MemoryStorage)
+    assert isinstance(build_storage(""), MemoryStorage)
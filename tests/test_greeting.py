@@ -5,7 +5,8 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
-from tbot.greeting import determine_greeting, greet_user
+import tbot.greeting as greeting
+from tbot.greeting import ACCESS_DENIED_MESSAGE, determine_greeting, greet_user
 from tbot.users import User
 
 MOSCOW_TZ = ZoneInfo("Europe/Moscow")
@@ -30,6 +31,13 @@ def test_determine_greeting_ranges():
         assert determine_greeting(dt) == expected
 
 
+def test_determine_greeting_inside_last_minute():
+    """Секунды внутри последней минуты диапазона не должны давать дефолтное приветствие."""
+
+    assert determine_greeting(datetime(2024, 1, 1, 10, 59, 30, tzinfo=MOSCOW_TZ)) == "Доброе утро"
+    assert determine_greeting(datetime(2024, 1, 1, 23, 59, 59, tzinfo=MOSCOW_TZ)) == "Доброй ночи"
+
+
 def test_greet_user_known_user(monkeypatch):
     """Проверяем формирование приветствия для пользователя из белого списка."""
 
@@ -46,6 +54,7 @@ def test_greet_user_unknown_user_logs_warning(caplog):
     with caplog.at_level("WARNING"):
         message = greet_user(999, current_time=fake_time, users={})
     assert message == "Доступ ограничен. Обратитесь к администратору системы задач."
+    assert message is ACCESS_DENIED_MESSAGE
     assert "Попытка доступа" in caplog.text
 
 
@@ -56,3 +65,16 @@ def test_greet_user_handles_naive_datetime():
     user = User(user_id=2, full_name="Иван Иванов")
     message = greet_user(2, current_time=fake_time, users={2: user})
     assert message == "Доброе утро, Иван!"
+
+
+def test_moscow_now_is_shared_within_a_second(monkeypatch):
+    """В пределах одной секунды все приветствия используют один объект времени."""
+
+    clock = iter([5_000_000_000, 5_900_000_000, 6_000_000_000])
+    monkeypatch.setattr(greeting, "monotonic_ns", lambda: next(clock))
+    monkeypatch.setattr(greeting, "_NOW_CACHE", None)
+
+    first = greeting._moscow_now()
+    assert greeting._moscow_now() is first
+    assert greeting._moscow_now() is not first
+    assert first.tzinfo is MOSCOW_TZ
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from datetime import datetime
 
-from tbot.bot import notify_task_participants
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendMessage
+
+from tbot.bot import _SendRateLimiter, build_task_notifications, notify_task_participants
 from tbot.tasks import Task, TaskPriority
 
 
@@ -47,3 +51,88 @@ def test_workgroup_members_do_not_notify_each_other() -> None:
     assert 609995295 in recipients
     assert 1311714242 not in recipients
     assert 678543417 not in recipients
+
+
+def test_notifications_keep_task_state_at_build_time() -> None:
+    task = Task(
+        task_id=1,
+        title="Исходное название",
+        description="",
+        author_id=7247710860,
+        created_date=datetime.now(),
+        due_date=None,
+        priority=TaskPriority.MEDIUM,
+        responsible_user_id=609995295,
+    )
+
+    notifications = build_task_notifications(
+        task,
+        actor_id=609995295,
+        action_description="взял задачу в работу.",
+        keyboard_builder=lambda recipient: None if task.title == "Исходное название" else object(),
+    )
+    task.title = "Новое название"
+
+    assert [recipient for recipient, *_ in notifications] == [7247710860]
+    _, text, reply_markup = notifications[0]
+    assert "Исходное название" in text
+    assert reply_markup is None
+
+
+class FloodLimitedBot(DummyBot):
+    """Бот, который один раз отвечает ограничением частоты запросов."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.rejected = False
+
+    async def send_message(self, chat_id: int, text: str, reply_markup=None) -> None:
+        if not self.rejected:
+            self.rejected = True
+            raise TelegramRetryAfter(
+                method=SendMessage(chat_id=chat_id, text=text),
+                message="Flood control exceeded",
+                retry_after=0,
+            )
+        await super().send_message(chat_id, text, reply_markup)
+
+
+def test_notification_is_retried_after_flood_limit() -> None:
+    task = Task(
+        task_id=2,
+        title="Повтор отправки",
+        description="",
+        author_id=7247710860,
+        created_date=datetime.now(),
+        due_date=None,
+        priority=TaskPriority.MEDIUM,
+        responsible_user_id=609995295,
+    )
+
+    bot = FloodLimitedBot()
+
+    asyncio.run(
+        notify_task_participants(
+            bot,
+            task,
+            actor_id=7247710860,
+            action_description="проверяет повторную отправку.",
+        )
+    )
+
+    assert bot.rejected
+    assert [chat_id for chat_id, *_ in bot.sent_messages] == [609995295]
+
+
+def test_rate_limiter_allows_burst_then_paces() -> None:
+    limiter = _SendRateLimiter(20)
+
+    async def acquire_many(count: int) -> float:
+        started = time.monotonic()
+        for _ in range(count):
+            await limiter.acquire()
+        return time.monotonic() - started
+
+    # Первые 20 отправок укладываются в запас ведра, следующие ждут своего слота
+    assert asyncio.run(acquire_many(20)) < 0.04
+    assert asyncio.run(acquire_many(3)) >= 0.1
@@ -1,6 +1,6 @@
 """Проверки индивидуальных статусов участников задачи."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from tbot.tasks import (
     Task,
@@ -8,6 +8,10 @@ from tbot.tasks import (
     TaskStatus,
     get_participant_status,
     recalc_task_status,
+    refresh_task_status,
+    remove_pending_confirmation,
+    reset_status_before_overdue,
+    set_all_participants_status,
     set_participant_status,
 )
 
@@ -25,11 +29,9 @@ def _make_task() -> Task:
         priority=TaskPriority.MEDIUM,
         responsible_user_id=2,
         workgroup=[3, 4],
+        participant_statuses=dict.fromkeys((1, 2, 3, 4), TaskStatus.NEW),
     )
 
-    for participant_id in {1, 2, 3, 4}:
-        task.participant_statuses[participant_id] = TaskStatus.NEW
-
     return task
 
 
@@ -101,3 +103,92 @@ def test_author_pause_when_responsible_paused() -> None:
     assert get_participant_status(task, 1) is TaskStatus.PAUSED
     assert get_participant_status(task, 3) is TaskStatus.NEW
     assert get_participant_status(task, 4) is TaskStatus.NEW
+
+
+def test_completion_requires_every_participant() -> None:
+    """Задача завершается только когда все участники, кроме автора, завершили работу."""
+
+    task = _make_task()
+
+    set_participant_status(task, 2, TaskStatus.COMPLETED)
+    set_participant_status(task, 3, TaskStatus.PAUSED)
+    set_participant_status(task, 4, TaskStatus.COMPLETED)
+    recalc_task_status(task)
+    assert task.status is TaskStatus.PAUSED
+    assert get_participant_status(task, 1) is TaskStatus.PAUSED
+
+    set_participant_status(task, 3, TaskStatus.COMPLETED)
+    recalc_task_status(task)
+    assert task.status is TaskStatus.COMPLETED
+    assert get_participant_status(task, 1) is TaskStatus.COMPLETED
+
+
+def test_repeated_recalc_keeps_version() -> None:
+    """Повторный пересчёт без изменений не меняет версию, изменение пересчитывается."""
+
+    task = _make_task()
+
+    set_participant_status(task, 3, TaskStatus.ACTIVE)
+    recalc_task_status(task)
+    version = task.version
+    recalc_task_status(task)
+    assert task.version == version
+
+    set_participant_status(task, 3, TaskStatus.PAUSED)
+    recalc_task_status(task)
+    assert task.status is TaskStatus.PAUSED
+    assert get_participant_status(task, 1) is TaskStatus.PAUSED
+
+
+def _make_overdue_task() -> Task:
+    """Создаёт просроченную задачу с пересчитанным статусом."""
+
+    task = _make_task()
+    task.due_date = datetime.now() - timedelta(days=1)
+    refresh_task_status(task)
+    assert task.status is TaskStatus.OVERDUE
+    return task
+
+
+def test_overdue_take_remembers_active_status() -> None:
+    """Взятие просроченной задачи в работу должно запоминать статус до просрочки."""
+
+    task = _make_overdue_task()
+
+    # Та же последовательность, что в обработчике взятия задачи
+    set_participant_status(task, 3, TaskStatus.ACTIVE)
+    remove_pending_confirmation(task, 3)
+    reset_status_before_overdue(task)
+    recalc_task_status(task)
+
+    assert task.status is TaskStatus.OVERDUE
+    assert task.status_before_overdue is TaskStatus.ACTIVE
+
+
+def test_overdue_pause_remembers_paused_status() -> None:
+    """Пауза просроченной задачи должна запоминать статус паузы до просрочки."""
+
+    task = _make_overdue_task()
+
+    set_participant_status(task, 3, TaskStatus.PAUSED)
+    reset_status_before_overdue(task)
+    recalc_task_status(task)
+
+    assert task.status is TaskStatus.OVERDUE
+    assert task.status_before_overdue is TaskStatus.PAUSED
+
+
+def test_same_status_keeps_version_and_author_status() -> None:
+    """Повторный статус участника не меняет версию, статус автора уже согласован."""
+
+    task = _make_task()
+
+    set_participant_status(task, 3, TaskStatus.ACTIVE)
+    set_all_participants_status(task, TaskStatus.PAUSED)
+    set_participant_status(task, 3, TaskStatus.ACTIVE)
+    version = task.version
+
+    set_participant_status(task, 3, TaskStatus.ACTIVE)
+
+    assert task.version == version
+    assert get_participant_status(task, 1) is TaskStatus.ACTIVE
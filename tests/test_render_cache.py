@@ -0,0 +1,77 @@
+"""Проверки кеширования текстов списков и карточек задач."""
+
+from tbot.bot import build_task_detail_text, build_tasks_list_text
+from tbot.caching import BoundedCache
+from tbot.tasks import (
+    TaskPriority,
+    TaskStatus,
+    create_task,
+    delete_task,
+    record_task_action,
+    set_participant_status,
+)
+
+
+def test_bounded_cache_evicts_least_recent() -> None:
+    """При переполнении должна вытесняться давно не использованная запись."""
+
+    cache: BoundedCache[str, int] = BoundedCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_detail_text_is_reused_until_task_changes() -> None:
+    """Карточка без изменений берётся из кеша, после изменения строится заново."""
+
+    task = create_task("Кеш карточки", "", 701, TaskPriority.LOW, responsible_user_id=702)
+
+    first = build_task_detail_text(task, 701)
+    assert build_task_detail_text(task, 701) is first
+
+    set_participant_status(task, 702, TaskStatus.ACTIVE)
+    assert build_task_detail_text(task, 701) is not first
+
+    version = task.version
+    record_task_action(task, 702, "Проверка кеша")
+    assert task.version != version
+    assert "Проверка кеша" in build_task_detail_text(task, 701)
+
+    delete_task(task.task_id)
+
+
+def test_list_text_tracks_page_task_versions() -> None:
+    """Список страницы должен перестраиваться при изменении любой задачи на ней."""
+
+    task = create_task("Кеш списка", "", 703, TaskPriority.HIGH, responsible_user_id=704)
+
+    first = build_tasks_list_text([task], "все", 1, 703)
+    assert build_tasks_list_text([task], "все", 1, 703) is first
+    assert build_tasks_list_text([task], "новые", 1, 703) is not first
+
+    task.title = "Кеш списка (изменён)"
+    record_task_action(task, 703, "Переименовал задачу")
+    assert "изменён" in build_tasks_list_text([task], "все", 1, 703)
+
+    delete_task(task.task_id)
+
+
+def test_detail_text_is_shared_by_equivalent_viewers() -> None:
+    """Участники с одинаковым статусом и сроком должны получать один и тот же текст."""
+
+    task = create_task("Общая карточка", "", 705, TaskPriority.LOW, workgroup=[706, 707])
+
+    shared = build_task_detail_text(task, 706)
+    assert build_task_detail_text(task, 707) is shared
+    assert build_task_detail_text(task, 705) is not shared
+
+    set_participant_status(task, 707, TaskStatus.ACTIVE)
+    assert build_task_detail_text(task, 706) != build_task_detail_text(task, 707)
+
+    delete_task(task.task_id)
@@ -42,13 +42,11 @@ def _make_task() -> Task:
         priority=TaskPriority.MEDIUM,
         responsible_user_id=RESPONSIBLE_ID,
         workgroup=list(WORKGROUP_IDS),
+        participant_statuses=dict.fromkeys(
+            (AUTHOR_ID, RESPONSIBLE_ID, *WORKGROUP_IDS), TaskStatus.NEW
+        ),
     )
 
-    participants = {AUTHOR_ID, RESPONSIBLE_ID, *WORKGROUP_IDS}
-
-    for participant_id in participants:
-        task.participant_statuses[participant_id] = TaskStatus.NEW
-
     return task
 
 
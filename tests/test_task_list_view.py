@@ -0,0 +1,44 @@
+"""Проверки разбиения списка задач на страницы."""
+
+from datetime import datetime
+
+import pytest
+
+from tbot.bot import TASKS_PER_PAGE, TaskListView
+from tbot.tasks import Task, TaskPriority
+
+
+def _make_tasks(count: int) -> list[Task]:
+    """Создаёт список задач без регистрации в хранилище."""
+
+    return [
+        Task(
+            task_id=task_id,
+            title=f"Задача {task_id}",
+            description="",
+            author_id=1,
+            created_date=datetime.now(),
+            due_date=None,
+            priority=TaskPriority.LOW,
+        )
+        for task_id in range(1, count + 1)
+    ]
+
+
+@pytest.mark.parametrize("count", [0, 1, TASKS_PER_PAGE, TASKS_PER_PAGE + 1, TASKS_PER_PAGE * 3 - 2])
+def test_pages_cover_all_tasks(count: int) -> None:
+    """Страницы должны покрывать весь список без пропусков и повторов."""
+
+    tasks = _make_tasks(count)
+    task_list = TaskListView.build(tasks, "все")
+
+    collected = [
+        task
+        for page in range(1, task_list.total_pages + 1)
+        for task in task_list.page_tasks(page)
+    ]
+
+    assert collected == tasks
+    assert task_list.total == count
+    assert task_list.clamp_page(0) == 1
+    assert task_list.clamp_page(task_list.total_pages + 5) == task_list.total_pages
@@ -1,3 +1,5 @@
+import itertools
+
 import pytest
 
 from tbot.task_logic import (
@@ -124,6 +126,27 @@ def test_calculate_global_status(statuses, manual, expected):
     assert calculate_global_status(statuses, manual_completed=manual) is expected
 
 
+def _reference_global_status(statuses):
+    """Эталон: последовательные проверки всех участников."""
+
+    if not statuses or all(status == PersonalStatus.NEW for status in statuses):
+        return GlobalStatus.NEW
+    if all(status in {PersonalStatus.CONFIRMED, PersonalStatus.DONE} for status in statuses):
+        return GlobalStatus.COMPLETED
+    if all(
+        status in {PersonalStatus.ON_REVIEW, PersonalStatus.CONFIRMED, PersonalStatus.DONE}
+        for status in statuses
+    ):
+        return GlobalStatus.ON_REVIEW
+    return GlobalStatus.IN_PROGRESS
+
+
+def test_calculate_global_status_matches_reference():
+    for size in range(4):
+        for statuses in itertools.product(PersonalStatus, repeat=size):
+            assert calculate_global_status(statuses) is _reference_global_status(statuses)
+
+
 @pytest.mark.parametrize(
     "author_id,responsible_id,actor_id,participant_id,expected",
     [
@@ -0,0 +1,157 @@
+"""Проверки счётчиков и индекса задач по статусам, ревизии хранилища и пересчёта статусов."""
+
+from datetime import datetime, timedelta
+
+from tbot.tasks import (
+    TaskPriority,
+    TaskStatus,
+    count_tasks_by_status,
+    create_task,
+    delete_task,
+    get_tasks_by_status,
+    get_tasks_page_by_status,
+    get_tasks_revision,
+    recalc_task_status,
+    refresh_all_tasks_statuses,
+    refresh_all_tasks_statuses_if_stale,
+    refresh_task_status,
+    set_participant_status,
+    set_task_due_date,
+    update_task_status,
+)
+
+
+def test_counts_follow_status_changes() -> None:
+    """Счётчики должны меняться вместе со статусом задачи."""
+
+    new_before = count_tasks_by_status(TaskStatus.NEW)
+    active_before = count_tasks_by_status(TaskStatus.ACTIVE)
+    total_before = count_tasks_by_status()
+
+    task = create_task("Счётчики", "", 1, TaskPriority.LOW, responsible_user_id=2)
+    assert count_tasks_by_status(TaskStatus.NEW) == new_before + 1
+    assert count_tasks_by_status() == total_before + 1
+
+    set_participant_status(task, 2, TaskStatus.ACTIVE)
+    recalc_task_status(task)
+    assert count_tasks_by_status(TaskStatus.NEW) == new_before
+    assert count_tasks_by_status(TaskStatus.ACTIVE) == active_before + 1
+
+    delete_task(task.task_id)
+    assert count_tasks_by_status(TaskStatus.ACTIVE) == active_before
+    assert count_tasks_by_status() == total_before
+
+
+def test_counts_track_overdue_transition() -> None:
+    """Просрочка задачи должна переносить её в счётчик просроченных."""
+
+    overdue_before = count_tasks_by_status(TaskStatus.OVERDUE)
+    task = create_task(
+        "Просрочка",
+        "",
+        1,
+        TaskPriority.HIGH,
+        due_date=datetime.now() + timedelta(days=1),
+    )
+
+    refresh_task_status(task, reference=datetime.now() + timedelta(days=2))
+    assert count_tasks_by_status(TaskStatus.OVERDUE) == overdue_before + 1
+
+    delete_task(task.task_id)
+    assert count_tasks_by_status(TaskStatus.OVERDUE) == overdue_before
+
+
+def test_revision_changes_on_mutations() -> None:
+    """Ревизия хранилища должна расти при создании, смене статуса и удалении."""
+
+    revision = get_tasks_revision()
+    task = create_task("Ревизия", "", 1, TaskPriority.LOW, responsible_user_id=2)
+    assert get_tasks_revision() > revision
+
+    revision = get_tasks_revision()
+    set_participant_status(task, 2, TaskStatus.ACTIVE)
+    recalc_task_status(task)
+    assert get_tasks_revision() > revision
+
+    revision = get_tasks_revision()
+    recalc_task_status(task)
+    assert get_tasks_revision() == revision
+
+    delete_task(task.task_id)
+    assert get_tasks_revision() > revision
+
+
+def test_full_refresh_is_throttled() -> None:
+    """Повторный полный пересчёт в пределах TTL должен пропускаться."""
+
+    refresh_all_tasks_statuses()
+    assert refresh_all_tasks_statuses_if_stale(max_age=60.0) is False
+    assert refresh_all_tasks_statuses_if_stale(max_age=0.0) is True
+
+
+def test_status_index_matches_scan() -> None:
+    """Выборка по индексу статусов должна совпадать с перебором и идти в порядке создания."""
+
+    first = create_task("Индекс статусов 1", "", 1, TaskPriority.LOW, responsible_user_id=2)
+    second = create_task("Индекс статусов 2", "", 1, TaskPriority.LOW, responsible_user_id=2)
+    set_participant_status(first, 2, TaskStatus.ACTIVE)
+    recalc_task_status(first)
+
+    for status in TaskStatus:
+        expected = [task for task in get_tasks_by_status() if task.status is status]
+        assert get_tasks_by_status(status) == expected
+        assert count_tasks_by_status(status) == len(expected)
+    assert first in get_tasks_by_status(TaskStatus.ACTIVE)
+    assert second not in get_tasks_by_status(TaskStatus.ACTIVE)
+
+    delete_task(first.task_id)
+    delete_task(second.task_id)
+    assert first not in get_tasks_by_status(TaskStatus.ACTIVE)
+
+
+def test_status_page_matches_full_list_slice() -> None:
+    """Страница по статусу должна совпадать со срезом полного списка."""
+
+    created = [
+        create_task(f"Страница {index}", "", 1, TaskPriority.LOW, responsible_user_id=2)
+        for index in range(7)
+    ]
+    for task in created[::2]:
+        set_participant_status(task, 2, TaskStatus.ACTIVE)
+        recalc_task_status(task)
+
+    for status in (None, TaskStatus.NEW, TaskStatus.ACTIVE):
+        full = get_tasks_by_status(status)
+        for start in (0, 2, 5, len(full)):
+            assert get_tasks_page_by_status(status, start, 3) == full[start:start + 3]
+
+    for task in created:
+        delete_task(task.task_id)
+
+
+def test_refresh_follows_due_dates() -> None:
+    """Пересчёт должен замечать наступивший срок, перенос срока и повторное открытие задачи."""
+
+    now = datetime.now()
+    task = create_task("Срок", "", 1, TaskPriority.LOW, due_date=now + timedelta(hours=1))
+
+    refresh_all_tasks_statuses(now)
+    assert task.status is TaskStatus.NEW
+
+    refresh_all_tasks_statuses(now + timedelta(hours=2))
+    assert task.status is TaskStatus.OVERDUE
+
+    set_task_due_date(task, now + timedelta(hours=3))
+    refresh_all_tasks_statuses(now + timedelta(hours=2))
+    assert task.status is TaskStatus.NEW
+
+    update_task_status(task.task_id, TaskStatus.COMPLETED)
+    refresh_all_tasks_statuses(now + timedelta(hours=4))
+    assert task.status is TaskStatus.COMPLETED
+
+    update_task_status(task.task_id, TaskStatus.NEW)
+    refresh_all_tasks_statuses(now + timedelta(hours=4))
+    assert task.status is TaskStatus.OVERDUE
+
+    delete_task(task.task_id)
+    refresh_all_tasks_statuses(now + timedelta(hours=5))
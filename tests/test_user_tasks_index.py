@@ -0,0 +1,86 @@
+"""Проверки индекса задач по участникам."""
+
+from tbot.tasks import (
+    TASKS,
+    TaskPriority,
+    create_task,
+    delete_task,
+    get_involved_tasks,
+    get_user_tasks,
+    is_user_involved,
+    rebuild_user_tasks_index,
+)
+
+
+def _scan_involved(user_id: int) -> list:
+    """Эталон: полный перебор хранилища."""
+
+    return [task for task in TASKS.values() if is_user_involved(task, user_id)]
+
+
+def test_index_matches_full_scan() -> None:
+    """Индекс должен возвращать те же задачи и в том же порядке, что и перебор."""
+
+    first = create_task("Индекс 1", "", 501, TaskPriority.LOW, responsible_user_id=502, workgroup=[503])
+    second = create_task("Индекс 2", "", 502, TaskPriority.LOW, responsible_user_id=503)
+
+    for user_id in (501, 502, 503, 504):
+        assert get_involved_tasks(user_id) == _scan_involved(user_id)
+    assert get_involved_tasks(503) == [first, second]
+
+    delete_task(first.task_id)
+    assert get_involved_tasks(501) == []
+    assert get_involved_tasks(503) == [second]
+
+    delete_task(second.task_id)
+    assert get_involved_tasks(502) == []
+
+
+def test_rebuild_restores_index() -> None:
+    """Перестроение индекса должно давать тот же результат, что и инкрементальное обновление."""
+
+    task = create_task("Перестроение", "", 601, TaskPriority.MEDIUM, workgroup=[602, 603])
+    expected = {user_id: get_involved_tasks(user_id) for user_id in (601, 602, 603)}
+
+    rebuild_user_tasks_index()
+    assert {user_id: get_involved_tasks(user_id) for user_id in (601, 602, 603)} == expected
+
+    delete_task(task.task_id)
+
+
+def test_participant_sets_follow_task_composition() -> None:
+    """Множества участников должны совпадать с полями задачи."""
+
+    task = create_task("Состав", "", 701, TaskPriority.LOW, responsible_user_id=702, workgroup=[703, 701])
+    assert task.participant_ids == {701, 702, 703}
+    assert task.workgroup_ids == {701, 703}
+    assert is_user_involved(task, 703)
+    assert not is_user_involved(task, 704)
+
+    without_responsible = create_task("Без ответственного", "", 705, TaskPriority.LOW)
+    assert without_responsible.participant_ids == {705}
+
+    delete_task(task.task_id)
+    delete_task(without_responsible.task_id)
+
+
+def test_user_tasks_merge_public_and_private() -> None:
+    """Пользователь видит общие задачи и свои личные в порядке создания."""
+
+    public = create_task("Общая", "", 801, TaskPriority.LOW)
+    private = create_task("Личная", "", 802, TaskPriority.LOW, workgroup=[803], is_private=True)
+    foreign = create_task("Чужая личная", "", 804, TaskPriority.LOW, is_private=True)
+
+    for user_id in (801, 802, 803, 805):
+        expected = [
+            task
+            for task in TASKS.values()
+            if not task.is_private or is_user_involved(task, user_id)
+        ]
+        assert get_user_tasks(user_id) == expected
+    assert private in get_user_tasks(803)
+    assert foreign not in get_user_tasks(803)
+
+    for task in (public, private, foreign):
+        delete_task(task.task_id)
+    assert public not in get_user_tasks(801)